@@ -19,14 +19,17 @@ from open_fdd.analytics.runtime_intervals import (
 )
 from open_fdd.analytics.site_model import equipment_type_from_id, resolve_equipment_type
 from open_fdd.analytics.dump import DUMP_FILENAMES, dump_tables
+from open_fdd.analytics.tiles import TilePyramid, build_tile_pyramids
 from open_fdd.analytics.vav_health import vav_health_matrix, vav_health_summary
 
 __all__ = [
     "OccupancySchedule",
+    "TilePyramid",
     "UNLIMITED_GAP_SECONDS",
     "aggregate_load_satisfaction",
     "apply_schedule_occ_mode",
     "build_meter_monthly_table",
+    "build_tile_pyramids",
     "collect_meter_frames",
     "dataset_time_span",
     "day_type_series",
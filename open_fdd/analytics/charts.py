@@ -1,7 +1,9 @@
 """Plotly charts — multi-axis single figure, rainbow series colors, fault swim lane.
 
 Large historian traces are **downsampled for rendering only** (default ~5k points via
-``VIBE19_MAX_PLOT_POINTS``). Full-resolution data stays in rule results / exports.
+``VIBE19_MAX_PLOT_POINTS``), keeping each pixel bucket's first / min / max / last
+sample (M4; ``VIBE19_PLOT_DOWNSAMPLE=lttb`` or ``stride`` to change). Full-resolution
+data stays in rule results / exports.
 """
 
 from __future__ import annotations
@@ -14,6 +16,8 @@ import pandas as pd
 import plotly.graph_objects as go
 
 from open_fdd.rules.base import RuleResult
+from open_fdd.rules.intervals import IntervalMask
+from open_fdd.analytics.tiles import TilePyramid, time_window
 from open_fdd.analytics.units import resolve_role_unit, unit_family
 
 
@@ -49,9 +53,11 @@ def max_plot_points() -> int:
     return max(64, n)
 
 
-def _transition_positions(mask: pd.Series | np.ndarray | None, n: int) -> list[int]:
+def _transition_positions(mask: pd.Series | np.ndarray | IntervalMask | None, n: int) -> list[int]:
     if mask is None or n < 2:
         return []
+    if isinstance(mask, IntervalMask):
+        return mask.transitions().tolist() if len(mask) == n else []
     arr = np.asarray(mask, dtype=bool).ravel()
     if arr.size != n:
         return []
@@ -60,13 +66,131 @@ def _transition_positions(mask: pd.Series | np.ndarray | None, n: int) -> list[i
     return [int(i) for i in changes.tolist()]
 
 
+def _mask_on(mask: pd.Series | IntervalMask, index: pd.Index) -> pd.Series | IntervalMask:
+    """Align a fault mask to ``index``; interval masks on the same index stay compact."""
+    if isinstance(mask, IntervalMask):
+        if mask.index is index or mask.index.equals(index):
+            return mask
+        mask = mask.to_series()
+    return mask.reindex(index).fillna(False)
+
+
+PLOT_DOWNSAMPLE_METHODS: tuple[str, ...] = ("m4", "lttb", "stride")
+DEFAULT_PLOT_DOWNSAMPLE = "m4"
+
+
+def plot_downsample_method(method: str | None = None) -> str:
+    """Explicit ``method``, else env ``VIBE19_PLOT_DOWNSAMPLE``, else ``"m4"``.
+
+    ``m4`` keeps first / min / max / last of every pixel bucket, ``lttb`` keeps the
+    point of largest triangle area per bucket, ``stride`` is an even grid.
+    """
+    if method is None:
+        raw = (os.environ.get("VIBE19_PLOT_DOWNSAMPLE") or "").strip().lower()
+        return raw if raw in PLOT_DOWNSAMPLE_METHODS else DEFAULT_PLOT_DOWNSAMPLE
+    if method not in PLOT_DOWNSAMPLE_METHODS:
+        raise ValueError(f"plot downsample method must be one of {PLOT_DOWNSAMPLE_METHODS}, got {method!r}")
+    return method
+
+
+def _plot_columns(values: Any, n: int) -> list[np.ndarray]:
+    """Plotted columns as float arrays of length ``n`` (NaN where not numeric); all-NaN dropped."""
+    if values is None:
+        return []
+    if isinstance(values, pd.DataFrame):
+        cols = [values.iloc[:, i] for i in range(values.shape[1])]
+    elif np.ndim(values) == 1:
+        cols = [values]
+    elif isinstance(values, np.ndarray):
+        cols = list(values.T)
+    else:
+        cols = list(values)
+    arrs = []
+    for col in cols:
+        col = pd.Series(col)
+        if col.dtype != np.float64:
+            col = pd.to_numeric(col, errors="coerce")
+        arr = col.to_numpy(dtype=float, na_value=np.nan)
+        if arr.size == n and not np.isnan(arr).all():
+            arrs.append(arr)
+    return arrs
+
+
+def _stride_positions(n: int, count: int) -> np.ndarray:
+    return np.unique(np.rint(np.linspace(0, n - 1, num=max(2, count))).astype(np.int64))
+
+
+def _bucket_args(col: np.ndarray, width: int, pick) -> np.ndarray:
+    """``pick`` (argmin / argmax) offset within each ``width``-wide bucket of ``col``."""
+    full = len(col) // width
+    args = pick(col[: full * width].reshape(full, width), axis=1)
+    if full * width < len(col):
+        args = np.append(args, pick(col[full * width :]))
+    return args
+
+
+def _m4_positions(columns: list[np.ndarray], buckets: int) -> np.ndarray:
+    """First, last and per-column argmin / argmax of ``buckets`` equal-width buckets."""
+    n = len(columns[0])
+    width = -(-n // buckets)
+    starts = np.arange(0, n, width, dtype=np.int64)
+    ends = np.minimum(starts + width, n) - 1
+    picks = [starts, ends]
+    for col in columns:
+        missing = np.isnan(col)
+        has_gaps = bool(missing.any())
+        lo = np.where(missing, np.inf, col) if has_gaps else col
+        hi = np.where(missing, -np.inf, col) if has_gaps else col
+        picks.append(starts + _bucket_args(lo, width, np.argmin))
+        picks.append(starts + _bucket_args(hi, width, np.argmax))
+    return np.unique(np.concatenate(picks))
+
+
+def _lttb_positions(columns: list[np.ndarray], count: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets over ``count - 2`` buckets (x = position).
+
+    Columns are scaled to [0, 1] and gaps interpolated; with several columns the
+    triangle area is summed across them. The pick per bucket depends on the
+    previous pick, so buckets are walked in order; each bucket is one array op.
+    """
+    n = len(columns[0])
+    y = pd.DataFrame(np.column_stack(columns)).interpolate(limit_direction="both").fillna(0.0).to_numpy()
+    span = y.max(axis=0) - y.min(axis=0)
+    y = (y - y.min(axis=0)) / np.where(span > 0, span, 1.0)
+    edges = np.linspace(1, n - 1, num=count - 1).astype(np.int64)
+    sizes = np.diff(edges)
+    avg_x = edges[:-1] + (sizes - 1) / 2.0
+    avg_y = np.add.reduceat(y[: edges[-1]], edges[:-1], axis=0) / sizes[:, None]
+    # Each bucket looks ahead to the next bucket's mean; the last looks at the last point.
+    next_x = np.append(avg_x[1:], n - 1)
+    next_y = np.vstack([avg_y[1:], y[-1:]])
+    out = np.empty(count, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(count - 2):
+        lo, hi = edges[i], edges[i + 1]
+        bx = np.arange(lo, hi) - a
+        by = y[lo:hi] - y[a]
+        area = np.abs((a - next_x[i]) * by + bx[:, None] * (next_y[i] - y[a])).sum(axis=1)
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+
 def select_plot_positions(
     n: int,
     max_points: int | None = None,
     *,
     prefer: Iterable[int] | None = None,
+    values: Any = None,
+    method: str | None = None,
 ) -> np.ndarray:
-    """Deterministic iloc positions: always first/last; prefer fault edges; fill evenly.
+    """Deterministic iloc positions: always first/last; prefer fault edges; then fill.
+
+    With ``values`` (a Series, frame, array or list of columns aligned to ``n``)
+    the fill keeps each pixel bucket's extremes (``m4``) or shape (``lttb``), so
+    spikes and flatlines between grid points survive; without it, or with
+    ``method="stride"``, the fill is an even grid. Never more than ``max_points``.
 
     Used only for Plotly payloads — never for rule math.
     """
@@ -75,39 +199,26 @@ def select_plot_positions(
     cap = int(max_points if max_points is not None else max_plot_points())
     if n <= cap:
         return np.arange(n, dtype=int)
-
-    chosen: set[int] = {0, n - 1}
-    if prefer:
-        for i in prefer:
-            ii = int(i)
-            if 0 <= ii < n:
-                chosen.add(ii)
-
-    # Even grid fill
-    grid = np.linspace(0, n - 1, num=cap, dtype=float)
-    for g in grid:
-        chosen.add(int(round(g)))
-
-    # If still over cap (many transitions), keep ends + evenly thinned prefer set
-    if len(chosen) > cap:
-        prefs = sorted(i for i in chosen if i not in (0, n - 1))
-        keep_pref = max(0, cap - 2)
-        if keep_pref == 0:
-            chosen = {0, n - 1}
-        else:
-            step = max(1, len(prefs) // keep_pref)
-            thinned = prefs[::step][:keep_pref]
-            chosen = {0, n - 1, *thinned}
-
-    # Top up with linspace if under cap
-    while len(chosen) < cap:
-        for g in np.linspace(0, n - 1, num=cap * 2, dtype=float):
-            chosen.add(int(round(g)))
-            if len(chosen) >= cap:
-                break
-        break
-
-    return np.array(sorted(chosen)[:cap], dtype=int)
+    method = plot_downsample_method(method)
+
+    # Fault edges first; when there are too many, keep an even thinning of them.
+    pref = np.unique(np.fromiter((int(i) for i in prefer or ()), dtype=np.int64))
+    pref = pref[(pref > 0) & (pref < n - 1)]
+    keep_pref = max(0, cap - 2)
+    if len(pref) > keep_pref:
+        pref = pref[:: max(1, len(pref) // keep_pref)][:keep_pref] if keep_pref else pref[:0]
+    budget = cap - len(pref)
+
+    columns = _plot_columns(values, n) if method != "stride" else []
+    if not columns:
+        fill = _stride_positions(n, budget)
+    elif method == "m4" and budget >= 2 + 2 * len(columns):
+        fill = _m4_positions(columns, budget // (2 + 2 * len(columns)))
+    elif method == "lttb" and budget >= 3:
+        fill = _lttb_positions(columns, budget)
+    else:
+        fill = _stride_positions(n, budget)
+    return np.union1d(pref, fill).astype(int)[:cap]
 
 
 def downsample_series_for_plot(
@@ -115,9 +226,10 @@ def downsample_series_for_plot(
     *,
     max_points: int | None = None,
     prefer_index: pd.Index | None = None,
-    fault_mask: pd.Series | None = None,
+    fault_mask: pd.Series | IntervalMask | None = None,
+    method: str | None = None,
 ) -> pd.Series:
-    """Return a shorter series for Plotly; preserves first/last and optional fault edges."""
+    """Return a shorter series for Plotly; keeps first/last, fault edges and bucket extremes."""
     if s is None or len(s) == 0:
         return s
     n = len(s)
@@ -127,7 +239,7 @@ def downsample_series_for_plot(
 
     prefer: list[int] = []
     if fault_mask is not None:
-        prefer.extend(_transition_positions(fault_mask.reindex(s.index).fillna(False), n))
+        prefer.extend(_transition_positions(_mask_on(fault_mask, s.index), n))
     if prefer_index is not None and len(prefer_index):
         # map preferred timestamps to positions when possible
         try:
@@ -136,7 +248,7 @@ def downsample_series_for_plot(
         except Exception:
             pass
 
-    iloc = select_plot_positions(n, cap, prefer=prefer)
+    iloc = select_plot_positions(n, cap, prefer=prefer, values=s, method=method)
     return s.iloc[iloc]
 
 
@@ -144,21 +256,71 @@ def downsample_frame_index(
     index: pd.Index,
     *,
     max_points: int | None = None,
-    fault_mask: pd.Series | None = None,
+    fault_mask: pd.Series | IntervalMask | None = None,
+    values: Any = None,
+    method: str | None = None,
 ) -> pd.Index:
-    """Shared index downsample for multi-trace alignment on one chart."""
+    """Shared index downsample for multi-trace alignment on one chart.
+
+    Pass the plotted columns as ``values`` to keep every trace's bucket extremes;
+    buckets get wider as columns are added so the index stays within the cap.
+    """
     n = len(index)
     cap = int(max_points if max_points is not None else max_plot_points())
     if n <= cap:
         return index
     prefer = _transition_positions(
-        fault_mask.reindex(index).fillna(False) if fault_mask is not None else None,
+        _mask_on(fault_mask, index) if fault_mask is not None else None,
         n,
     )
-    iloc = select_plot_positions(n, cap, prefer=prefer)
+    iloc = select_plot_positions(n, cap, prefer=prefer, values=values, method=method)
     return index[iloc]
 
 
+def _as_of(s: pd.Series, index: pd.Index) -> pd.Series:
+    """``s`` sampled at ``index``: the last value at or before each timestamp (NaN before the first)."""
+    if (
+        s.empty
+        or not isinstance(s.index, pd.DatetimeIndex)
+        or not isinstance(index, pd.DatetimeIndex)
+        or (s.index.tz is None) != (index.tz is None)
+    ):
+        return s.reindex(index)
+    if not s.index.is_monotonic_increasing:
+        s = s.sort_index(kind="stable")
+    pos = s.index.searchsorted(index, side="right") - 1
+    out = pd.Series(s.to_numpy()[np.maximum(pos, 0)], index=index, name=s.name)
+    return out.where(pos >= 0) if (pos < 0).any() else out
+
+
+def _window_series(
+    index: pd.Index,
+    series: dict[str, pd.Series],
+    *,
+    cap: int,
+    tiles: TilePyramid | None = None,
+    time_range: tuple[Any, Any] | None = None,
+) -> tuple[pd.Index, dict[str, pd.Series]]:
+    """Shared index and aligned series for one chart window.
+
+    With ``tiles``, columns the pyramid holds come from the level matching the
+    window and ``cap`` (raw rows when zoomed in, tile min/max otherwise); other
+    series take their last value at or before each of the window's timestamps
+    (envelope timestamps rarely hit a raw sample exactly). Without it ``index``
+    is sliced to ``time_range``. Callers still downsample the result.
+    """
+    start, end = time_range or (None, None)
+    if tiles is not None:
+        frame = tiles.window(start, end, max_points=cap, columns=list(series))
+        return frame.index, {
+            name: frame[name] if name in frame.columns else _as_of(s, frame.index) for name, s in series.items()
+        }
+    if time_range is not None and isinstance(index, pd.DatetimeIndex):
+        ordered = index if index.is_monotonic_increasing else index.sort_values()
+        index = ordered[time_window(ordered, start, end)]
+    return index, {name: s if s.index is index else s.reindex(index) for name, s in series.items()}
+
+
 PLOTLY_DOWNLOAD_CONFIG: dict[str, Any] = {
     "displaylogo": False,
     "toImageButtonOptions": {
@@ -269,11 +431,16 @@ def rule_result_chart(
     required_roles: list[str] | None = None,
     units_map: dict[str, str] | None = None,
     max_points: int | None = None,
+    tiles: TilePyramid | None = None,
+    time_range: tuple[Any, Any] | None = None,
 ) -> go.Figure | None:
     """One figure: each unit family on its own y-axis domain; confirmed fault as shaded swim lane.
 
     Series colors walk a rainbow palette (global index) so traces stay visually distinct.
-    Long series are downsampled for Plotly only (see ``max_plot_points``).
+    Long series are downsampled for Plotly only (see ``max_plot_points``). Pass the
+    equipment's ``tiles`` (``build_tile_pyramids``) and a ``time_range`` to zoom / pan
+    without re-scanning the full-resolution frame; the fault lane then shows any
+    fault within each tile.
     """
     if result.confirmed_fault is None and result.status in {
         "SKIPPED_MISSING_ROLES",
@@ -289,15 +456,27 @@ def rule_result_chart(
         return None
 
     cap = int(max_points if max_points is not None else max_plot_points())
-    plot_index = downsample_frame_index(df.index, max_points=cap, fault_mask=fault)
+    window, on_index = _window_series(df.index, series, cap=cap, tiles=tiles, time_range=time_range)
+    fault_on = None
+    if fault is not None:
+        if tiles is not None:
+            fault_on = tiles.window_mask(result.fault_mask(), *(time_range or (None, None)), max_points=cap)
+        else:
+            fault_on = fault.reindex(df.index).fillna(False).astype(bool)
+    plot_index = downsample_frame_index(
+        window,
+        max_points=cap,
+        fault_mask=fault_on if tiles is not None else result.fault_mask(),
+        values=list(on_index.values()),
+    )
 
     groups: dict[str, list[tuple[str, pd.Series, str]]] = {}
-    for name, s in series.items():
+    for name, s in on_index.items():
         unit = _series_unit(name, units_map)
         fam = unit_family(unit) if unit else f"other:{name}"
         if unit in {"bool", "0/1"}:
             fam = "bool"
-        aligned = s.reindex(df.index).loc[plot_index]
+        aligned = s.loc[plot_index]
         groups.setdefault(fam, []).append((name, aligned, unit or fam))
 
     order_pref = ["temp_F", "pct", "static", "flow", "bool"]
@@ -375,7 +554,7 @@ def rule_result_chart(
             showgrid=True,
             anchor="x",
         )
-        mask = fault.reindex(df.index).fillna(False).astype(bool).loc[plot_index]
+        mask = fault_on.loc[plot_index]
         fig.add_trace(
             go.Scatter(
                 x=mask.index,
@@ -410,11 +589,15 @@ def multi_equipment_timeseries(
     outlier_ids: set[str] | None = None,
     max_points: int | None = None,
     status_map: dict[str, pd.Series] | None = None,
+    tiles: dict[str, TilePyramid] | None = None,
+    time_range: tuple[Any, Any] | None = None,
 ) -> go.Figure | None:
     """Overlay many equipment series; outliers get a thicker dashed red-ish stroke.
 
     ``status_map`` (equipment_id → 0/1 motor/fan status) adds dotted step traces on a
     secondary right-hand axis so run status reads alongside the primary series.
+    ``tiles`` (equipment_id → ``TilePyramid``) serves any series whose name is a
+    pyramid column from the level matching ``time_range``.
     """
     if not series_map:
         return None
@@ -423,8 +606,16 @@ def multi_equipment_timeseries(
     color_i = 0
     cap = int(max_points if max_points is not None else max_plot_points())
     colors_by_eq: dict[str, str] = {}
+
+    def window(eq_id: str, s: pd.Series) -> pd.Series:
+        pyramid = (tiles or {}).get(eq_id)
+        if pyramid is not None and s.name not in pyramid.columns:
+            pyramid = None
+        _index, out = _window_series(s.index, {s.name: s}, cap=cap, tiles=pyramid, time_range=time_range)
+        return downsample_series_for_plot(pd.to_numeric(out[s.name], errors="coerce"), max_points=cap)
+
     for eq_id, s in sorted(series_map.items()):
-        num = downsample_series_for_plot(pd.to_numeric(s, errors="coerce"), max_points=cap)
+        num = window(eq_id, s)
         is_out = eq_id in outliers
         color = "#dc2626" if is_out else RAINBOW_PALETTE[color_i % len(RAINBOW_PALETTE)]
         colors_by_eq[eq_id] = color
@@ -444,7 +635,7 @@ def multi_equipment_timeseries(
     for eq_id, s in sorted((status_map or {}).items()):
         if eq_id not in colors_by_eq:
             continue
-        num = downsample_series_for_plot(pd.to_numeric(s, errors="coerce"), max_points=cap)
+        num = window(eq_id, s)
         if not num.notna().any():
             continue
         has_status = True
@@ -1047,7 +1238,7 @@ def sensor_fault_chart(
     if series is None or len(series) == 0 or series.notna().sum() == 0:
         return None
     num = pd.to_numeric(series, errors="coerce")
-    plot_index = downsample_frame_index(num.index, max_points=max_plot_points())
+    plot_index = downsample_frame_index(num.index, max_points=max_plot_points(), values=num)
     y = num.reindex(plot_index)
     fig = go.Figure()
     fig.add_trace(
@@ -1140,7 +1331,7 @@ def bas_vs_web_oat_overlay(
         break
     if bas_s is None or web_s is None:
         return None
-    idx = downsample_frame_index(bas_s.index, max_points=max_plot_points())
+    idx = downsample_frame_index(bas_s.index, max_points=max_plot_points(), values=[bas_s, web_s])
     bas_p = bas_s.reindex(idx)
     web_p = web_s.reindex(idx)
     diff = (bas_p - web_p).abs()
@@ -1249,11 +1440,14 @@ def equipment_inspection_chart(
     columns: list[str] | None = None,
     max_height: int = 4000,
     row_height: int = 160,
+    tiles: TilePyramid | None = None,
+    time_range: tuple[Any, Any] | None = None,
 ) -> go.Figure | None:
     """Tall stacked Plotly line chart of all plottable columns in a raw equipment CSV.
 
     Keeps numeric / boolean columns only. One subplot row per column, shared x-axis.
-    Downsamples for rendering via :func:`downsample_frame_index`.
+    Downsamples for rendering via :func:`downsample_frame_index`; with ``tiles`` the
+    ``time_range`` is served from the matching pyramid level.
     """
     from plotly.subplots import make_subplots
 
@@ -1279,7 +1473,11 @@ def equipment_inspection_chart(
     if not plot_cols:
         return None
 
-    idx = downsample_frame_index(df.index, max_points=max_plot_points())
+    cap = max_plot_points()
+    window, on_window = _window_series(
+        df.index, {c: df[c] for c in plot_cols}, cap=cap, tiles=tiles, time_range=time_range
+    )
+    idx = downsample_frame_index(window, max_points=cap, values=list(on_window.values()))
     n = len(plot_cols)
     height = min(max_height, max(700, int(row_height) * n + 80))
     titles = [str(c) for c in plot_cols]
@@ -1293,10 +1491,10 @@ def equipment_inspection_chart(
     for i, col in enumerate(plot_cols, start=1):
         raw = df[col]
         if pd.api.types.is_bool_dtype(raw):
-            y = raw.astype(float).reindex(idx)
+            y = on_window[col].astype(float).reindex(idx)
             step = True
         else:
-            y = pd.to_numeric(raw, errors="coerce").reindex(idx)
+            y = pd.to_numeric(on_window[col], errors="coerce").reindex(idx)
             step = _is_status_like(raw)
         color = RAINBOW_PALETTE[(i - 1) % len(RAINBOW_PALETTE)]
         fig.add_trace(
@@ -11,6 +11,7 @@ import pandas as pd
 from open_fdd.analytics.role_map import apply_role_map
 from open_fdd.analytics.runtime_intervals import hours_under_mask, interval_durations
 from open_fdd.analytics.site_model import normalize_equipment_type, resolve_equipment_type
+from open_fdd.rules.intervals import IntervalMask
 
 # Plant groups for weekly motor charts.
 PLANT_AIR = "air"
@@ -1716,6 +1717,8 @@ def sensor_fault_summary(
                         continue  # only sensors that actually fired
                     num = pd.to_numeric(series_map.get(role, pd.Series(dtype=float)), errors="coerce")
                     mask = role_masks.get(role)
+                    if isinstance(mask, IntervalMask):  # compact results
+                        mask = mask.to_series()
                     if isinstance(mask, pd.Series):
                         m = mask.reindex(num.index).fillna(0).astype(bool) if len(num) else mask.fillna(False).astype(bool)
                     else:
@@ -3,64 +3,109 @@
 Classifies each timestamp as ``weekday``, ``weekend``, or ``holiday``.
 Holidays use pandas' built-in US Federal holiday calendar and take
 precedence over weekday/weekend.
+
+Classification runs on int64 local day numbers: the holiday set is memoized
+per year range and codes (int8 into ``DAY_TYPES``) are cached per index
+object, so equipment sharing a site index classify it once.
 """
 
 from __future__ import annotations
 
+import threading
+import weakref
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 from pandas.tseries.holiday import USFederalHolidayCalendar
 
 DAY_TYPES = ("weekday", "weekend", "holiday")
+WEEKDAY, WEEKEND, HOLIDAY = range(len(DAY_TYPES))
 
+_DAY_NS = 86_400 * 10**9
+_CODES_LOCK = threading.Lock()
+_CODES: dict[int, tuple[weakref.ref, np.ndarray]] = {}
 
-def _holiday_dates(index: pd.DatetimeIndex) -> set[pd.Timestamp]:
-    """Return normalized (date-only) holiday timestamps covering the index span."""
-    if not isinstance(index, pd.DatetimeIndex) or len(index) == 0:
-        return set()
-    # Work in the index's own timezone when present; calendar is date-based.
-    start = index.min()
-    end = index.max()
-    # Expand one day on each side so midnight-edge samples are covered.
-    start_naive = pd.Timestamp(start).tz_localize(None) if getattr(start, "tz", None) else pd.Timestamp(start)
-    end_naive = pd.Timestamp(end).tz_localize(None) if getattr(end, "tz", None) else pd.Timestamp(end)
+
+@lru_cache(maxsize=32)
+def holiday_days(first_year: int, last_year: int) -> np.ndarray:
+    """Sorted US Federal holidays (observed) in ``[first_year, last_year]`` as days since 1970-01-01."""
     cal = USFederalHolidayCalendar()
-    holidays = cal.holidays(start=start_naive.normalize() - pd.Timedelta(days=1), end=end_naive.normalize() + pd.Timedelta(days=1))
-    return {pd.Timestamp(h).normalize() for h in holidays}
+    holidays = cal.holidays(start=f"{first_year}-01-01", end=f"{last_year}-12-31")
+    days = holidays.as_unit("ns").asi8 // _DAY_NS
+    days.flags.writeable = False
+    return days
+
+
+def _local_days(index: pd.DatetimeIndex) -> tuple[np.ndarray, np.ndarray]:
+    """``(day numbers, valid)``: wall-clock dates in the index's own timezone."""
+    local = index.tz_localize(None) if index.tz is not None else index
+    ticks = local.as_unit("ns").asi8
+    valid = ticks != np.iinfo(np.int64).min  # NaT
+    return np.floor_divide(ticks, _DAY_NS), valid
+
+
+def _compute_codes(index: pd.DatetimeIndex) -> np.ndarray:
+    days, valid = _local_days(index)
+    codes = np.full(len(days), WEEKDAY, dtype=np.int8)
+    if not valid.any():
+        return codes
+    # 1970-01-01 was a Thursday (dayofweek 3, Mon=0).
+    dow = (days + 3) % 7
+    codes[valid & (dow >= 5)] = WEEKEND
+    ok = days[valid]
+    first, last = (pd.Timestamp(int(d) * _DAY_NS).year for d in (ok.min(), ok.max()))
+    hol = holiday_days(first, last)
+    codes[valid & np.isin(days, hol)] = HOLIDAY
+    return codes
+
+
+def _forget(key: int) -> None:
+    with _CODES_LOCK:
+        _CODES.pop(key, None)
+
+
+def day_type_codes(index: pd.DatetimeIndex) -> np.ndarray:
+    """Read-only int8 codes into ``DAY_TYPES`` aligned to ``index`` (cached per index object)."""
+    if not isinstance(index, pd.DatetimeIndex) or len(index) == 0:
+        return np.zeros(0, dtype=np.int8)
+    key = id(index)
+    with _CODES_LOCK:
+        hit = _CODES.get(key)
+        if hit is not None and hit[0]() is index:
+            return hit[1]
+    codes = _compute_codes(index)
+    codes.flags.writeable = False
+    with _CODES_LOCK:
+        _CODES[key] = (weakref.ref(index, lambda _ref, key=key: _forget(key)), codes)
+    return codes
 
 
 def day_type_series(index: pd.DatetimeIndex) -> pd.Series:
-    """Return a Series of day_type labels aligned to ``index``.
+    """Return a categorical Series of day_type labels aligned to ``index``.
 
-    Holiday takes precedence over weekday/weekend. Weekends are Saturday
-    and Sunday (dayofweek 5 and 6).
+    Categories are ``DAY_TYPES`` with int8 codes (``day_type_codes``). Holiday
+    takes precedence over weekday/weekend. Weekends are Saturday and Sunday
+    (dayofweek 5 and 6).
     """
     if not isinstance(index, pd.DatetimeIndex) or len(index) == 0:
         return pd.Series(dtype=object)
-    holiday_dates = _holiday_dates(index)
-    # Normalize dates in the same tz as the index for set membership.
-    dates = pd.Series(index.normalize(), index=index)
-    # Compare date-only (drop tz for membership against calendar dates).
-    date_naive = dates.map(
-        lambda t: pd.Timestamp(t).tz_localize(None).normalize()
-        if getattr(t, "tz", None) is not None
-        else pd.Timestamp(t).normalize()
-    )
-    is_holiday = date_naive.isin(holiday_dates)
-    is_weekend = pd.Series(index.dayofweek >= 5, index=index)
-    out = pd.Series("weekday", index=index, dtype=object)
-    out = out.where(~is_weekend, "weekend")
-    out = out.where(~is_holiday, "holiday")
-    return out
+    labels = pd.Categorical.from_codes(day_type_codes(index), categories=list(DAY_TYPES))
+    return pd.Series(labels, index=index)
 
 
 def day_type_masks(index: pd.DatetimeIndex) -> dict[str, pd.Series]:
     """Return ``{day_type: boolean mask}`` for weekday / weekend / holiday."""
-    labels = day_type_series(index)
-    return {dt: labels.eq(dt) for dt in DAY_TYPES}
+    if not isinstance(index, pd.DatetimeIndex):
+        return {dt: pd.Series(dtype=bool) for dt in DAY_TYPES}
+    codes = day_type_codes(index)
+    return {dt: pd.Series(codes == i, index=index) for i, dt in enumerate(DAY_TYPES)}
 
 
 __all__ = [
     "DAY_TYPES",
-    "day_type_series",
+    "day_type_codes",
     "day_type_masks",
+    "day_type_series",
+    "holiday_days",
 ]
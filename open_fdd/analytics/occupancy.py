@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from open_fdd.storage import overlay_frame
+
 DAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+MINUTES_PER_DAY = 24 * 60
 DAY_LABELS = {
     "mon": "Monday",
     "tue": "Tuesday",
@@ -65,6 +70,14 @@ class OccupancySchedule:
             )
         return cls(days=days, timezone=str(data.get("timezone") or "America/Chicago"))
 
+    def minute_table(self) -> np.ndarray:
+        """Read-only ``(7, 1440)`` bool table: occupied per (weekday Mon=0, minute of day)."""
+        key = tuple(
+            (day.occupied, str(day.start), str(day.end)) if day is not None else None
+            for day in (self.days.get(d) for d in DAYS)
+        )
+        return _compile_week(key)
+
 
 def _parse_hhmm(text: str) -> tuple[int, int]:
     parts = str(text).strip().split(":")
@@ -73,8 +86,31 @@ def _parse_hhmm(text: str) -> tuple[int, int]:
     return h, m
 
 
+@lru_cache(maxsize=64)
+def _compile_week(key: tuple[tuple[bool, str, str] | None, ...]) -> np.ndarray:
+    """Minute-of-week table for ``OccupancySchedule.minute_table`` (keyed by day settings)."""
+    table = np.zeros((len(DAYS), MINUTES_PER_DAY), dtype=bool)
+    minutes = np.arange(MINUTES_PER_DAY)
+    for i, row in enumerate(key):
+        if row is None or not row[0]:
+            continue
+        sh, sm = _parse_hhmm(row[1])
+        eh, em = _parse_hhmm(row[2])
+        start_m, end_m = sh * 60 + sm, eh * 60 + em
+        if end_m <= start_m:
+            # overnight window: the same weekday's late evening and early morning
+            table[i] = (minutes >= start_m) | (minutes < end_m)
+        else:
+            table[i] = (minutes >= start_m) & (minutes < end_m)
+    table.flags.writeable = False
+    return table
+
+
 def occupied_mask(index: pd.DatetimeIndex, schedule: OccupancySchedule) -> pd.Series:
-    """True when timestamp falls inside the weekly occupied window."""
+    """True when timestamp falls inside the weekly occupied window.
+
+    One lookup into ``schedule.minute_table()`` at ``weekday * 1440 + minute``.
+    """
     if not isinstance(index, pd.DatetimeIndex) or len(index) == 0:
         return pd.Series(dtype=bool)
     # Align to schedule timezone for weekday/time checks
@@ -82,23 +118,10 @@ def occupied_mask(index: pd.DatetimeIndex, schedule: OccupancySchedule) -> pd.Se
         local = index.tz_convert(schedule.timezone) if index.tz is not None else index.tz_localize("UTC").tz_convert(schedule.timezone)
     except Exception:
         local = index
-    day_keys = local.dayofweek.map(lambda i: DAYS[int(i)])  # Mon=0
-    minutes = local.hour * 60 + local.minute
-    out = []
-    for dk, mins in zip(day_keys, minutes):
-        day = schedule.days.get(str(dk), DaySchedule(occupied=False))
-        if not day.occupied:
-            out.append(False)
-            continue
-        sh, sm = _parse_hhmm(day.start)
-        eh, em = _parse_hhmm(day.end)
-        start_m, end_m = sh * 60 + sm, eh * 60 + em
-        if end_m <= start_m:
-            # overnight window
-            out.append(mins >= start_m or mins < end_m)
-        else:
-            out.append(start_m <= mins < end_m)
-    return pd.Series(out, index=index, dtype=bool)
+    ok = ~local.isna()
+    slot = np.zeros(len(local), dtype=np.int64)
+    slot[ok] = (local.dayofweek * MINUTES_PER_DAY + local.hour * 60 + local.minute)[ok]  # Mon=0
+    return pd.Series(schedule.minute_table().ravel()[slot] & ok, index=index, dtype=bool)
 
 
 def occupied_hours_per_week(schedule: OccupancySchedule) -> float:
@@ -120,12 +143,14 @@ def occupied_hours_per_week(schedule: OccupancySchedule) -> float:
 
 
 def apply_schedule_occ_mode(df: pd.DataFrame, schedule: OccupancySchedule, *, overwrite: bool = False) -> pd.DataFrame:
-    """Attach occ_mode from weekly calendar when missing (or overwrite=True)."""
-    out = df.copy()
-    if "occupied" in out.columns and out["occupied"].notna().any() and not overwrite:
-        return out
-    if not isinstance(out.index, pd.DatetimeIndex):
-        return out
-    mask = occupied_mask(out.index, schedule)
-    out["occupied"] = mask.map(lambda x: "occupied" if x else "unoccupied")
-    return out
+    """Attach occ_mode from weekly calendar when missing (or overwrite=True).
+
+    Always returns a new frame; writing into it never changes ``df`` (see ``overlay_frame``).
+    """
+    if "occupied" in df.columns and df["occupied"].notna().any() and not overwrite:
+        return overlay_frame(df)
+    if not isinstance(df.index, pd.DatetimeIndex):
+        return overlay_frame(df)
+    mask = occupied_mask(df.index, schedule).to_numpy()
+    labels = pd.Series(np.where(mask, "occupied", "unoccupied"), index=df.index)
+    return overlay_frame(df, {"occupied": labels})
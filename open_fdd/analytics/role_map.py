@@ -17,6 +17,7 @@ from open_fdd.analytics.mapping_wizard import (
     sites_from_yaml,
     wrap_flat_role_map,
 )
+from open_fdd.storage import overlay_frame
 
 ROLE_ALIASES = {
     "outside_air_temp": "outside-air-temp",
@@ -290,15 +291,18 @@ def suggest_roles(df: pd.DataFrame) -> dict[str, str]:
 
 def apply_role_map(df: pd.DataFrame, equipment_id: str, role_map: dict[str, dict[str, str]]) -> pd.DataFrame:
     eq_map = role_map.get(equipment_id, {})
-    out = df.copy()
     # Meta keys are equipment links / notes — not timeseries columns
     skip = {"chw_pump_equipment", "notes", "equipment_type", "plant_group"}
+    roles: dict[str, pd.Series] = {}
     for role, col in eq_map.items():
         if role in skip or not col or not isinstance(col, str):
             continue
-        if col in out.columns:
-            out[role] = pd.to_numeric(out[col], errors="coerce")
-    return out
+        if col in roles:
+            roles[role] = roles[col]
+        elif col in df.columns:
+            roles[role] = pd.to_numeric(df[col], errors="coerce")
+    # Role columns overlay the raw frame; unmapped columns are shared, not copied.
+    return overlay_frame(df, roles)
 
 
 def resolve_role(df: pd.DataFrame, equipment_id: str, role_map: dict, role: str) -> pd.Series | None:
@@ -0,0 +1,228 @@
+"""Multi-resolution min / max / mean tiles for interactive time-series charts.
+
+A year of 1-minute telemetry is ~525k rows per column, and re-scanning it on
+every zoom or pan is what makes long-range charts slow. ``build_tile_pyramid``
+scans an equipment frame once into fixed-width tiles (default 15 min → 1 h →
+1 day), each coarser level aggregated from the level below. The raw frame is
+scanned only for the first level. ``TilePyramid.window`` answers a time range
+and point budget from the finest level that fits. A short window gets the raw
+rows themselves; a long one gets each tile's min and max (the envelope a
+pixel column would show). Either way only the rows inside the window are
+touched.
+
+Rendering only — rule math always runs on the full-resolution frame.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from open_fdd.rules.intervals import IntervalMask
+
+DEFAULT_TILE_FREQS: tuple[str, ...] = ("15min", "1h", "1D")
+
+# Raw rows are served (and downsampled by the chart) while the window holds at
+# most this many times the point budget; past that a tile level is used.
+RAW_WINDOW_FACTOR = 4
+
+
+def _as_timestamp(value: Any, index: pd.DatetimeIndex) -> pd.Timestamp:
+    ts = pd.Timestamp(value)
+    if index.tz is not None and ts.tz is None:
+        return ts.tz_localize(index.tz)
+    if index.tz is None and ts.tz is not None:
+        return ts.tz_convert(None)
+    return ts
+
+
+def time_window(index: pd.DatetimeIndex, start: Any = None, end: Any = None) -> slice:
+    """Positional slice of a sorted ``index`` covering ``[start, end]`` (both inclusive)."""
+    i0 = 0 if start is None else int(index.searchsorted(_as_timestamp(start, index), side="left"))
+    i1 = len(index) if end is None else int(index.searchsorted(_as_timestamp(end, index), side="right"))
+    return slice(i0, max(i0, i1))
+
+
+@dataclass(frozen=True, eq=False)
+class TileLevel:
+    """One pyramid level: per-tile count / sum / min / max of every column.
+
+    ``bounds[k]`` is the raw row where tile ``k`` starts (``bounds[-1]`` is the
+    raw length), so a tile covers raw rows ``[bounds[k], bounds[k + 1])``.
+    """
+
+    freq: str
+    count: pd.DataFrame
+    total: pd.DataFrame
+    lo: pd.DataFrame
+    hi: pd.DataFrame
+    bounds: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.count)
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        return self.count.index
+
+    @property
+    def mean(self) -> pd.DataFrame:
+        return self.total / self.count.where(self.count > 0)
+
+    def tile_span(self, rows: slice) -> slice:
+        """Tiles overlapping raw rows ``rows``."""
+        t0 = int(np.searchsorted(self.bounds[1:], rows.start, side="right"))
+        t1 = int(np.searchsorted(self.bounds[:-1], rows.stop, side="left"))
+        return slice(t0, max(t0, t1))
+
+
+def _tile_level(freq: str, count, total, lo, hi, raw_index: pd.DatetimeIndex) -> TileLevel:
+    bounds = np.append(raw_index.searchsorted(count.index, side="left"), len(raw_index))
+    return TileLevel(freq, count, total, lo, hi, bounds.astype(np.int64))
+
+
+@dataclass(frozen=True, eq=False)
+class TilePyramid:
+    """An equipment frame's plottable columns (as float64) plus its tile levels."""
+
+    raw: pd.DataFrame
+    levels: tuple[TileLevel, ...]
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self.raw.columns)
+
+    def level_for(self, rows: slice, max_points: int) -> TileLevel | None:
+        """Finest level whose envelope fits ``max_points``; None serves raw rows."""
+        if rows.stop - rows.start <= RAW_WINDOW_FACTOR * max_points or not self.levels:
+            return None
+        for level in self.levels:
+            span = level.tile_span(rows)
+            if 2 * (span.stop - span.start) <= max_points:
+                return level
+        return self.levels[-1]
+
+    def window(
+        self,
+        start: Any = None,
+        end: Any = None,
+        *,
+        max_points: int,
+        columns: Iterable[str] | None = None,
+    ) -> pd.DataFrame:
+        """Plot-ready rows for ``[start, end]``.
+
+        Raw rows when the window is short; otherwise two rows per tile, the tile
+        min at its start and the tile max at mid-tile, so the drawn line spans
+        each tile's full range. Empty tiles are NaN (gaps stay gaps).
+        """
+        cols = self.columns if columns is None else [c for c in columns if c in self.raw.columns]
+        rows = time_window(self.raw.index, start, end)
+        level = self.level_for(rows, max_points)
+        if level is None:
+            return self.raw.iloc[rows][cols]
+        tiles = level.tile_span(rows)
+        values = np.empty((2 * (tiles.stop - tiles.start), len(cols)))
+        values[0::2] = level.lo.iloc[tiles][cols].to_numpy()
+        values[1::2] = level.hi.iloc[tiles][cols].to_numpy()
+        return pd.DataFrame(values, index=self._envelope_index(level, tiles), columns=cols)
+
+    def window_mask(
+        self,
+        mask: pd.Series | IntervalMask,
+        start: Any = None,
+        end: Any = None,
+        *,
+        max_points: int,
+    ) -> pd.Series:
+        """``mask`` on the rows ``window`` returns: per tile, True if any raw row is True."""
+        if not isinstance(mask, IntervalMask):
+            mask = IntervalMask.from_series(mask.reindex(self.raw.index))
+        elif not (mask.index is self.raw.index or mask.index.equals(self.raw.index)):
+            mask = IntervalMask.from_series(mask.to_series().reindex(self.raw.index))
+        rows = time_window(self.raw.index, start, end)
+        level = self.level_for(rows, max_points)
+        if level is None:
+            positions = np.arange(rows.start, rows.stop, dtype=np.int64)
+            return pd.Series(mask.values_at(positions), index=self.raw.index[rows])
+        tiles = level.tile_span(rows)
+        hit = np.diff(mask.count_before(level.bounds[tiles.start : tiles.stop + 1])) > 0
+        return pd.Series(np.repeat(hit, 2), index=self._envelope_index(level, tiles))
+
+    @staticmethod
+    def _envelope_index(level: TileLevel, tiles: slice) -> pd.DatetimeIndex:
+        starts = level.index[tiles]
+        n = len(starts)
+        order = np.column_stack((np.arange(n), np.arange(n, 2 * n))).ravel()
+        return starts.append(starts + pd.Timedelta(level.freq) / 2).take(order)
+
+
+def _plottable(df: pd.DataFrame, columns: Iterable[str] | None) -> pd.DataFrame:
+    cols = list(df.columns) if columns is None else [c for c in columns if c in df.columns]
+    keep = [c for c in cols if pd.api.types.is_bool_dtype(df[c]) or pd.api.types.is_numeric_dtype(df[c])]
+    raw = df[keep]
+    cast = {c: np.float64 for c, dtype in raw.dtypes.items() if dtype != np.float64}
+    return raw.astype(cast) if cast else raw
+
+
+def build_tile_pyramid(
+    df: pd.DataFrame,
+    *,
+    columns: Iterable[str] | None = None,
+    freqs: Iterable[str] = DEFAULT_TILE_FREQS,
+) -> TilePyramid:
+    """Tile ``df``'s numeric / boolean columns at each of ``freqs`` (finest first).
+
+    Tiles follow the index's own timezone (a ``1D`` tile is a local day).
+    """
+    if not isinstance(df.index, pd.DatetimeIndex):
+        raise ValueError("tile pyramid needs a DatetimeIndex")
+    freqs = tuple(freqs)
+    widths = [pd.Timedelta(f) for f in freqs]
+    if any(b <= a for a, b in zip(widths, widths[1:])):
+        raise ValueError(f"tile freqs must get strictly coarser, got {freqs}")
+    raw = _plottable(df, columns)
+    if not raw.index.is_monotonic_increasing:
+        raw = raw.sort_index(kind="stable")
+    levels: list[TileLevel] = []
+    if len(raw):
+        cells = raw.resample(freqs[0])
+        count, total, lo, hi = cells.count(), cells.sum(), cells.min(), cells.max()
+        levels.append(_tile_level(freqs[0], count, total, lo, hi, raw.index))
+        for freq in freqs[1:]:
+            count = count.resample(freq).sum()
+            total = total.resample(freq).sum()
+            lo = lo.resample(freq).min()
+            hi = hi.resample(freq).max()
+            levels.append(_tile_level(freq, count, total, lo, hi, raw.index))
+    return TilePyramid(raw, tuple(levels))
+
+
+def build_tile_pyramids(
+    frames: Mapping[str, pd.DataFrame],
+    *,
+    columns: Iterable[str] | None = None,
+    freqs: Iterable[str] = DEFAULT_TILE_FREQS,
+) -> dict[str, TilePyramid]:
+    """``{equipment_id: TilePyramid}`` for every frame with a DatetimeIndex (built once per dataset)."""
+    freqs = tuple(freqs)
+    cols = None if columns is None else list(columns)
+    return {
+        eq_id: build_tile_pyramid(df, columns=cols, freqs=freqs)
+        for eq_id, df in frames.items()
+        if isinstance(df.index, pd.DatetimeIndex) and not df.empty
+    }
+
+
+__all__ = [
+    "DEFAULT_TILE_FREQS",
+    "RAW_WINDOW_FACTOR",
+    "TileLevel",
+    "TilePyramid",
+    "build_tile_pyramid",
+    "build_tile_pyramids",
+    "time_window",
+]
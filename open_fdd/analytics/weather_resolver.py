@@ -13,11 +13,12 @@ Policy
 
 from __future__ import annotations
 
-from typing import Any, Literal
+from typing import Any, Callable, Literal
 
 import pandas as pd
 
 from open_fdd.analytics.weather_psychrometrics import enrich_weather_frame
+from open_fdd.storage import overlay_frame
 
 OatSource = Literal["web", "bas"]
 
@@ -66,24 +67,25 @@ def apply_effective_oat_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Add ``oa_t_effective`` / source / ``bas_oa_t`` without overwriting BAS ``outside-air-temp``."""
     if df is None or df.empty:
         return df
-    out = df.copy()
-    bas_present = "outside-air-temp" in out.columns and bool(out["outside-air-temp"].notna().any())
+    added: dict[str, Any] = {}
+    bas_present = "outside-air-temp" in df.columns and bool(df["outside-air-temp"].notna().any())
     if bas_present:
-        out["bas-outside-air-temp"] = pd.to_numeric(out["outside-air-temp"], errors="coerce")
-    web_present = has_web_oat(out)
+        added["bas-outside-air-temp"] = pd.to_numeric(df["outside-air-temp"], errors="coerce")
+    web_present = has_web_oat(df)
     if web_present:
-        out["oa_t_effective"] = pd.to_numeric(out["web-outside-air-temp"], errors="coerce")
+        added["oa_t_effective"] = pd.to_numeric(df["web-outside-air-temp"], errors="coerce")
         source: OatSource | None = "web"
     elif bas_present:
-        out["oa_t_effective"] = pd.to_numeric(out["outside-air-temp"], errors="coerce")
+        added["oa_t_effective"] = pd.to_numeric(df["outside-air-temp"], errors="coerce")
         source = "bas"
     else:
         source = None
+    if source is not None:
+        added["oa_t_effective_source"] = source
+    out = overlay_frame(df, added)
     out.attrs["oa_t_effective_source"] = source
     out.attrs["has_web_weather"] = web_present
     out.attrs["has_bas_oat"] = bas_present
-    if source is not None:
-        out["oa_t_effective_source"] = source
     return out
 
 
@@ -98,18 +100,29 @@ def inject_oa_t_for_physics(df: pd.DataFrame) -> pd.DataFrame:
         return df
     if "oa_t_effective" not in df.columns or not bool(df["oa_t_effective"].notna().any()):
         return df
-    out = df.copy()
-    out["outside-air-temp"] = pd.to_numeric(out["oa_t_effective"], errors="coerce")
+    out = overlay_frame(df, {"outside-air-temp": pd.to_numeric(df["oa_t_effective"], errors="coerce")})
     out.attrs["oa_t_injected_from"] = out.attrs.get("oa_t_effective_source") or "web"
     return out
 
 
-def oat_meteo_availability(df: pd.DataFrame) -> tuple[bool, list[str]]:
-    """Return (ok, missing_reasons) for BAS-vs-web compare — both real sources required."""
+def oat_meteo_availability(
+    df: pd.DataFrame, has: Callable[[str], bool] | None = None
+) -> tuple[bool, list[str]]:
+    """Return (ok, missing_reasons) for BAS-vs-web compare — both real sources required.
+
+    ``has(role)`` (e.g. ``ColumnPresence.has``) replaces the per-column ``notna`` scans.
+    """
+    if has is None:
+        bas, web = has_bas_oat(df), has_web_oat(df)
+    else:
+        # Same precedence as has_bas_oat / has_web_oat.
+        bas = bool(df.attrs["has_bas_oat"]) if "has_bas_oat" in df.attrs else has("bas-outside-air-temp")
+        bas = bas and not df.empty
+        web = has("web-outside-air-temp") and not df.empty
     missing: list[str] = []
-    if not has_bas_oat(df):
+    if not bas:
         missing.append("bas outside-air-temp (required for sensor vs web compare)")
-    if not has_web_oat(df):
+    if not web:
         missing.append("web-outside-air-temp (web weather)")
     return (len(missing) == 0), missing
 
@@ -6,12 +6,18 @@ Zeros and ones are valid for status/command; they are not global sentinels.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Iterable
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Any, Hashable, Iterable
 
 import numpy as np
 import pandas as pd
 
+from open_fdd.storage import overlay_frame
+
 DEFAULT_SENTINELS = (999.0, 888.0, -999.0, 9999.0, -9999.0)
 
 REASON_SENTINEL = "SENTINEL"
@@ -106,11 +112,21 @@ def _role_family(role: str) -> str:
 
 @dataclass
 class RoleQuality:
+    """Quality of one role column.
+
+    Stored compactly: ``raw`` is the input Series itself, not a copy, validity is
+    a packed bitmask and reasons are ``uint8`` codes into ``REASON_CODES``.
+    ``valid`` / ``reason_codes`` rebuild the Series on access. ``raw`` is only
+    frozen under copy-on-write (``open_fdd.storage.copy_on_write_active``); on
+    pandas 2 without it, later in-place writes to the caller's column show
+    through ``raw`` while the masks and counts keep the values assessed.
+    """
+
     role: str
     raw: pd.Series
     normalized: pd.Series
-    valid: pd.Series
-    reason_codes: pd.Series
+    valid_bits: np.ndarray
+    reason_code_array: np.ndarray
     valid_sample_count: int
     invalid_sample_count: int
     valid_coverage: float
@@ -119,6 +135,18 @@ class RoleQuality:
     last_valid_timestamp: str | None
     quality_confidence: float
 
+    @property
+    def valid_mask(self) -> np.ndarray:
+        return np.unpackbits(self.valid_bits, count=len(self.reason_code_array)).view(bool)
+
+    @property
+    def valid(self) -> pd.Series:
+        return pd.Series(self.valid_mask, index=self.raw.index)
+
+    @property
+    def reason_codes(self) -> pd.Series:
+        return pd.Series(_REASON_LOOKUP[self.reason_code_array], index=self.raw.index, dtype=object)
+
     def summary(self) -> dict[str, Any]:
         return {
             "role": self.role,
@@ -156,11 +184,33 @@ class FrameQuality:
         }
 
 
+# Reason codes are tracked as small ints into this table while normalizing.
+REASON_CODES: tuple[str, ...] = (
+    "",
+    REASON_NULL,
+    REASON_NON_NUMERIC,
+    REASON_SENTINEL,
+    REASON_OUT_OF_RANGE,
+    REASON_IMPOSSIBLE,
+)
+_NULL, _NON_NUMERIC, _SENTINEL, _OUT_OF_RANGE, _IMPOSSIBLE = range(1, len(REASON_CODES))
+_REASON_LOOKUP = np.array(REASON_CODES, dtype=object)
+
+# Status values that are valid even though they are not numeric.
+_STATUS_WORDS = frozenset(
+    {"occupied", "unoccupied", "occ", "unocc", "true", "false", "on", "off", "yes", "no"}
+)
+
+
 def _is_sentinel(num: pd.Series, sentinels: Iterable[float]) -> pd.Series:
-    out = pd.Series(False, index=num.index)
-    for s in sentinels:
-        out = out | np.isclose(num, s, atol=0.0, rtol=0.0) | (num == s)
-    return out.fillna(False)
+    return pd.Series(_sentinel_mask(num.to_numpy(dtype=float, na_value=np.nan), sentinels), index=num.index)
+
+
+def _sentinel_mask(values: np.ndarray, sentinels: Iterable[float]) -> np.ndarray:
+    sent = np.asarray(tuple(sentinels), dtype=float)
+    if not len(sent):
+        return np.zeros(len(values), dtype=bool)
+    return np.isin(values, sent)
 
 
 def _scale_position(num: pd.Series) -> pd.Series:
@@ -168,6 +218,24 @@ def _scale_position(num: pd.Series) -> pd.Series:
     return num
 
 
+def _numeric(raw: pd.Series) -> tuple[pd.Series, np.ndarray, np.ndarray]:
+    """``(num, num values as float, null mask)``; plain numeric columns skip ``to_numeric``."""
+    dtype = raw.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "fiu":
+        values = raw.to_numpy(dtype=float)
+        return raw, values, np.isnan(values) if dtype.kind == "f" else np.zeros(len(values), dtype=bool)
+    num = pd.to_numeric(raw, errors="coerce")
+    return num, num.to_numpy(dtype=float, na_value=np.nan), raw.isna().to_numpy()
+
+
+def _status_word_or_bool(values: np.ndarray) -> np.ndarray:
+    return np.fromiter(
+        (isinstance(x, (bool, np.bool_)) or str(x).strip().lower() in _STATUS_WORDS for x in values),
+        dtype=bool,
+        count=len(values),
+    )
+
+
 def normalize_role_series(
     series: pd.Series,
     role: str,
@@ -175,126 +243,98 @@ def normalize_role_series(
     sentinels: Iterable[float] = DEFAULT_SENTINELS,
     bounds: tuple[float | None, float | None] | None = None,
 ) -> RoleQuality:
-    raw = series.copy()
+    raw = series
     family = _role_family(role)
-    reason = pd.Series("", index=raw.index, dtype=object)
-    valid = pd.Series(True, index=raw.index)
-
-    nulls = raw.isna()
-    reason = reason.mask(nulls, REASON_NULL)
-    valid = valid & ~nulls
-
-    if family in {"status", "command"} or family in STATUS_ROLES or family in COMMAND_ROLES:
+    num, values, nulls = _numeric(raw)
+    reason = np.where(nulls, _NULL, 0).astype(np.uint8)
+    valid = ~nulls
+
+    def flag(bad: np.ndarray, code: int) -> None:
+        # First reason wins: only samples still valid pick up a new code.
+        nonlocal valid
+        hit = bad & valid
+        reason[hit] = code
+        valid = valid & ~bad
+
+    non_num = valid & np.isnan(values)
+    status_like = family in {"status", "command"} or family in STATUS_ROLES or family in COMMAND_ROLES
+    if status_like and non_num.any():
         # Status/command: 0/1 (and 0–100 cmd) are legitimate. Occupancy calendars
         # use occupied/unoccupied strings — those are not NON_NUMERIC.
-        num = pd.to_numeric(raw, errors="coerce")
-        occ_ok = raw.map(
-            lambda x: str(x).strip().lower()
-            in {
-                "occupied",
-                "unoccupied",
-                "occ",
-                "unocc",
-                "true",
-                "false",
-                "on",
-                "off",
-                "yes",
-                "no",
-            }
-        )
-        non_num = (
-            (~nulls)
-            & num.isna()
-            & ~raw.map(lambda x: isinstance(x, (bool, np.bool_)))
-            & ~occ_ok.fillna(False)
-        )
-        reason = reason.mask(non_num, REASON_NON_NUMERIC)
-        valid = valid & ~non_num
+        pos = np.flatnonzero(non_num)
+        non_num[pos[_status_word_or_bool(raw.to_numpy(dtype=object)[pos])]] = False
+    flag(non_num, _NON_NUMERIC)
+    flag(_sentinel_mask(values, sentinels), _SENTINEL)
+
+    if status_like:
         if family in COMMAND_ROLES or str(role).endswith("-cmd"):
-            sent = _is_sentinel(num, sentinels)
-            reason = reason.mask(sent, REASON_SENTINEL)
-            valid = valid & ~sent
-            if bounds is None:
-                bounds = (0.0, 100.0)
-            lo, hi = bounds
-            out_of = pd.Series(False, index=raw.index)
-            if lo is not None:
-                out_of = out_of | (num < lo)
-            if hi is not None:
-                out_of = out_of | (num > hi)
+            lo, hi = bounds if bounds is not None else (0.0, 100.0)
             # 0–1 fraction commands are in range
-            frac = num.between(0.0, 1.0)
-            out_of = out_of & ~frac
-            reason = reason.mask(out_of & valid, REASON_OUT_OF_RANGE)
-            valid = valid & ~out_of
-            normalized = num.where(valid, np.nan)
-        else:
-            sent = _is_sentinel(num, sentinels)
-            reason = reason.mask(sent, REASON_SENTINEL)
-            valid = valid & ~sent
-            normalized = raw.where(valid)
-        return _finish(role, raw, normalized, valid, reason)
-
-    num = pd.to_numeric(raw, errors="coerce")
-    non_num = (~nulls) & num.isna()
-    reason = reason.mask(non_num, REASON_NON_NUMERIC)
-    valid = valid & ~non_num
-
-    sent = _is_sentinel(num, sentinels)
-    reason = reason.mask(sent, REASON_SENTINEL)
-    valid = valid & ~sent
+            frac = (values >= 0.0) & (values <= 1.0)
+            flag(_outside(values, lo, hi) & ~frac, _OUT_OF_RANGE)
+            return _finish(role, raw, _masked(num, values, valid), valid, reason)
+        return _finish(role, raw, raw.where(pd.Series(valid, index=raw.index)), valid, reason)
 
     lo_hi = bounds if bounds is not None else ROLE_BOUNDS.get(family)
     if lo_hi is not None:
         lo, hi = lo_hi
-        scaled = _scale_position(num)
         if family in POSITION_ROLES or any(k in family for k in ("valve", "damper", "speed")):
             # Accept 0–1 or 0–100
-            in_frac = scaled.between(0.0, 1.0)
-            in_pct = scaled.between(0.0, 100.0)
-            bad = valid & ~(in_frac | in_pct)
-            reason = reason.mask(bad, REASON_OUT_OF_RANGE)
-            valid = valid & ~bad
+            flag(~((values >= 0.0) & (values <= 100.0)), _OUT_OF_RANGE)
         else:
-            out_of = pd.Series(False, index=raw.index)
-            if lo is not None:
-                out_of = out_of | (scaled < lo)
-            if hi is not None:
-                out_of = out_of | (scaled > hi)
             # Negative flow/power/current is impossible
             if family.endswith("flow") or family.endswith("power") or family.endswith("current"):
-                neg = scaled < 0
-                reason = reason.mask(neg & valid, REASON_IMPOSSIBLE)
-                valid = valid & ~neg
-            reason = reason.mask(out_of & valid, REASON_OUT_OF_RANGE)
-            valid = valid & ~out_of
+                flag(values < 0, _IMPOSSIBLE)
+            flag(_outside(values, lo, hi), _OUT_OF_RANGE)
+
+    return _finish(role, raw, _masked(num, values, valid), valid, reason)
+
+
+def _outside(values: np.ndarray, lo: float | None, hi: float | None) -> np.ndarray:
+    out = np.zeros(len(values), dtype=bool)
+    if lo is not None:
+        out |= values < lo
+    if hi is not None:
+        out |= values > hi
+    return out
+
 
-    normalized = num.where(valid, np.nan)
-    return _finish(role, raw, normalized, valid, reason)
+def _masked(num: pd.Series, values: np.ndarray, valid: np.ndarray) -> pd.Series:
+    """``num.where(valid, nan)`` without the pandas alignment pass for numeric data."""
+    if isinstance(num.dtype, np.dtype) and num.dtype.kind in "fiu":
+        if valid.all():
+            return num  # nothing masked: share the column (pandas keeps integer dtype too)
+        out = np.where(valid, num.to_numpy(), np.nan)
+        return pd.Series(out, index=num.index, name=num.name)
+    return num.where(pd.Series(valid, index=num.index), np.nan)
 
 
-def _finish(role: str, raw: pd.Series, normalized: pd.Series, valid: pd.Series, reason: pd.Series) -> RoleQuality:
-    valid = valid.fillna(False).astype(bool)
-    n_valid = int(valid.sum())
-    n_invalid = int((~valid).sum())
-    cov = n_valid / max(len(valid), 1)
+def _finish(role: str, raw: pd.Series, normalized: pd.Series, valid: np.ndarray, reason: np.ndarray) -> RoleQuality:
+    n = len(valid)
+    n_valid = int(np.count_nonzero(valid))
+    n_invalid = n - n_valid
+    cov = n_valid / max(n, 1)
     counts: dict[str, int] = {}
-    for code in reason[reason != ""]:
-        counts[str(code)] = counts.get(str(code), 0) + 1
+    if n_invalid:
+        tally = np.bincount(reason, minlength=len(REASON_CODES))
+        present = [code for code in range(1, len(REASON_CODES)) if tally[code]]
+        # Keep first-occurrence key order (reason_counts is serialized as-is).
+        present.sort(key=lambda code: int(np.argmax(reason == code)))
+        counts = {REASON_CODES[code]: int(tally[code]) for code in present}
+    index = raw.index
     first = last = None
-    if n_valid and isinstance(valid.index, pd.DatetimeIndex):
-        idx = valid.index[valid]
-        first, last = str(idx[0]), str(idx[-1])
+    if n_valid and isinstance(index, pd.DatetimeIndex):
+        pos = np.flatnonzero(valid)
+        first, last = str(index[pos[0]]), str(index[pos[-1]])
     # Confidence: coverage damped by sentinel share
-    sent_share = counts.get(REASON_SENTINEL, 0) / max(len(valid), 1)
+    sent_share = counts.get(REASON_SENTINEL, 0) / max(n, 1)
     confidence = max(0.0, min(1.0, cov * (1.0 - 0.5 * sent_share)))
     return RoleQuality(
         role=role,
         raw=raw,
         normalized=normalized,
-        valid=valid,
-        reason_codes=reason,
+        valid_bits=np.packbits(valid),
+        reason_code_array=reason,
         valid_sample_count=n_valid,
         invalid_sample_count=n_invalid,
         valid_coverage=round(float(cov), 4),
@@ -305,24 +345,195 @@ def _finish(role: str, raw: pd.Series, normalized: pd.Series, valid: pd.Series,
     )
 
 
+def _root(arr: np.ndarray) -> np.ndarray:
+    while isinstance(arr.base, np.ndarray):
+        arr = arr.base
+    return arr
+
+
+def _buffer_key(arr: np.ndarray) -> tuple:
+    return (arr.__array_interface__["data"][0], arr.shape, arr.strides, arr.dtype.str)
+
+
+def _content_digest(arr: np.ndarray) -> bytes:
+    return hashlib.blake2b(np.ascontiguousarray(arr).view(np.uint8), digest_size=16).digest()
+
+
+def _column_identity(series: pd.Series) -> tuple[Hashable, list[np.ndarray]] | None:
+    """``(key, owners)`` naming the memory behind ``series`` and its index.
+
+    ``df[col]`` hands out a new Series object on every access but the same column
+    buffer, so identity is the buffer address/shape/strides rather than ``id()``,
+    plus a digest of the column bytes so an in-place write is a new key. (The
+    index needs no digest: pandas indexes are immutable.) ``owners`` are the base
+    arrays that must stay alive for the key to mean the same data. ``None`` for
+    extension-array and object columns (not cached: object bytes are pointers).
+    """
+    values = series._values
+    if not isinstance(values, np.ndarray) or values.dtype == object:
+        return None
+    index = series.index
+    if isinstance(index, pd.RangeIndex):
+        index_key: tuple = ("range", index.start, index.stop, index.step)
+        owners = [_root(values)]
+    else:
+        index_values = index.asi8 if isinstance(index, pd.DatetimeIndex) else index._values
+        if not isinstance(index_values, np.ndarray):
+            return None
+        index_key = (str(index.dtype),) + _buffer_key(index_values)
+        owners = [_root(values), _root(index_values)]
+    return (_buffer_key(values), _content_digest(values), index_key), owners
+
+
+class QualityCache:
+    """LRU memo of ``RoleQuality`` keyed by column identity, role, sentinels and bounds.
+
+    Entries are dropped when the column (or index) memory is released and evicted
+    least-recently-used first once their estimated size passes ``max_bytes``.
+    The key includes a digest of the column bytes, so a column written in place
+    misses instead of returning stale quality.
+
+    Hits need the same column buffer. Without pandas copy-on-write (pandas 2
+    defaults) ``overlay_frame`` deep-copies every working frame, so repeated runs
+    over the same frames miss; the cache only pays off under copy-on-write.
+    """
+
+    def __init__(self, max_bytes: int = 512 * 2**20) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries: OrderedDict[Hashable, tuple[RoleQuality, int, list]] = OrderedDict()
+        self._lock = threading.RLock()  # weakref callbacks may fire while held
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def role_quality(
+        self,
+        series: pd.Series,
+        role: str,
+        *,
+        sentinels: Iterable[float] = DEFAULT_SENTINELS,
+        bounds: tuple[float | None, float | None] | None = None,
+    ) -> RoleQuality:
+        """Cached ``normalize_role_series(series, role, ...)``."""
+        sentinels = tuple(float(x) for x in sentinels)
+        ident = _column_identity(series)
+        if ident is None:
+            with self._lock:
+                self.misses += 1
+            return normalize_role_series(series, role, sentinels=sentinels, bounds=bounds)
+        column_key, owners = ident
+        key = (column_key, role, sentinels, None if bounds is None else tuple(bounds))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                stored = entry[0]
+                normalized = series if stored.normalized is None else stored.normalized
+                return replace(stored, raw=series, normalized=normalized)
+            self.misses += 1
+        rq = normalize_role_series(series, role, sentinels=sentinels, bounds=bounds)
+        # ``raw`` (and an unmasked ``normalized``) are views of the column; keeping
+        # them would pin the frame, so the entry stores neither and re-attaches
+        # the caller's Series on a hit.
+        stored = replace(rq, raw=None, normalized=None if rq.normalized is rq.raw else rq.normalized)
+        size = _role_quality_nbytes(stored)
+        if size > self.max_bytes:
+            return rq
+        # Weak references: the cache never keeps a frame alive, and a freed buffer
+        # cannot be mistaken for a new one allocated at the same address.
+        refs = [weakref.ref(o, lambda _ref, key=key: self._discard(key)) for o in owners]
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (stored, size, refs)
+                self.nbytes += size
+                while self.nbytes > self.max_bytes:
+                    self._pop_oldest()
+        return rq
+
+    def _pop_oldest(self) -> None:
+        _, (_, size, _) = self._entries.popitem(last=False)
+        self.nbytes -= size
+        self.evictions += 1
+
+    def _discard(self, key: Hashable) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.nbytes -= entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """Counters for logging (``hits`` / ``misses`` are cumulative across ``clear``)."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "nbytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+def _role_quality_nbytes(rq: RoleQuality) -> int:
+    # Index memory is shared with the frame; count only the per-role arrays.
+    size = rq.valid_bits.nbytes + rq.reason_code_array.nbytes
+    if rq.normalized is not None:
+        size += int(rq.normalized.memory_usage(index=False, deep=False))
+    return int(size)
+
+
+# Process-wide cache for callers that assess the same frames back to back
+# (wattlab dump, reporting and FDD in one process). Opt-in via ``cache=`` /
+# ``run_batch(quality_cache=...)``; the wattlab ``run_rules`` path uses it and
+# reports ``stats()`` in ``AgentRun.meta["quality_cache"]``.
+QUALITY_CACHE = QualityCache()
+
+
 def assess_frame(
     df: pd.DataFrame,
     roles: Iterable[str] | None = None,
     *,
     sentinels: Iterable[float] = DEFAULT_SENTINELS,
+    cache: QualityCache | None = None,
 ) -> FrameQuality:
     cols = list(roles) if roles is not None else [c for c in df.columns if c != "timestamp_utc"]
     sentinels = tuple(sentinels)
-    fq = FrameQuality()
-    any_valid = pd.Series(False, index=df.index)
-    totals = {"valid": 0, "invalid": 0}
-    merged_reasons: dict[str, int] = {}
+    role_quality: dict[str, RoleQuality] = {}
     for role in cols:
         if role not in df.columns:
             continue
-        rq = normalize_role_series(df[role], role, sentinels=sentinels)
+        if cache is not None:
+            role_quality[role] = cache.role_quality(df[role], role, sentinels=sentinels)
+        else:
+            role_quality[role] = normalize_role_series(df[role], role, sentinels=sentinels)
+    return frame_quality_from_roles(role_quality, df.index)
+
+
+def frame_quality_from_roles(roles: dict[str, RoleQuality], index: pd.Index) -> FrameQuality:
+    """Aggregate already-normalized roles into a ``FrameQuality``.
+
+    Lets callers that cache ``RoleQuality`` per role (see
+    ``open_fdd.rules.prepared``) build the same frame summary as ``assess_frame``
+    without re-normalizing columns.
+    """
+    fq = FrameQuality()
+    any_bits = np.zeros((len(index) + 7) // 8, dtype=np.uint8)
+    totals = {"valid": 0, "invalid": 0}
+    merged_reasons: dict[str, int] = {}
+    for role, rq in roles.items():
         fq.roles[role] = rq
-        any_valid = any_valid | rq.valid
+        any_bits |= rq.valid_bits
         totals["valid"] += rq.valid_sample_count
         totals["invalid"] += rq.invalid_sample_count
         for k, v in rq.reason_counts.items():
@@ -332,10 +543,10 @@ def assess_frame(
     fq.invalid_sample_count = totals["invalid"]
     fq.valid_coverage = round(totals["valid"] / n, 4)
     fq.reason_counts = merged_reasons
-    if any_valid.any() and isinstance(df.index, pd.DatetimeIndex):
-        idx = df.index[any_valid]
-        fq.first_valid_timestamp = str(idx[0])
-        fq.last_valid_timestamp = str(idx[-1])
+    if any_bits.any() and isinstance(index, pd.DatetimeIndex):
+        pos = np.flatnonzero(np.unpackbits(any_bits, count=len(index)))
+        fq.first_valid_timestamp = str(index[pos[0]])
+        fq.last_valid_timestamp = str(index[pos[-1]])
     if fq.roles:
         fq.quality_confidence = round(
             float(min(r.quality_confidence for r in fq.roles.values())), 4
@@ -351,9 +562,9 @@ def apply_normalized(
 ) -> pd.DataFrame:
     """Replace analog columns with normalized values.
 
-    One ``assign`` (no per-column insert) so Building 100 frames do not
-    fragment and balloon RAM. Set ``attach_raw_and_flags=False`` for FDD
-    runs that only need gated values.
+    One ``overlay_frame`` (no per-column insert, no copy of the untouched
+    columns) so Building 100 frames do not fragment and balloon RAM. Set
+    ``attach_raw_and_flags=False`` for FDD runs that only need gated values.
     """
     assigns: dict[str, pd.Series] = {}
     for role, rq in quality.roles.items():
@@ -362,7 +573,7 @@ def apply_normalized(
             raw_col = f"raw:{role}"
             if raw_col not in df.columns:
                 assigns[raw_col] = rq.raw
-            assigns[f"quality:{role}"] = rq.valid.astype("int8")
+            assigns[f"quality:{role}"] = pd.Series(rq.valid_mask.view(np.int8), index=rq.raw.index)
     if not assigns:
         return df
-    return df.assign(**assigns)
+    return overlay_frame(df, assigns)
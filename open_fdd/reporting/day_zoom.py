@@ -7,10 +7,12 @@ from io import BytesIO
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from open_fdd.reporting.models import EngineeringFinding
 from open_fdd.rules.base import RuleResult
+from open_fdd.rules.intervals import IntervalMask
 
 
 def index_rule_results(rule_results: list[RuleResult] | None) -> dict[str, RuleResult]:
@@ -57,8 +59,24 @@ def _day_bounds(day: date, index: pd.DatetimeIndex) -> tuple[pd.Timestamp, pd.Ti
     return start, end
 
 
-def worst_fault_day(fault: pd.Series | None) -> date | None:
+def _worst_interval_day(fault: IntervalMask) -> date | None:
+    """Per-day fault counts from runs; only the fault-covered span is normalized."""
+    if not fault.any():
+        return None
+    lo, hi = int(fault.starts[0]), int(fault.stops[-1])
+    days = fault.index[lo:hi].normalize()
+    change = np.flatnonzero(days[1:] != days[:-1]) + 1
+    bounds = np.concatenate(([0], change, [hi - lo])) + lo
+    counts = np.diff(fault.count_before(bounds))
+    return days[int(bounds[int(np.argmax(counts))] - lo)].date()
+
+
+def worst_fault_day(fault: pd.Series | IntervalMask | None) -> date | None:
     """Calendar day with the most fault samples (True / 1)."""
+    if isinstance(fault, IntervalMask):
+        if isinstance(fault.index, pd.DatetimeIndex) and fault.index.is_monotonic_increasing:
+            return _worst_interval_day(fault)
+        fault = fault.to_series()
     if fault is None or len(fault) == 0:
         return None
     s = fault.dropna()
@@ -273,10 +291,10 @@ def attach_day_zoom_to_findings(
         if result is None:
             _skip(f, "no_result")
             continue
-        fault = getattr(result, "confirmed_fault", None)
-        if fault is None or (hasattr(fault, "empty") and fault.empty):
-            fault = getattr(result, "raw_fault", None)
-        day = worst_fault_day(fault if isinstance(fault, pd.Series) else None)
+        fault = result.fault_mask("confirmed_fault")
+        if fault is None or len(fault) == 0:
+            fault = result.fault_mask("raw_fault")
+        day = worst_fault_day(fault)
         if day is None:
             _skip(f, "no_fault_day")
             continue
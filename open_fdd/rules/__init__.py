@@ -1,11 +1,13 @@
 """Open-FDD pandas cookbook registry (+ optional CUSTOM-* agent rules)."""
 
 from open_fdd.rules.base import RuleResult
+from open_fdd.rules.intervals import IntervalMask
 from open_fdd.rules.cookbook_catalog import RULES as CANONICAL_RULES
 from open_fdd.rules.cookbook_catalog import RULES_BY_ID as CANONICAL_RULES_BY_ID
 from open_fdd.rules.cookbook_catalog import catalog
 from open_fdd.rules.custom_registry import active_rules, active_rules_by_id, custom_rules
 from open_fdd.rules.runner import infer_equipment_kind, run_all_cookbook_rules, run_batch, run_cookbook_rule
+from open_fdd.rules.incremental import ChunkedRun, IncrementalState, run_chunked, run_incremental
 
 # Canonical Open-FDD cookbook (never shrink this silently).
 CANONICAL_RULE_COUNT = len(CANONICAL_RULES)
@@ -65,6 +67,7 @@ __all__ = [
     "CANONICAL_RULES_BY_ID",
     "CANONICAL_RULE_COUNT",
     "RuleResult",
+    "IntervalMask",
     "catalog",
     "custom_rules",
     "active_rules",
@@ -74,4 +77,8 @@ __all__ = [
     "run_all_cookbook_rules",
     "run_batch",
     "run_cookbook_rule",
+    "ChunkedRun",
+    "IncrementalState",
+    "run_chunked",
+    "run_incremental",
 ]
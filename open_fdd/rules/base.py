@@ -10,7 +10,7 @@ from typing import Any, Literal
 import numpy as np
 import pandas as pd
 
-from open_fdd.analytics.runtime_intervals import UNLIMITED_GAP_SECONDS, interval_durations
+from open_fdd.rules.intervals import IntervalMask
 
 RuleStatus = Literal[
     "PASS",
@@ -22,61 +22,223 @@ RuleStatus = Literal[
 ]
 
 
-def _sample_deltas_seconds(index: pd.Index, poll_seconds: float) -> pd.Series | None:
-    """Per-sample duration (seconds) until the next timestamp; last uses median/poll."""
+# Prefix-sum run lengths differ from a per-run running sum by float rounding only;
+# one microsecond of slack keeps exact-threshold runs (e.g. 5 x 60 s vs 300 s) confirmed.
+_CONFIRM_SLACK_SECONDS = 1e-6
+
+
+def sample_deltas_seconds(index: pd.Index, poll_seconds: float) -> np.ndarray | None:
+    """Per-sample duration (seconds) until the next timestamp; last uses median/poll.
+
+    Row order and duplicates are preserved and gaps are not capped (same policy as
+    ``interval_durations(..., preserve_row_order=True)``). Returns ``None`` without
+    a DatetimeIndex so callers fall back to row-count math.
+    """
     if not isinstance(index, pd.DatetimeIndex) or len(index) == 0:
         return None
     if len(index) == 1:
-        return pd.Series([float(poll_seconds)], index=index)
-    durations = interval_durations(
-        index,
-        nominal_seconds=poll_seconds,
-        max_gap_seconds=UNLIMITED_GAP_SECONDS,
-        final_duration_seconds=0.0,
-        preserve_row_order=True,
-    )
-    med = (
-        float(durations.iloc[:-1].median())
-        if len(durations) > 1 and durations.iloc[:-1].notna().any()
-        else float(poll_seconds)
-    )
+        return np.array([float(poll_seconds)])
+    stamps = index.values
+    durations = np.empty(len(stamps), dtype=float)
+    durations[:-1] = np.diff(stamps) / np.timedelta64(1, "s")
+    np.clip(durations[:-1], 0.0, None, out=durations[:-1])
+    body = durations[:-1]
+    med = float(np.median(body[~np.isnan(body)])) if not np.isnan(body).all() else float(poll_seconds)
     if not np.isfinite(med) or med < 0:
         med = float(max(poll_seconds, 0.0))
-    durations = durations.copy()
-    durations.iloc[-1] = med
+    durations[-1] = med
     return durations
 
 
-def confirm_fault(raw: pd.Series, *, poll_seconds: float, confirm_seconds: float = 300.0) -> pd.Series:
+def _sample_deltas_seconds(index: pd.Index, poll_seconds: float) -> pd.Series | None:
+    """``sample_deltas_seconds`` as a Series on ``index`` (legacy helper)."""
+    deltas = sample_deltas_seconds(index, poll_seconds)
+    return None if deltas is None else pd.Series(deltas, index=index)
+
+
+def _bool_values(mask: pd.Series | np.ndarray) -> np.ndarray:
+    if isinstance(mask, np.ndarray) and mask.dtype == bool:
+        return mask
+    if isinstance(mask, pd.Series) and mask.dtype == bool:
+        return mask.to_numpy()
+    return pd.Series(mask).fillna(False).astype(bool).to_numpy()
+
+
+def run_length_sum(on: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Running sum of ``weights`` inside each consecutive True run of ``on`` (0 elsewhere).
+
+    O(n) prefix-sum kernel: the cumulative total is re-based at every False sample,
+    so no group labels or pandas ``groupby`` are needed. ``weights`` must be >= 0.
+    """
+    total = np.cumsum(np.where(on, weights, 0.0))
+    base = np.maximum.accumulate(np.where(on, 0.0, total))
+    return np.where(on, total - base, 0.0)
+
+
+def confirm_mask(
+    raw: np.ndarray,
+    *,
+    deltas: np.ndarray | None,
+    poll_seconds: float,
+    confirm_seconds: float,
+) -> np.ndarray:
+    """Array form of ``confirm_fault`` for a boolean array and matching deltas."""
+    if confirm_seconds <= 0:
+        return raw.copy()
+    if deltas is not None:
+        deltas = np.asarray(deltas, dtype=float)
+        missing = np.isnan(deltas)
+        cum = run_length_sum(raw, np.where(missing, 0.0, deltas))
+        return raw & ~missing & (cum >= float(confirm_seconds) - _CONFIRM_SLACK_SECONDS)
+    rows = max(1, int(np.ceil(confirm_seconds / max(poll_seconds, 1))))
+    streak = run_length_sum(raw, np.ones(len(raw)))
+    return raw & (streak >= rows)
+
+
+def masked_hours(mask: np.ndarray, *, deltas: np.ndarray | None, poll_seconds: float) -> float:
+    """Array form of ``hours_true``: integrate ``deltas`` under a boolean array."""
+    if deltas is not None:
+        per_hour = np.where(mask, np.asarray(deltas, dtype=float) / 3600.0, 0.0)
+        return float(np.nansum(per_hour))
+    return float(mask.sum()) * poll_seconds / 3600.0
+
+
+def confirm_fault(
+    raw: pd.Series,
+    *,
+    poll_seconds: float,
+    confirm_seconds: float = 300.0,
+    deltas: np.ndarray | pd.Series | None = None,
+) -> pd.Series:
     """Require the raw fault to persist for ``confirm_seconds`` before confirming.
 
     When the series has a DatetimeIndex, accumulate actual sample gaps within each
     True run. Otherwise fall back to row-count math using ``poll_seconds``.
+    ``deltas`` may carry precomputed ``sample_deltas_seconds`` for the same index.
     """
-    raw = raw.fillna(False).astype(bool)
+    values = _bool_values(raw)
     if confirm_seconds <= 0:
-        return raw
+        return pd.Series(values, index=raw.index)
+    if deltas is None:
+        deltas = sample_deltas_seconds(raw.index, poll_seconds)
+    out = confirm_mask(
+        values,
+        deltas=None if deltas is None else np.asarray(deltas, dtype=float),
+        poll_seconds=poll_seconds,
+        confirm_seconds=confirm_seconds,
+    )
+    return pd.Series(out, index=raw.index)
 
-    deltas = _sample_deltas_seconds(raw.index, poll_seconds)
-    if deltas is not None:
-        groups = (raw != raw.shift()).cumsum()
-        contrib = deltas.where(raw, 0.0)
-        cum = contrib.groupby(groups).cumsum()
-        return raw & (cum >= float(confirm_seconds))
 
-    rows = max(1, int(np.ceil(confirm_seconds / max(poll_seconds, 1))))
-    groups = (raw != raw.shift()).cumsum()
-    streak = raw.groupby(groups).cumcount() + 1
-    return raw & (streak >= rows)
+def hours_true(
+    mask: pd.Series,
+    poll_seconds: float,
+    *,
+    deltas: np.ndarray | pd.Series | None = None,
+) -> float:
+    """Hours under a boolean mask using actual timestamp deltas when available."""
+    if deltas is None:
+        deltas = sample_deltas_seconds(mask.index, poll_seconds)
+    return masked_hours(
+        _bool_values(mask),
+        deltas=None if deltas is None else np.asarray(deltas, dtype=float),
+        poll_seconds=poll_seconds,
+    )
 
 
-def hours_true(mask: pd.Series, poll_seconds: float) -> float:
-    """Hours under a boolean mask using actual timestamp deltas when available."""
-    m = mask.fillna(False).astype(bool)
-    deltas = _sample_deltas_seconds(m.index, poll_seconds)
-    if deltas is not None:
-        return float((m.astype(float) * (deltas / 3600.0)).sum())
-    return float(m.sum()) * poll_seconds / 3600.0
+@dataclass
+class RuleCarry:
+    """Per-rule state carried between append-only evaluations.
+
+    Holds the open raw run (seconds / rows already accumulated toward
+    ``confirm_seconds``), the last sample's flags and booked duration, and the
+    cumulative counters reported as ``fault_hours`` / ``fault_pct``. Used by
+    ``finalize_result(carry=...)``; see ``open_fdd.rules.incremental``.
+
+    ``share_threshold`` turns on a whole-history share gate (SCHED-247 style):
+    new raw samples only count while the cumulative raw share is at or above it.
+    ``run_cookbook_rule`` sets it from the rule's ``carry_share_param``.
+    """
+
+    run_seconds: float = 0.0
+    run_rows: int = 0
+    last_raw: bool = False
+    last_active: bool = False
+    last_confirmed: bool = False
+    last_seconds: float = 0.0
+    fault_seconds: float = 0.0
+    active_seconds: float = 0.0
+    fault_samples: int = 0
+    active_samples: int = 0
+    total_samples: int = 0
+    share_threshold: float | None = None
+    share_on: int = 0
+
+    def share_gate(self, raw: np.ndarray) -> np.ndarray:
+        """Apply ``share_threshold`` to new raw samples (call before ``advance``)."""
+        if self.share_threshold is None or not len(raw):
+            return raw
+        self.share_on += int(raw.sum())
+        if self.share_on < self.share_threshold * (self.total_samples + len(raw)):
+            return np.zeros(len(raw), dtype=bool)
+        return raw
+
+    def advance(
+        self,
+        raw: np.ndarray,
+        active: np.ndarray,
+        *,
+        deltas: np.ndarray | None,
+        poll_seconds: float,
+        confirm_seconds: float,
+        gap_seconds: float | None = None,
+    ) -> np.ndarray:
+        """Confirm new samples continuing the carried run; returns their confirmed mask.
+
+        ``gap_seconds`` is the now-known duration of the previous last sample (it was
+        booked with the median estimate); the difference is re-booked, but earlier
+        confirmations are never retracted.
+        """
+        if gap_seconds is not None and self.total_samples and np.isfinite(gap_seconds):
+            fix = float(gap_seconds) - self.last_seconds
+            self.active_seconds += fix if self.last_active else 0.0
+            self.fault_seconds += fix if self.last_confirmed else 0.0
+            self.run_seconds += fix if self.last_raw else 0.0
+            self.last_seconds = float(gap_seconds)
+        n = len(raw)
+        if n == 0:
+            return raw.copy()
+        if deltas is not None:
+            d = np.asarray(deltas, dtype=float)
+            missing = np.isnan(d)
+            weights = np.where(missing, 0.0, d)
+            seed = self.run_seconds
+        else:
+            missing = np.zeros(n, dtype=bool)
+            weights = np.full(n, float(poll_seconds))
+            seed = float(self.run_rows)
+        cum = run_length_sum(raw, weights if deltas is not None else np.ones(n))
+        if self.last_raw and raw[0]:
+            lead = int(np.argmin(raw)) if not raw.all() else n
+            cum[:lead] += seed
+        if confirm_seconds <= 0:
+            confirmed = raw.copy()
+        elif deltas is not None:
+            confirmed = raw & ~missing & (cum >= float(confirm_seconds) - _CONFIRM_SLACK_SECONDS)
+        else:
+            confirmed = raw & (cum >= max(1, int(np.ceil(confirm_seconds / max(poll_seconds, 1)))))
+        self.fault_seconds += float(weights[confirmed].sum())
+        self.active_seconds += float(weights[active].sum())
+        self.fault_samples += int(confirmed.sum())
+        self.active_samples += int(active.sum())
+        self.total_samples += n
+        if deltas is not None:
+            self.run_seconds = float(cum[-1]) if raw[-1] else 0.0
+        else:
+            self.run_rows = int(cum[-1]) if raw[-1] else 0
+        self.last_raw, self.last_active = bool(raw[-1]), bool(active[-1])
+        self.last_confirmed, self.last_seconds = bool(confirmed[-1]), float(weights[-1])
+        return confirmed
 
 
 def params_fingerprint(rule_id: str, params: dict[str, Any], *, gates_on: bool) -> str:
@@ -88,6 +250,53 @@ def params_fingerprint(rule_id: str, params: dict[str, Any], *, gates_on: bool)
     return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:12]
 
 
+@dataclass(frozen=True)
+class _PlotRefs:
+    """Plot series kept as column names into a shared frame (derived series kept as-is)."""
+
+    frame: pd.DataFrame
+    refs: dict[str, str | pd.Series]
+
+    def materialize(self) -> dict[str, pd.Series]:
+        return {k: self.frame[v] if isinstance(v, str) else v for k, v in self.refs.items()}
+
+    def __reduce__(self):
+        # Pickle only the referenced columns, never the whole shared frame.
+        cols = list(dict.fromkeys(v for v in self.refs.values() if isinstance(v, str)))
+        return (type(self), (self.frame[cols], self.refs))
+
+
+class _CompactField:
+    """Dataclass field descriptor that materializes compact payloads on read.
+
+    Fault masks are rebuilt on each read; plot series are materialized on the
+    first read and stored back.
+    """
+
+    def __init__(self, empty: Any = None) -> None:
+        self._empty = empty
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, obj: Any, owner: type | None = None) -> Any:
+        if obj is None:
+            return None  # dataclass default
+        value = obj.__dict__.get(self._name)
+        if isinstance(value, IntervalMask):
+            return value.materialize()
+        if isinstance(value, _PlotRefs):
+            # Materialize once and keep the dict, so it behaves like a dense result
+            # (``result.plot_series[k] = s`` sticks). Column Series are views of the frame.
+            value = obj.__dict__[self._name] = value.materialize()
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        if value is None and self._empty is not None:
+            value = self._empty()
+        obj.__dict__[self._name] = value
+
+
 @dataclass
 class RuleResult:
     rule_id: str
@@ -105,20 +314,76 @@ class RuleResult:
     metrics: dict[str, Any] = field(default_factory=dict)
     debug: pd.DataFrame | None = None
     notes: str = ""
-    raw_fault: pd.Series | None = None
-    confirmed_fault: pd.Series | None = None
-    plot_series: dict[str, pd.Series] = field(default_factory=dict)
+    # Descriptor fields: stored dense, or compact after ``compact()`` (see below).
+    raw_fault: pd.Series | None = _CompactField()
+    confirmed_fault: pd.Series | None = _CompactField()
+    plot_series: dict[str, pd.Series] = _CompactField(empty=dict)
     params_fingerprint: str = ""
 
+    @property
+    def is_compact(self) -> bool:
+        return isinstance(self.__dict__.get("confirmed_fault"), IntervalMask) or isinstance(
+            self.__dict__.get("plot_series"), _PlotRefs
+        )
+
+    def fault_mask(self, which: str = "confirmed_fault") -> IntervalMask | None:
+        """``raw_fault`` / ``confirmed_fault`` as an ``IntervalMask`` (no dense rebuild)."""
+        stored = self.__dict__.get(which)
+        if stored is None or isinstance(stored, IntervalMask):
+            return stored
+        return IntervalMask.from_series(stored)
+
+    def compact(self, frame: pd.DataFrame | None = None) -> "RuleResult":
+        """Drop dense per-sample payloads; Series rebuild on attribute access.
+
+        Boolean fault masks (and the per-role sweep masks in
+        ``metrics["sv_sweep_confirmed_roles"]``) become run-length intervals on
+        the shared index. Plot
+        series equal to a column of ``frame`` (the frame the rule ran on) become
+        references into it; derived series are kept as-is. Returns ``self``.
+        """
+        for name in ("raw_fault", "confirmed_fault"):
+            mask = self.__dict__.get(name)
+            if isinstance(mask, pd.Series) and mask.dtype == bool:
+                self.__dict__[name] = IntervalMask.from_series(mask)
+        # Sensor sweeps keep one confirmed 0/1 mask per role in metrics.
+        role_masks = (self.metrics or {}).get("sv_sweep_confirmed_roles")
+        if isinstance(role_masks, dict):
+            self.metrics["sv_sweep_confirmed_roles"] = {
+                role: IntervalMask.from_series(m) if isinstance(m, pd.Series) else m for role, m in role_masks.items()
+            }
+        plots = self.__dict__.get("plot_series")
+        if frame is not None and isinstance(plots, dict) and plots:
+            refs: dict[str, str | pd.Series] = {}
+            for key, series in plots.items():
+                col = series.name if isinstance(series, pd.Series) else None
+                if (
+                    isinstance(col, str)
+                    and col in frame.columns
+                    and series.index.equals(frame.index)
+                    and series.equals(frame[col])
+                ):
+                    refs[key] = col
+                else:
+                    refs[key] = series
+            self.__dict__["plot_series"] = _PlotRefs(frame, refs)
+        return self
+
     def to_dict(self) -> dict[str, Any]:
-        from open_fdd.rules.evidence import json_safe, series_summary, sparse_intervals
+        from open_fdd.rules.evidence import json_safe, mask_summary, series_summary, sparse_intervals
 
         evidence = {
             "gate_source": (self.metrics or {}).get("gate_source"),
             "proof_quality": (self.metrics or {}).get("quality_confidence"),
             "confirmed_fault": None,
         }
-        if self.confirmed_fault is not None:
+        stored = self.__dict__.get("confirmed_fault")
+        if isinstance(stored, IntervalMask):
+            evidence["confirmed_fault"] = {
+                **mask_summary(stored, role="confirmed_fault"),
+                "fault_intervals": sparse_intervals(stored),
+            }
+        elif self.confirmed_fault is not None:
             evidence["confirmed_fault"] = {
                 **series_summary(self.confirmed_fault.astype(float), role="confirmed_fault"),
                 "fault_intervals": sparse_intervals(self.confirmed_fault),
@@ -249,7 +514,7 @@ def equipment_off(
 def finalize_result(
     rule_id: str,
     equipment_id: str,
-    raw: pd.Series,
+    raw: pd.Series | IntervalMask,
     poll_seconds: float,
     confirm_seconds: float,
     *,
@@ -258,22 +523,77 @@ def finalize_result(
     equipment_type: str = "UNKNOWN",
     metrics: dict[str, Any] | None = None,
     plot_series: dict[str, pd.Series] | None = None,
-    active_mask: pd.Series | None = None,
+    active_mask: pd.Series | IntervalMask | None = None,
     params_fingerprint: str = "",
+    deltas: np.ndarray | None = None,
+    carry: RuleCarry | None = None,
+    new_from: int = 0,
 ) -> RuleResult:
-    raw = raw.fillna(False).astype(bool)
-    if active_mask is not None:
-        active = active_mask.reindex(raw.index).fillna(False).astype(bool)
-        raw = raw & active
+    """Confirm, integrate and package a raw fault mask.
+
+    An ``IntervalMask`` ``raw`` takes the interval path: confirmation and hours
+    are computed per run and the result keeps compact masks (same numbers as the
+    dense path up to float rounding).
+
+    With ``carry``, rows before ``new_from`` are context only: samples from
+    ``new_from`` on are confirmed continuing ``carry`` and the reported hours and
+    counts are cumulative. The returned masks cover the new rows only.
+    """
+    if deltas is None:
+        deltas = sample_deltas_seconds(raw.index, poll_seconds)
+    if carry is not None and isinstance(raw, IntervalMask):
+        raw = raw.to_series()
+    if isinstance(raw, IntervalMask):
+        if active_mask is not None:
+            active_m = (
+                active_mask
+                if isinstance(active_mask, IntervalMask)
+                else IntervalMask.from_series(active_mask.reindex(raw.index))
+            )
+            raw = raw & active_m
+        else:
+            active_m = IntervalMask.full(raw.index)
+        confirmed = raw.confirm(poll_seconds=poll_seconds, confirm_seconds=confirm_seconds, deltas=deltas)
+        n_total = len(raw)
+        n_active = active_m.sum()
+        fault_n = confirmed.sum()
+        active_h = active_m.hours(poll_seconds, deltas=deltas)
+        fault_h = confirmed.hours(poll_seconds, deltas=deltas)
     else:
-        active = pd.Series(True, index=raw.index)
-
-    confirmed = confirm_fault(raw, poll_seconds=poll_seconds, confirm_seconds=confirm_seconds)
-    n_total = len(raw)
-    n_active = int(active.sum())
-    fault_n = int(confirmed.sum())
-    active_h = hours_true(active, poll_seconds)
-    fault_h = hours_true(confirmed, poll_seconds)
+        raw = raw.fillna(False).astype(bool)
+        if active_mask is not None:
+            if isinstance(active_mask, IntervalMask):
+                active_mask = active_mask.to_series()
+            active = active_mask.reindex(raw.index).fillna(False).astype(bool)
+            raw = raw & active
+        else:
+            active = pd.Series(True, index=raw.index)
+        raw_v = raw.to_numpy()
+        active_v = active.to_numpy()
+        if carry is not None:
+            gap = float(deltas[new_from - 1]) if deltas is not None and new_from > 0 else None
+            raw_new = carry.share_gate(raw_v[new_from:])
+            raw = pd.Series(raw_new, index=raw.index[new_from:], name=raw.name)
+            confirmed_v = carry.advance(
+                raw_new,
+                active_v[new_from:],
+                deltas=None if deltas is None else deltas[new_from:],
+                poll_seconds=poll_seconds,
+                confirm_seconds=confirm_seconds,
+                gap_seconds=gap,
+            )
+            confirmed = pd.Series(confirmed_v, index=raw.index)
+            n_total, n_active, fault_n = carry.total_samples, carry.active_samples, carry.fault_samples
+            active_h = carry.active_seconds / 3600.0
+            fault_h = carry.fault_seconds / 3600.0
+        else:
+            confirmed_v = confirm_mask(raw_v, deltas=deltas, poll_seconds=poll_seconds, confirm_seconds=confirm_seconds)
+            confirmed = pd.Series(confirmed_v, index=raw.index)
+            n_total = len(raw)
+            n_active = int(active_v.sum())
+            fault_n = int(confirmed_v.sum())
+            active_h = masked_hours(active_v, deltas=deltas, poll_seconds=poll_seconds)
+            fault_h = masked_hours(confirmed_v, deltas=deltas, poll_seconds=poll_seconds)
     pct = 100.0 * fault_h / active_h if active_h else 0.0
     status: RuleStatus = "FAULT" if fault_n > 0 else "PASS"
     metrics_out = dict(metrics or {})
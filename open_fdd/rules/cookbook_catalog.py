@@ -78,7 +78,7 @@ def _sched247(d: pd.DataFrame, p: dict, poll: float) -> pd.Series:
     Pressure is inferred evidence only — it does not OR into the FAULT mask
     (4.3 migration). Structured proof fields are stored on ``d.attrs``.
     """
-    from open_fdd.rules.base import hours_true
+    from open_fdd.rules.base import hours_true, sample_deltas_seconds
 
     thr = _f(p, "always_on_pct", 0.95)
     status, status_role = _sched247_role_mask(
@@ -122,9 +122,10 @@ def _sched247(d: pd.DataFrame, p: dict, poll: float) -> pd.Series:
     if status is not None and command is not None:
         conflict = status.astype(bool) != command.astype(bool)
 
-    proven_h = hours_true(proven, poll)
-    inferred_h = hours_true(inferred, poll) if inferred is not None else 0.0
-    conflict_h = hours_true(conflict, poll)
+    deltas = sample_deltas_seconds(d.index, poll)
+    proven_h = hours_true(proven, poll, deltas=deltas)
+    inferred_h = hours_true(inferred, poll, deltas=deltas) if inferred is not None else 0.0
+    conflict_h = hours_true(conflict, poll, deltas=deltas)
     d.attrs["sched247_proof"] = {
         "proof_source": proof_source,
         "proof_confidence": proof_confidence,
@@ -151,11 +152,66 @@ def _false(index) -> pd.Series:
     return pd.Series(False, index=index)
 
 
-def flatline_mask(series: pd.Series, tol: float, window: int) -> pd.Series:
-    window = max(2, int(window))
-    roll_min = series.rolling(window, min_periods=window).min()
-    roll_max = series.rolling(window, min_periods=window).max()
-    return series.notna() & ((roll_max - roll_min) <= tol)
+def flatline_mask(series: pd.Series, tol: float, window: int | pd.Timedelta) -> pd.Series:
+    return flatline_masks(series.to_frame(), tol, window)[
+        series.name if series.name is not None else 0
+    ]
+
+
+def flatline_masks(
+    frame: pd.DataFrame,
+    tol: float,
+    window: int | pd.Timedelta,
+) -> pd.DataFrame:
+    """``flatline_mask`` for every column of ``frame`` in one rolling pass.
+
+    The rolling block comes from ``rolling.rolling_block``, so SV-FLATLINE and
+    SV-STALE share one scan of the sensor columns within a run.
+
+    ``window`` is a row count, or a ``Timedelta`` on a DatetimeIndex: a sample at
+    ``t`` is flat when the value as of ``t - window`` (the last sample at or before
+    it) and every sample after it up to ``t`` are non-null and within ``tol``.
+    Jittered, sparse and gappy timestamps need no resample; a gap inside the span
+    is bridged by the as-of sample, and the first ``window`` of data (no sample
+    that old yet) is never flat.
+    """
+    from open_fdd.rules.rolling import rolling_block
+
+    block = rolling_block(frame)
+    values = block.x
+    if isinstance(window, (int, np.integer)):
+        window = max(2, int(window))
+        stats = block.stats([window], stats=("min", "max"))[window]
+        full = np.ones(len(values), dtype=bool)[:, None]
+    else:
+        window = pd.Timedelta(window)
+        n = len(values)
+        stats = block.stats([window], stats=("min", "max", "count"))[window]
+        # (t - window, t] starts after the as-of sample, so that sample is starts - 1.
+        starts = block.starts(window)
+        anchor = starts - 1
+        rows = np.arange(n) - starts + 1
+        # No null inside the window; a NaN as-of value fails the range test below.
+        full = (stats["count"] == rows[:, None]) & (anchor >= 0)[:, None]
+        as_of = values[np.maximum(anchor, 0)]
+        stats = {"min": np.minimum(stats["min"], as_of), "max": np.maximum(stats["max"], as_of)}
+    with np.errstate(invalid="ignore"):
+        flat = ~np.isnan(values) & full & ((stats["max"] - stats["min"]) <= tol)
+    return pd.DataFrame(flat, index=frame.index, columns=frame.columns)
+
+
+def _flatline_window(d: pd.DataFrame, hours: float, poll: float) -> int | pd.Timedelta:
+    """Time window for DatetimeIndex frames, else the equivalent row count.
+
+    ``hours`` is rounded to whole ``poll`` intervals (at least two rows). The span
+    is one interval shorter than those rows because the as-of sample at
+    ``t - span`` counts, so a regular frame is judged on exactly the rows the old
+    row-count window was.
+    """
+    rows = max(2, int(round(hours * 3600 / max(poll, 1))))
+    if isinstance(d.index, pd.DatetimeIndex) and d.index.is_monotonic_increasing:
+        return pd.Timedelta(seconds=(rows - 1) * max(poll, 1))
+    return rows
 
 
 # ---------------------------------------------------------------------------
@@ -220,17 +276,18 @@ def _evidence_row(
     *,
     poll: float,
     series: pd.Series | None = None,
+    deltas: np.ndarray | None = None,
 ) -> dict:
     from open_fdd.rules.base import hours_true
 
     m = mask.fillna(False).astype(bool)
-    n_fault = int(m.sum())
-    hours = round(hours_true(m, poll), 3) if n_fault else 0.0
+    hits = np.flatnonzero(m.to_numpy())
+    n_fault = int(len(hits))
+    hours = round(hours_true(m, poll, deltas=deltas), 3) if n_fault else 0.0
     first_ts = last_ts = None
     if n_fault and isinstance(m.index, pd.DatetimeIndex):
-        idx = m.index[m]
-        first_ts = str(idx[0])
-        last_ts = str(idx[-1])
+        first_ts = str(m.index[hits[0]])
+        last_ts = str(m.index[hits[-1]])
     row: dict = {
         "role": role,
         "sensor_type": sensor_type_for_role(role),
@@ -258,11 +315,14 @@ def _stash_sweep_evidence(
     rule_tag: str,
 ) -> None:
     """Store per-role evidence + masks on the frame for the runner/UI."""
+    from open_fdd.rules.base import sample_deltas_seconds
+
     evidence = []
     masks: dict[str, pd.Series] = {}
+    deltas = sample_deltas_seconds(d.index, poll) if per_role else None
     for role, mask in per_role.items():
         s = pd.to_numeric(d[role], errors="coerce") if role in d.columns else None
-        evidence.append(_evidence_row(role, mask, poll=poll, series=s))
+        evidence.append(_evidence_row(role, mask, poll=poll, series=s, deltas=deltas))
         masks[role] = mask.fillna(False).astype(bool)
     d.attrs["sv_sweep_evidence"] = evidence
     d.attrs["sv_sweep_masks"] = masks
@@ -354,6 +414,9 @@ class CookbookRule:
     control_output_sweep: bool = False
     # One-sentence fault description for UI / DOCX / RULE_PLOT_CATALOG (not the equation).
     summary: str = ""
+    # Param holding a share-of-the-whole-window threshold. Append-only runs judge it
+    # on the carried cumulative share (``RuleCarry.share_threshold``) instead.
+    carry_share_param: str = ""
 
     def defaults(self) -> dict[str, float]:
         return {p.key: p.default for p in self.params}
@@ -424,6 +487,14 @@ LEGACY_SUPPLY_PARAM = lambda: CookbookParam(  # noqa: E731
 # ---------------------------------------------------------------------------
 
 
+def _numeric_block(d: pd.DataFrame, roles: list[str]) -> pd.DataFrame:
+    """Numeric (coerced) copy of ``roles`` as one float block."""
+    values = np.empty((len(d.index), len(roles)), dtype=float)
+    for j, role in enumerate(roles):
+        values[:, j] = pd.to_numeric(d[role], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    return pd.DataFrame(values, index=d.index, columns=roles)
+
+
 def _sweep_range(d: pd.DataFrame, p: dict, poll: float) -> pd.Series:
     idx = d.index
     mask = _false(idx)
@@ -449,14 +520,13 @@ def _sweep_flatline(d: pd.DataFrame, p: dict, poll: float) -> pd.Series:
     idx = d.index
     tol = _f(p, "flatline_tol", 0.10)
     hours = _f(p, "flatline_hours", 1.0)
-    window = max(2, int(round(hours * 3600 / max(poll, 1))))
+    window = _flatline_window(d, hours, poll)
     mask = _false(idx)
     per_role: dict[str, pd.Series] = {}
-    for role in FLATLINE_SENSOR_ROLES:
-        if role not in d.columns:
-            continue
-        s = pd.to_numeric(d[role], errors="coerce")
-        role_mask = flatline_mask(s, tol=tol, window=window)
+    present = [r for r in FLATLINE_SENSOR_ROLES if r in d.columns]
+    flat = flatline_masks(_numeric_block(d, present), tol=tol, window=window)
+    for role in present:
+        role_mask = flat[role]
         per_role[role] = role_mask
         mask = mask | role_mask
     _stash_sweep_evidence(d, per_role, poll=poll, rule_tag="SV-FLATLINE")
@@ -485,18 +555,14 @@ def _sweep_stale(d: pd.DataFrame, p: dict, poll: float) -> pd.Series:
     """Flag runs where all sweep sensors are unchanged (no fresh data)."""
     idx = d.index
     hours = _f(p, "stale_hours", 2.0)
-    window = max(2, int(round(hours * 3600 / max(poll, 1))))
+    window = _flatline_window(d, hours, poll)
     present = [r for r in FLATLINE_SENSOR_ROLES if r in d.columns]
     if not present:
         _stash_sweep_evidence(d, {}, poll=poll, rule_tag="SV-STALE")
         return _false(idx)
-    stale = pd.Series(True, index=idx)
-    per_role: dict[str, pd.Series] = {}
-    for role in present:
-        s = pd.to_numeric(d[role], errors="coerce")
-        role_flat = flatline_mask(s, tol=1e-9, window=window)
-        per_role[role] = role_flat  # each role's stuck mask; equipment fault is AND
-        stale = stale & role_flat
+    # Each role's stuck mask; the equipment fault is their AND.
+    flat = flatline_masks(_numeric_block(d, present), tol=1e-9, window=window)
+    stale = pd.Series(flat.to_numpy().all(axis=1), index=idx)
     # For stale, the firing evidence is the AND mask applied to each present role
     and_masks = {role: stale.copy() for role in present}
     _stash_sweep_evidence(d, and_masks, poll=poll, rule_tag="SV-STALE")
@@ -1938,6 +2004,7 @@ RULES: list[CookbookRule] = [
             "chw-diff-pressure",
         ],
         confirm_seconds=3600,
+        carry_share_param="always_on_pct",
     ),
     CookbookRule("RESET-1", "SAT reset not tracking outdoor air", "ahu", ["ahu"],
         ["discharge-air-temp-sp", "outside-air-temp"],
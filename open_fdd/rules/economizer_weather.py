@@ -5,7 +5,7 @@ Strict web-weather only — never silently substitute BAS OAT/RH.
 """
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 import pandas as pd
 
@@ -189,12 +189,20 @@ def chw_noload1_compute(d: pd.DataFrame, p: dict, poll: float) -> pd.Series:
     return (run & satisfied).fillna(False)
 
 
-def web_weather_missing_reasons(df: pd.DataFrame) -> list[str]:
-    """Roles missing for strict web dry-bulb + dewpoint/RH resolution."""
-    if "web-outside-air-temp" not in df.columns or not df["web-outside-air-temp"].notna().any():
+def web_weather_missing_reasons(df: pd.DataFrame, has: Callable[[str], bool] | None = None) -> list[str]:
+    """Roles missing for strict web dry-bulb + dewpoint/RH resolution.
+
+    ``has(role)`` (e.g. ``ColumnPresence.has``) replaces the per-column ``notna`` scans.
+    """
+    if has is None:
+
+        def has(role: str) -> bool:
+            return role in df.columns and bool(df[role].notna().any())
+
+    if not has("web-outside-air-temp"):
         return ["web-outside-air-temp"]
-    has_dp = "web-outside-air-dewpoint" in df.columns and df["web-outside-air-dewpoint"].notna().any()
-    has_rh = "web-outside-air-humidity" in df.columns and df["web-outside-air-humidity"].notna().any()
+    has_dp = has("web-outside-air-dewpoint")
+    has_rh = has("web-outside-air-humidity")
     if not has_dp and not has_rh:
         return ["web-outside-air-dewpoint|web-outside-air-humidity"]
     return []
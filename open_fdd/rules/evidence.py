@@ -7,6 +7,7 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
+from open_fdd.rules.intervals import IntervalMask
 
 
 class UnsafeEvidenceError(TypeError):
@@ -25,22 +26,49 @@ def _hours_true(mask: pd.Series, poll_seconds: float) -> float:
     return hours_true(mask, poll_seconds)
 
 
-def sparse_intervals(mask: pd.Series, *, poll_seconds: float = 300.0) -> list[dict[str, Any]]:
-    m = mask.fillna(False).astype(bool)
+def sparse_intervals(mask: pd.Series | IntervalMask, *, poll_seconds: float = 300.0) -> list[dict[str, Any]]:
+    m = mask if isinstance(mask, IntervalMask) else IntervalMask.from_series(mask)
     if not m.any():
         return []
-    groups = (m != m.shift()).cumsum()
-    out: list[dict[str, Any]] = []
-    for _, g in m[m].groupby(groups):
-        out.append(
-            {
-                "first": _ts(g.index[0]),
-                "last": _ts(g.index[-1]),
-                "count": int(len(g)),
-                "duration": round(_hours_true(g.reindex(m.index).fillna(False), poll_seconds), 4),
-            }
-        )
-    return out
+    hours = m.run_hours(poll_seconds)
+    return [
+        {
+            "first": _ts(first),
+            "last": _ts(last),
+            "count": int(count),
+            "duration": round(float(h), 4),
+        }
+        for (first, last, count), h in zip(m.intervals(), hours)
+    ]
+
+
+def mask_summary(mask: IntervalMask, *, role: str, poll_seconds: float = 300.0) -> dict[str, Any]:
+    """``series_summary(mask.astype(float))`` computed from runs (no dense 0/1 Series)."""
+    from open_fdd.rules.base import sample_deltas_seconds
+
+    n, on = len(mask), mask.sum()
+    index = mask.index
+    deltas = sample_deltas_seconds(index, poll_seconds)
+    hours = float(np.nansum(deltas / 3600.0)) if deltas is not None else float(n) * poll_seconds / 3600.0
+
+    def _sorted_at(k: int) -> float:
+        return 0.0 if k < n - on else 1.0
+
+    median = None
+    if n:
+        median = _sorted_at(n // 2) if n % 2 else (_sorted_at(n // 2 - 1) + _sorted_at(n // 2)) / 2.0
+    dated = n > 0 and isinstance(index, pd.DatetimeIndex)
+    return {
+        "role": role,
+        "count": int(n),
+        "duration": round(hours, 4),
+        "first": _ts(index[0]) if dated else None,
+        "last": _ts(index[-1]) if dated else None,
+        "min": (0.0 if on < n else 1.0) if n else None,
+        "max": (1.0 if on else 0.0) if n else None,
+        "median": median,
+        "valid_coverage": 1.0 if n else 0.0,
+    }
 
 
 def series_summary(
@@ -92,6 +120,11 @@ def json_safe(value: Any, *, poll_seconds: float = 300.0, role: str = "") -> Any
         return json_safe(value.item(), poll_seconds=poll_seconds, role=role)
     if isinstance(value, pd.Timestamp):
         return str(value)
+    if isinstance(value, IntervalMask):
+        name = role or str(value.name or "series")
+        summary = mask_summary(value, role=name, poll_seconds=poll_seconds)
+        summary["fault_intervals"] = sparse_intervals(value, poll_seconds=poll_seconds)
+        return summary
     if isinstance(value, pd.Series):
         name = role or str(value.name or "series")
         if value.dtype == bool or set(pd.unique(value.dropna().astype(str))) <= {"0", "1", "True", "False", "true", "false"}:
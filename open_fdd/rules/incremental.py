@@ -0,0 +1,231 @@
+"""Append-only cookbook evaluation with carried per-rule state.
+
+Historian appends (hourly CSV chunks) used to re-run every rule over the whole
+history. ``run_incremental`` evaluates only a trailing ``lookback`` tail plus the
+new rows: the tail gives rolling windows (flatline / stale, PID hunting, SV-RATE
+rates, sustain checks) their context, and each rule's ``RuleCarry`` continues the
+open confirmation run and the cumulative fault / active hours. Cost per append is
+O(lookback + new rows), independent of history length.
+
+Rules whose raw mask depends only on a trailing window no longer than
+``lookback`` reproduce the full-history result. Whole-window share rules
+(``CookbookRule.carry_share_param``, e.g. SCHED-247 runtime) are judged on the
+carried cumulative share, and the minimum-active-coverage skip stops applying
+once a rule has seen the equipment proven on. Confirmations already reported
+are never retracted. ``IncrementalState`` is a plain dataclass:
+pickle it between appends.
+
+``run_chunked`` drives the same machinery over an out-of-core history (for
+example ``app.data_loader.iter_equipment_csv_chunks``): only one chunk plus the
+lookback tail is in memory, and fault episodes are stitched across chunk edges.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import pandas as pd
+
+from open_fdd.rules.base import RuleCarry, RuleResult, finalize_result
+from open_fdd.rules.runner import _confirm_seconds, _params_for_rule, run_all_cookbook_rules
+
+# PID hunting, ECON ΔOS moving window and SV-RATE 60-minute rates.
+_FIXED_WINDOW_HOURS = 1.0
+_WINDOW_PARAMS_HOURS = ("flatline_hours", "stale_hours", "sustain_hours")
+_WINDOW_PARAMS_MINUTES = ("transition_window_min",)
+_LOOKBACK_MARGIN = pd.Timedelta(hours=1)
+
+# Window verdicts that mean "no evaluable samples in this chunk" rather than "rule
+# cannot run": once a rule has history, new rows count as inactive and fault-free.
+_CARRY_THROUGH_STATUSES = {"SKIPPED_EQUIPMENT_OFF", "SKIPPED_MISSING_ROLES"}
+
+
+def default_lookback(params_by_rule: dict[str, dict] | None = None) -> pd.Timedelta:
+    """Longest rolling window any active rule uses, plus a one-hour margin."""
+    from open_fdd.rules import RULES
+
+    hours = _FIXED_WINDOW_HOURS
+    for rule in RULES:
+        params = _params_for_rule(rule, params_by_rule or {})
+        for key in _WINDOW_PARAMS_HOURS:
+            if key in params:
+                hours = max(hours, float(params[key]))
+        for key in _WINDOW_PARAMS_MINUTES:
+            if key in params:
+                hours = max(hours, float(params[key]) / 60.0)
+    return pd.Timedelta(hours=hours) + _LOOKBACK_MARGIN
+
+
+@dataclass
+class IncrementalState:
+    """Everything ``run_incremental`` needs between appends for one equipment."""
+
+    equipment_id: str
+    poll_seconds: float
+    lookback: pd.Timedelta
+    tail: pd.DataFrame | None = None
+    carries: dict[str, RuleCarry] = field(default_factory=dict)
+    last_timestamp: pd.Timestamp | None = None
+    rows_seen: int = 0
+
+
+def run_incremental(
+    new_rows: pd.DataFrame,
+    state: IncrementalState | None = None,
+    *,
+    equipment_id: str | None = None,
+    poll_seconds: float | None = None,
+    params_by_rule: dict[str, dict] | None = None,
+    weather: pd.DataFrame | None = None,
+    site_id: str = "",
+    building_id: str = "",
+    equipment_type: str = "",
+    require_operational_gates: bool = True,
+    lookback: pd.Timedelta | None = None,
+) -> tuple[list[RuleResult], IncrementalState]:
+    """Evaluate the catalog on appended rows of one role-mapped equipment frame.
+
+    Pass ``state=None`` for the first chunk. Rows at or before the last seen
+    timestamp are ignored (append-only). Results report cumulative
+    ``fault_hours`` / ``fault_pct`` / counts; their masks cover the new rows.
+    """
+    if not isinstance(new_rows.index, pd.DatetimeIndex):
+        raise ValueError("run_incremental needs a DatetimeIndex on new_rows")
+    if state is None:
+        eq_id = equipment_id or str(new_rows.attrs.get("equipment_id", ""))
+        poll = float(poll_seconds or new_rows.attrs.get("poll_seconds") or 300.0)
+        state = IncrementalState(eq_id, poll, lookback if lookback is not None else default_lookback(params_by_rule))
+
+    new = new_rows.sort_index()
+    if state.last_timestamp is not None:
+        new = new[new.index > state.last_timestamp]
+    if new.empty:
+        return [], state
+
+    frame = new if state.tail is None else pd.concat([state.tail, new])
+    frame.attrs.update(new_rows.attrs)
+    new_from = len(frame) - len(new)
+
+    results = run_all_cookbook_rules(
+        frame,
+        equipment_id=state.equipment_id,
+        poll_seconds=state.poll_seconds,
+        params_by_rule=params_by_rule,
+        weather=weather,
+        site_id=site_id,
+        building_id=building_id,
+        equipment_type=equipment_type,
+        require_operational_gates=require_operational_gates,
+        carry_by_rule=state.carries,
+        new_from=new_from,
+    )
+    results = [_carry_through(r, frame, new_from, state, params_by_rule) for r in results]
+
+    state.tail = frame[frame.index > frame.index[-1] - state.lookback]
+    state.last_timestamp = frame.index[-1]
+    state.rows_seen += len(new)
+    return results, state
+
+
+def _carry_through(
+    result: RuleResult,
+    frame: pd.DataFrame,
+    new_from: int,
+    state: IncrementalState,
+    params_by_rule: dict[str, dict] | None,
+) -> RuleResult:
+    carry = state.carries.get(result.rule_id)
+    if result.status not in _CARRY_THROUGH_STATUSES or carry is None or not carry.total_samples:
+        return result
+    from open_fdd.rules import RULES_BY_ID
+
+    rule = RULES_BY_ID[result.rule_id]
+    off = pd.Series(False, index=frame.index)
+    return finalize_result(
+        result.rule_id,
+        result.equipment_id,
+        off,
+        state.poll_seconds,
+        _confirm_seconds(rule, _params_for_rule(rule, params_by_rule or {})),
+        site_id=result.site_id,
+        building_id=result.building_id,
+        equipment_type=result.equipment_type,
+        metrics={**result.metrics, "window_status": result.status},
+        active_mask=off,
+        params_fingerprint=result.params_fingerprint,
+        carry=carry,
+        new_from=new_from,
+    )
+
+
+@dataclass
+class ChunkedRun:
+    """Outcome of ``run_chunked``.
+
+    ``results`` are the cumulative results after the last chunk (their masks
+    cover that chunk only); ``fault_episodes`` holds every confirmed fault run as
+    ``(first_timestamp, last_timestamp, sample_count)``, merged across chunks.
+    """
+
+    results: list[RuleResult]
+    fault_episodes: dict[str, list[tuple[pd.Timestamp, pd.Timestamp, int]]]
+    state: IncrementalState | None
+    chunk_count: int = 0
+
+
+def run_chunked(
+    chunks: Iterable[pd.DataFrame],
+    *,
+    equipment_id: str | None = None,
+    poll_seconds: float | None = None,
+    params_by_rule: dict[str, dict] | None = None,
+    weather: pd.DataFrame | None = None,
+    site_id: str = "",
+    building_id: str = "",
+    equipment_type: str = "",
+    require_operational_gates: bool = True,
+    lookback: pd.Timedelta | None = None,
+) -> ChunkedRun:
+    """Run the catalog over time-ordered chunks of one equipment's history.
+
+    Chunks may overlap (rows at or before the previous chunk's last timestamp
+    are ignored), so reader margins are harmless. Per-chunk results are dropped
+    once their fault runs are recorded; peak memory follows the chunk size.
+    """
+    state: IncrementalState | None = None
+    results: list[RuleResult] = []
+    episodes: dict[str, list[tuple[pd.Timestamp, pd.Timestamp, int]]] = {}
+    prev_last: pd.Timestamp | None = None
+    n_chunks = 0
+    for chunk in chunks:
+        chunk_results, state = run_incremental(
+            chunk,
+            state,
+            equipment_id=equipment_id,
+            poll_seconds=poll_seconds,
+            params_by_rule=params_by_rule,
+            weather=weather,
+            site_id=site_id,
+            building_id=building_id,
+            equipment_type=equipment_type,
+            require_operational_gates=require_operational_gates,
+            lookback=lookback,
+        )
+        if not chunk_results:
+            continue
+        n_chunks += 1
+        for r in chunk_results:
+            mask = r.fault_mask()
+            if mask is None or not mask.any():
+                continue
+            runs = episodes.setdefault(r.rule_id, [])
+            for first, last, count in mask.intervals():
+                # A run that ended on the previous chunk's last row continues here.
+                if runs and first == mask.index[0] and runs[-1][1] == prev_last:
+                    runs[-1] = (runs[-1][0], last, runs[-1][2] + count)
+                else:
+                    runs.append((first, last, count))
+        prev_last = state.last_timestamp
+        results = chunk_results
+    return ChunkedRun(results, episodes, state, n_chunks)
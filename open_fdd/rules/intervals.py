@@ -0,0 +1,217 @@
+"""Run-length (interval) boolean masks for fault evidence.
+
+Fault masks are usually a few dozen True runs across hundreds of thousands of
+samples. ``IntervalMask`` stores only half-open ``[start, stop)`` positions on a
+shared index, so set algebra, durations and first/last/interval queries scale
+with the number of fault episodes instead of the number of samples.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+import numpy as np
+import pandas as pd
+
+_EMPTY = np.array([], dtype=np.int64)
+
+
+def _runs(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    edges = np.diff(np.concatenate(([False], values, [False])).astype(np.int8))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+@dataclass(frozen=True, eq=False)
+class IntervalMask:
+    """Boolean mask on ``index`` stored as sorted, disjoint ``[start, stop)`` runs."""
+
+    index: pd.Index
+    starts: np.ndarray
+    stops: np.ndarray
+    name: Any = None
+
+    # ---- construction / conversion -------------------------------------------------
+
+    @classmethod
+    def from_bool(cls, values: np.ndarray, index: pd.Index, name: Any = None) -> "IntervalMask":
+        starts, stops = _runs(np.asarray(values, dtype=bool))
+        return cls(index, starts, stops, name)
+
+    @classmethod
+    def from_series(cls, mask: pd.Series) -> "IntervalMask":
+        """NaN / missing values count as False (same as ``fillna(False)``)."""
+        from open_fdd.rules.base import _bool_values
+
+        return cls.from_bool(_bool_values(mask), mask.index, mask.name)
+
+    @classmethod
+    def empty(cls, index: pd.Index, name: Any = None) -> "IntervalMask":
+        return cls(index, _EMPTY, _EMPTY, name)
+
+    @classmethod
+    def full(cls, index: pd.Index, name: Any = None) -> "IntervalMask":
+        if len(index) == 0:
+            return cls.empty(index, name)
+        return cls(index, np.array([0]), np.array([len(index)]), name)
+
+    def to_numpy(self) -> np.ndarray:
+        marks = np.zeros(len(self.index) + 1, dtype=np.int32)
+        marks[self.starts] += 1
+        marks[self.stops] -= 1
+        return np.cumsum(marks[:-1]) > 0
+
+    def to_series(self) -> pd.Series:
+        return pd.Series(self.to_numpy(), index=self.index, name=self.name)
+
+    materialize = to_series
+
+    # ---- set algebra --------------------------------------------------------------
+
+    def _aligned(self, other: "IntervalMask | pd.Series") -> "IntervalMask":
+        if isinstance(other, pd.Series):
+            other = IntervalMask.from_series(other.reindex(self.index))
+        if other.index is not self.index and not other.index.equals(self.index):
+            raise ValueError("IntervalMask operands must share the same index")
+        return other
+
+    def _combine(self, other: "IntervalMask | pd.Series", need: int) -> "IntervalMask":
+        other = self._aligned(other)
+        # Sweep-line over run boundaries: coverage count >= need (1 = or, 2 = and).
+        bounds = np.concatenate((self.starts, other.starts, self.stops, other.stops))
+        steps = np.concatenate(
+            (
+                np.ones(len(self.starts) + len(other.starts), dtype=np.int64),
+                -np.ones(len(self.stops) + len(other.stops), dtype=np.int64),
+            )
+        )
+        # Starts before stops at equal positions so touching runs merge under ``or``.
+        order = np.lexsort((-steps, bounds))
+        bounds, depth = bounds[order], np.cumsum(steps[order])
+        on = depth >= need
+        prev = np.concatenate(([False], on[:-1]))
+        starts, stops = bounds[on & ~prev], bounds[~on & prev]
+        keep = starts < stops
+        return IntervalMask(self.index, starts[keep], stops[keep], self.name)
+
+    def __and__(self, other: "IntervalMask | pd.Series") -> "IntervalMask":
+        return self._combine(other, 2)
+
+    def __or__(self, other: "IntervalMask | pd.Series") -> "IntervalMask":
+        return self._combine(other, 1)
+
+    def __invert__(self) -> "IntervalMask":
+        n = len(self.index)
+        starts = np.concatenate(([0], self.stops))
+        stops = np.concatenate((self.starts, [n]))
+        keep = starts < stops
+        return IntervalMask(self.index, starts[keep], stops[keep], self.name)
+
+    # ---- queries ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def n_runs(self) -> int:
+        return int(len(self.starts))
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return self.stops - self.starts
+
+    def any(self) -> bool:
+        return bool(len(self.starts))
+
+    def sum(self) -> int:
+        """Number of True samples (mirrors ``Series.sum`` on a bool mask)."""
+        return int(self.lengths.sum())
+
+    def first(self) -> Any:
+        return self.index[self.starts[0]] if len(self.starts) else None
+
+    def last(self) -> Any:
+        return self.index[self.stops[-1] - 1] if len(self.stops) else None
+
+    def intervals(self) -> Iterator[tuple[Any, Any, int]]:
+        """``(first_label, last_label, sample_count)`` for each True run."""
+        for start, stop in zip(self.starts.tolist(), self.stops.tolist()):
+            yield self.index[start], self.index[stop - 1], stop - start
+
+    def transitions(self) -> np.ndarray:
+        """Positions ``i`` where ``mask[i] != mask[i - 1]`` (chart edge markers)."""
+        n = len(self.index)
+        edges = np.concatenate((self.starts[self.starts > 0], self.stops[self.stops < n]))
+        return np.sort(edges)
+
+    def values_at(self, positions: np.ndarray) -> np.ndarray:
+        """Mask values at integer ``positions`` without densifying."""
+        pos = np.asarray(positions, dtype=np.int64)
+        k = np.searchsorted(self.starts, pos, side="right") - 1
+        hit = k >= 0
+        out = np.zeros(len(pos), dtype=bool)
+        out[hit] = pos[hit] < self.stops[k[hit]]
+        return out
+
+    def count_before(self, positions: np.ndarray) -> np.ndarray:
+        """True-sample count in ``[0, p)`` for each position ``p``."""
+        pos = np.asarray(positions, dtype=np.int64)
+        cum = np.concatenate(([0], np.cumsum(self.lengths)))
+        k = np.searchsorted(self.starts, pos, side="left")
+        out = cum[k].astype(np.int64)
+        prev = k > 0
+        out[prev] -= np.maximum(self.stops[k[prev] - 1] - pos[prev], 0)
+        return out
+
+    # ---- durations ----------------------------------------------------------------
+
+    def run_seconds(self, deltas: np.ndarray) -> np.ndarray:
+        """Per-run integrated seconds from per-sample ``deltas`` (NaN counts as 0)."""
+        d = np.asarray(deltas, dtype=float)
+        prefix = np.concatenate(([0.0], np.cumsum(np.where(np.isnan(d), 0.0, d))))
+        return prefix[self.stops] - prefix[self.starts]
+
+    def run_hours(self, poll_seconds: float, *, deltas: np.ndarray | None = None) -> np.ndarray:
+        """Per-run hours; timestamp deltas when available, else ``poll_seconds`` per row."""
+        from open_fdd.rules.base import sample_deltas_seconds
+
+        if deltas is None:
+            deltas = sample_deltas_seconds(self.index, poll_seconds)
+        if deltas is None:
+            return self.lengths * float(poll_seconds) / 3600.0
+        return self.run_seconds(deltas) / 3600.0
+
+    def hours(self, poll_seconds: float, *, deltas: np.ndarray | None = None) -> float:
+        """Total hours under the mask (``hours_true`` on the dense Series)."""
+        return float(self.run_hours(poll_seconds, deltas=deltas).sum())
+
+    def confirm(
+        self,
+        *,
+        poll_seconds: float,
+        confirm_seconds: float,
+        deltas: np.ndarray | None = None,
+    ) -> "IntervalMask":
+        """Interval form of ``confirm_fault``: trim each run until it has persisted."""
+        from open_fdd.rules.base import _CONFIRM_SLACK_SECONDS, confirm_mask, sample_deltas_seconds
+
+        if confirm_seconds <= 0 or not len(self.starts):
+            return self
+        if deltas is None:
+            deltas = sample_deltas_seconds(self.index, poll_seconds)
+        if deltas is None:
+            rows = max(1, int(np.ceil(confirm_seconds / max(poll_seconds, 1))))
+            first = self.starts + (rows - 1)
+        else:
+            d = np.asarray(deltas, dtype=float)
+            if np.isnan(d).any():
+                # NaT stamps: keep the dense kernel's "never confirmed" rule.
+                dense = confirm_mask(
+                    self.to_numpy(), deltas=d, poll_seconds=poll_seconds, confirm_seconds=confirm_seconds
+                )
+                return IntervalMask.from_bool(dense, self.index, self.name)
+            prefix = np.concatenate(([0.0], np.cumsum(d)))
+            target = prefix[self.starts] + (float(confirm_seconds) - _CONFIRM_SLACK_SECONDS)
+            first = np.maximum(np.searchsorted(prefix, target, side="left") - 1, self.starts)
+        keep = first < self.stops
+        return IntervalMask(self.index, first[keep], self.stops[keep], self.name)
@@ -132,6 +132,19 @@ PUMP_CMD_FALLBACK = ("pump-cmd", "chw-pump-cmd", "hw-pump-cmd")
 
 COMPRESSOR_ROLES = ("compressor-status", "equipment-enable", "fan-status", "fan-cmd")
 
+# Every column a running-mask resolver can read (``zone-airflow`` is the VAV proxy).
+# Callers that cache running masks key them on how these columns were prepared.
+RUNNING_MASK_ROLES = tuple(
+    dict.fromkeys(
+        FAN_PROOF_ROLES
+        + FAN_CMD_FALLBACK
+        + PUMP_PROOF_ROLES
+        + PUMP_CMD_FALLBACK
+        + COMPRESSOR_ROLES
+        + ("zone-airflow",)
+    )
+)
+
 
 def _series_on(series: pd.Series, *, threshold: float = 0.05) -> pd.Series:
     num = pd.to_numeric(series, errors="coerce")
@@ -204,10 +217,39 @@ def resolve_equipment_energized(df: pd.DataFrame, *, command_fallback: bool = Tr
     return pd.Series(True, index=df.index), "ungated_no_proof_roles"
 
 
+def resolve_running_mask(
+    df: pd.DataFrame,
+    kind: GateKind,
+    *,
+    command_fallback: bool = True,
+    running_cache: dict | None = None,
+) -> tuple[pd.Series, str]:
+    """Fan / hydronic / compressor / energized mask, memoized in ``running_cache``.
+
+    The cache must belong to one frame; ``open_fdd.rules.prepared`` hands out one
+    per equipment so ~60 rules share a handful of resolver passes.
+    """
+    key = (kind, bool(command_fallback))
+    if running_cache is not None and key in running_cache:
+        return running_cache[key]
+    resolver = {
+        "fan_running": resolve_fan_running,
+        "hydronic_flow": resolve_hydronic_running,
+        "compressor": resolve_compressor_running,
+        "equipment_energized": resolve_equipment_energized,
+    }[kind]
+    out = resolver(df, command_fallback=command_fallback)
+    if running_cache is not None:
+        running_cache[key] = out
+    return out
+
+
 def resolve_conditional(
     df: pd.DataFrame,
     rule_id: str,
     params: dict | None = None,
+    *,
+    running_cache: dict | None = None,
 ) -> tuple[pd.Series, str]:
     """Point/context-aware gates for CONDITIONAL rules."""
     params = params or {}
@@ -215,16 +257,16 @@ def resolve_conditional(
         # Occupied band when schedule exists; also require air moving when fan/flow proof exists.
         if "occupied" in df.columns and df["occupied"].notna().any():
             occ = df["occupied"].astype(str).str.lower().isin({"occupied", "1", "true", "on"})
-            fan, src = resolve_fan_running(df)
+            fan, src = resolve_running_mask(df, "fan_running", running_cache=running_cache)
             if src.startswith("ungated"):
                 return occ.fillna(False), "occupied"
             return (occ & fan).fillna(False), f"occ_and_{src}"
-        fan, src = resolve_fan_running(df)
+        fan, src = resolve_running_mask(df, "fan_running", running_cache=running_cache)
         if src.startswith("ungated"):
             return pd.Series(True, index=df.index), "ungated_no_occ"
         return fan, src
     if rule_id == "DMP-1":
-        fan, src = resolve_fan_running(df)
+        fan, src = resolve_running_mask(df, "fan_running", running_cache=running_cache)
         if "outside-air-damper" in df.columns:
             cmd = norm_cmd(df["outside-air-damper"]).fillna(0) > 0.01
             return (fan | cmd).fillna(False), f"damper_or_{src}"
@@ -232,12 +274,12 @@ def resolve_conditional(
     if rule_id == "VLV-1":
         # Leakage detection already requires a closed valve in the rule compute.
         # Gate only on fan proof — the old (valve>0.01)|(valve<=0.05) cover was a tautology.
-        fan, src = resolve_fan_running(df)
+        fan, src = resolve_running_mask(df, "fan_running", running_cache=running_cache)
         return fan, f"fan_{src}"
     if rule_id == "AHU-DUCTHI":
         # Evaluate when fan is proven on OR duct static itself shows live pressure.
         # This catches high static while fan-status falsely reports off.
-        fan, src = resolve_fan_running(df)
+        fan, src = resolve_running_mask(df, "fan_running", running_cache=running_cache)
         try:
             thr = float(params.get("pressure_on_min", 0.20) or 0.20)
         except (TypeError, ValueError):
@@ -250,7 +292,7 @@ def resolve_conditional(
         return fan, src
     if rule_id == "SV-FLATLINE":
         # Prefer energized periods (fan → pump) to reduce off-period stuck false positives.
-        return resolve_equipment_energized(df)
+        return resolve_running_mask(df, "equipment_energized", running_cache=running_cache)
     return pd.Series(True, index=df.index), "conditional_default"
 
 
@@ -272,12 +314,14 @@ def resolve_operational_mask(
     poll_seconds: float,
     params: dict | None = None,
     gate_enabled: bool = True,
+    running_cache: dict | None = None,
 ) -> tuple[pd.Series, dict]:
     """
     Return (active_mask, meta).
 
     When gate_enabled is False or kind is always → all True.
     When no proof roles exist → ungated (all True) with meta note (cannot prove off).
+    ``running_cache`` memoizes fan/pump/compressor masks across rules on one frame.
     """
     params = params or {}
     spec = RULE_GATES.get(rule_id, GateSpec("always"))
@@ -295,21 +339,25 @@ def resolve_operational_mask(
         meta["gate_source"] = "disabled" if not gate_enabled or not require else "always"
         return active, meta
 
-    if spec.kind == "fan_running":
-        active, src = resolve_fan_running(df, command_fallback=spec.command_fallback_allowed)
-    elif spec.kind == "hydronic_flow":
-        active, src = resolve_hydronic_running(df, command_fallback=spec.command_fallback_allowed)
-    elif spec.kind == "compressor":
-        active, src = resolve_compressor_running(df, command_fallback=spec.command_fallback_allowed)
-    elif spec.kind == "equipment_energized":
-        active, src = resolve_equipment_energized(df, command_fallback=spec.command_fallback_allowed)
+    if spec.kind in {"fan_running", "hydronic_flow", "compressor", "equipment_energized"}:
+        active, src = resolve_running_mask(
+            df,
+            spec.kind,
+            command_fallback=spec.command_fallback_allowed,
+            running_cache=running_cache,
+        )
     elif spec.kind == "control_loop":
-        active, src = resolve_fan_running(df, command_fallback=spec.command_fallback_allowed)
+        active, src = resolve_running_mask(
+            df,
+            "fan_running",
+            command_fallback=spec.command_fallback_allowed,
+            running_cache=running_cache,
+        )
         if "loop-enabled" in df.columns:
             active = active & _series_on(df["loop-enabled"])
             src = f"{src}+loop_enabled"
     elif spec.kind == "conditional":
-        active, src = resolve_conditional(df, rule_id, params=params)
+        active, src = resolve_conditional(df, rule_id, params=params, running_cache=running_cache)
     else:
         active, src = pd.Series(True, index=df.index), "always"
 
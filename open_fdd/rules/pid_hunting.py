@@ -7,6 +7,8 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from open_fdd.rules.rolling import rolling_stats
+
 
 @dataclass(frozen=True)
 class PidHuntingParams:
@@ -72,22 +74,12 @@ def hunting_fault_mask(
         int(np.ceil(expected_samples * params.minimum_coverage_pct / 100.0)),
     )
 
-    valid = output.notna()
     raw_delta = output.diff()
     significant_delta = raw_delta.where(
         raw_delta.abs() >= params.change_deadband_pct,
         0.0,
     )
 
-    total_variation = significant_delta.abs().rolling(
-        window,
-        min_periods=minimum_samples,
-    ).sum()
-
-    rolling_min = output.rolling(window, min_periods=minimum_samples).min()
-    rolling_max = output.rolling(window, min_periods=minimum_samples).max()
-    output_span = rolling_max - rolling_min
-
     direction = pd.Series(
         np.sign(significant_delta.to_numpy(dtype="float64")),
         index=significant_delta.index,
@@ -99,29 +91,42 @@ def hunting_fault_mask(
         & previous_direction.notna()
         & direction.ne(previous_direction)
     ).astype("int64")
-    reversals = reversal_event.rolling(window, min_periods=minimum_samples).sum()
 
-    valid_samples = valid.astype("int64").rolling(window, min_periods=1).sum()
+    # One rolling pass over every windowed input (output, |Δ|, reversals, extremes).
+    block = np.column_stack(
+        (
+            output.to_numpy(dtype="float64"),
+            significant_delta.abs().to_numpy(dtype="float64"),
+            reversal_event.to_numpy(dtype="float64"),
+            output.le(params.low_extreme_pct).to_numpy(dtype="float64"),
+            output.ge(params.high_extreme_pct).to_numpy(dtype="float64"),
+        )
+    )
+    stats = rolling_stats(
+        block,
+        [window],
+        index=output.index,
+        stats={"min": [0], "max": [0, 3, 4], "sum": [1, 2], "count": [0]},
+        min_periods=minimum_samples,
+    )[window]
+
+    def col(stat: str, j: int) -> pd.Series:
+        return pd.Series(stats[stat][:, j], index=output.index)
+
+    total_variation = col("sum", 1)
+    rolling_min = col("min", 0)
+    rolling_max = col("max", 0)
+    output_span = rolling_max - rolling_min
+    reversals = col("sum", 2)
+
+    # Non-null outputs in the window (pandas min_periods=1 on the 0/1 valid flags).
+    valid_samples = col("count", 0)
     coverage_pct = (100.0 * valid_samples / float(expected_samples)).clip(upper=100.0)
 
     equivalent_cycles = total_variation / (2.0 * output_span.replace(0.0, np.nan))
 
-    low_extreme_seen = (
-        output.le(params.low_extreme_pct)
-        .astype("int64")
-        .rolling(window, min_periods=minimum_samples)
-        .max()
-        .fillna(0)
-        .astype(bool)
-    )
-    high_extreme_seen = (
-        output.ge(params.high_extreme_pct)
-        .astype("int64")
-        .rolling(window, min_periods=minimum_samples)
-        .max()
-        .fillna(0)
-        .astype(bool)
-    )
+    low_extreme_seen = col("max", 3).fillna(0).astype(bool)
+    high_extreme_seen = col("max", 4).fillna(0).astype(bool)
 
     if enabled is None:
         loop_enabled = pd.Series(True, index=output.index)
@@ -0,0 +1,84 @@
+"""Plan a catalog run before touching any rule logic.
+
+``run_all_cookbook_rules`` used to enter ``run_cookbook_rule`` for every catalog
+entry and let each rule rediscover, column by column, that it does not apply or
+that its roles are empty. The planner computes one non-null column bitset per
+equipment frame, then decides applicability and missing roles for the
+whole catalog in one pass. Only rules planned as ``RUN`` are evaluated.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+from open_fdd.rules import cookbook_catalog as cb
+
+RUN = "RUN"
+NOT_APPLICABLE = "NOT_APPLICABLE"
+MISSING_ROLES = "MISSING_ROLES"
+
+
+@dataclass(frozen=True)
+class ColumnPresence:
+    """Column bitsets for one frame: bit ``i`` is ``frame.columns[i]``.
+
+    ``non_null`` has the bits of columns with at least one non-null sample
+    (``frame[col].notna().any()``).
+    """
+
+    bits: dict[str, int]
+    non_null: int
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "ColumnPresence":
+        bits: dict[str, int] = {}
+        for i, col in enumerate(frame.columns):
+            bits.setdefault(col, 1 << i)
+        # One pass over the block values instead of a notna() scan per rule and role.
+        any_valid = frame.notna().any(axis=0).to_numpy(dtype=bool) if len(frame.columns) else np.zeros(0, bool)
+        non_null = 0
+        for i in np.flatnonzero(any_valid).tolist():
+            non_null |= 1 << i
+        return cls(bits, non_null)
+
+    def has(self, role: str) -> bool:
+        """Column exists and has at least one non-null sample."""
+        return bool(self.bits.get(role, 0) & self.non_null)
+
+    def missing(self, roles: Sequence[str]) -> list[str]:
+        """Roles (in order) that are absent or all-null."""
+        return [r for r in roles if not self.bits.get(r, 0) & self.non_null]
+
+
+@dataclass(frozen=True)
+class RulePlan:
+    """What ``run_all_cookbook_rules`` does with one catalog rule."""
+
+    rule: cb.CookbookRule
+    action: str
+    missing: tuple[str, ...] = ()
+
+
+def plan_rules(
+    rules: Iterable[cb.CookbookRule],
+    *,
+    equipment_kind: str,
+    missing_for: Callable[[cb.CookbookRule], list[str]],
+) -> list[RulePlan]:
+    """Applicability and missing roles for each rule, in catalog order.
+
+    ``missing_for`` is only called for rules that apply to ``equipment_kind``
+    (``"unknown"`` applies to every rule, as in ``run_cookbook_rule``).
+    """
+    plans = []
+    for rule in rules:
+        if equipment_kind != "unknown" and equipment_kind not in rule.equipment_kinds:
+            plans.append(RulePlan(rule, NOT_APPLICABLE))
+            continue
+        missing = missing_for(rule)
+        plans.append(RulePlan(rule, MISSING_ROLES, tuple(missing)) if missing else RulePlan(rule, RUN))
+    return plans
@@ -0,0 +1,98 @@
+"""Per-equipment prepared frame shared by every cookbook rule in one run.
+
+``run_all_cookbook_rules`` evaluates ~60 rules against the same merged frame.
+Each rule used to re-run ``assess_frame``, re-resolve fan/pump/compressor proof
+and rebuild the interval-duration vector. ``PreparedEquipment`` memoizes those
+per equipment; a rule pulls only the roles it needs.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from open_fdd.quality import (
+    DEFAULT_SENTINELS,
+    FrameQuality,
+    QualityCache,
+    RoleQuality,
+    frame_quality_from_roles,
+    normalize_role_series,
+)
+from open_fdd.rules.base import sample_deltas_seconds
+from open_fdd.rules.operational_gate import RUNNING_MASK_ROLES
+from open_fdd.rules.planner import ColumnPresence
+
+
+@dataclass
+class PreparedEquipment:
+    """Cached role quality, running masks, deltas, column presence and rolling blocks for one frame.
+
+    ``frame`` is treated as read-only for the lifetime of the context; build a new
+    context after changing its columns.
+    """
+
+    frame: pd.DataFrame
+    poll_seconds: float
+    sentinels: tuple[float, ...] = DEFAULT_SENTINELS
+    quality_cache: QualityCache | None = None
+    _role_quality: dict[str, RoleQuality] = field(default_factory=dict, repr=False)
+    _running: dict[tuple[str, ...], dict] = field(default_factory=dict, repr=False)
+    _deltas: np.ndarray | None = field(default=None, repr=False)
+    _deltas_ready: bool = field(default=False, repr=False)
+    _presence: ColumnPresence | None = field(default=None, repr=False)
+    _missing: dict[str, list[str]] = field(default_factory=dict, repr=False)
+    # ``rolling.shared_blocks`` memo: one RollingBlock per distinct rule input block.
+    rolling_blocks: dict = field(default_factory=dict, repr=False)
+
+    def role_quality(self, role: str) -> RoleQuality:
+        rq = self._role_quality.get(role)
+        if rq is None:
+            if self.quality_cache is not None:
+                rq = self.quality_cache.role_quality(self.frame[role], role, sentinels=self.sentinels)
+            else:
+                rq = normalize_role_series(self.frame[role], role, sentinels=self.sentinels)
+            self._role_quality[role] = rq
+        return rq
+
+    def assess(self, roles: Iterable[str]) -> FrameQuality:
+        """Same result as ``assess_frame(frame, roles)`` using cached roles."""
+        present = [r for r in roles if r in self.frame.columns]
+        return frame_quality_from_roles({r: self.role_quality(r) for r in present}, self.frame.index)
+
+    def running_cache(self, quality: FrameQuality) -> dict:
+        """Running-mask memo valid for a frame normalized with ``quality``.
+
+        Masks depend on whether their proof columns were normalized, so one memo
+        is kept per normalized subset of ``RUNNING_MASK_ROLES``.
+        """
+        key = tuple(r for r in RUNNING_MASK_ROLES if r in quality.roles)
+        return self._running.setdefault(key, {})
+
+    @property
+    def sample_deltas(self) -> np.ndarray | None:
+        """Per-sample forward durations (seconds) used by confirm/hours math."""
+        if not self._deltas_ready:
+            self._deltas = sample_deltas_seconds(self.frame.index, self.poll_seconds)
+            self._deltas_ready = True
+        return self._deltas
+
+    @property
+    def presence(self) -> ColumnPresence:
+        """Column presence / non-null bitsets (one ``notna`` pass over the frame)."""
+        if self._presence is None:
+            self._presence = ColumnPresence.from_frame(self.frame)
+        return self._presence
+
+    def missing_roles(self, rule) -> list[str]:
+        """Memoized ``runner._missing_roles`` answered from ``presence``."""
+        missing = self._missing.get(rule.id)
+        if missing is None:
+            from open_fdd.rules.runner import _missing_roles
+
+            missing = _missing_roles(rule, self.frame, self.presence.has)
+            self._missing[rule.id] = missing
+        return list(missing)
@@ -0,0 +1,273 @@
+"""Rolling-window min / max / sum / count over 2-D NumPy blocks.
+
+SV-FLATLINE, SV-STALE and PID-HUNT-1 all need trailing-window extremes and
+totals for several columns. ``rolling_stats`` evaluates every requested window
+and statistic for a whole ``(n, k)`` block at once instead of one pandas
+``rolling`` call per column and statistic:
+
+* min / max use a sparse table over power-of-two spans (``O(n k log w)``,
+  vectorized across rows and columns; NaN is skipped like pandas);
+* sum / count use prefix sums.
+
+Windows follow pandas semantics: an ``int`` covers the last ``w`` rows; a
+``Timedelta`` / offset string covers ``(t - w, t]`` on a sorted DatetimeIndex.
+
+``RollingBlock`` holds the window-independent part (float block, validity and
+sum prefixes, sparse-table levels), so any number of windows is answered from
+one scan of each column. Inside ``shared_blocks(memo)`` (the runner opens one
+per equipment) ``rolling_block`` hands every rule the same ``RollingBlock`` for
+the same data, so SV-FLATLINE and SV-STALE share it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+STATS: tuple[str, ...] = ("min", "max", "sum", "count")
+
+Window = int | str | pd.Timedelta
+
+# Lock-step row runs at least this long are copied with slices; above
+# ``_MAX_SLICE_RUNS`` such runs (very gappy data) everything is gathered.
+_MIN_SLICE_RUN = 32
+_MAX_SLICE_RUNS = 256
+
+
+def window_starts(n: int, window: Window, index: pd.Index | None = None) -> np.ndarray:
+    """First row of each row's trailing window (``int`` rows or time span)."""
+    rows = np.arange(n, dtype=np.int64)
+    if isinstance(window, (int, np.integer)):
+        if int(window) < 1:
+            raise ValueError("window must be >= 1 row")
+        return np.maximum(rows - (int(window) - 1), 0)
+    if not isinstance(index, pd.DatetimeIndex):
+        raise ValueError("time-based windows need a DatetimeIndex")
+    if not index.is_monotonic_increasing:
+        raise ValueError("index must be monotonic increasing")
+    span = pd.Timedelta(window)
+    if span <= pd.Timedelta(0):
+        raise ValueError("window must be positive")
+    times = index.asi8
+    ticks = int(span / pd.Timedelta(1, unit=getattr(index, "unit", None) or "ns"))
+    # pandas time windows are closed on the right: (t - w, t].
+    return np.searchsorted(times, times - ticks, side="right").astype(np.int64)
+
+
+def _slice_plan(rows: np.ndarray, src: np.ndarray) -> tuple[list[tuple[int, int]], np.ndarray]:
+    """Split ``out[rows] = f(src)`` into long lock-step runs and leftover positions.
+
+    Where both ``rows`` and ``src`` advance one row at a time (row windows, regular
+    timestamps) a run can be copied with slices instead of a fancy-index gather.
+    """
+    n = len(rows)
+    breaks = np.flatnonzero((np.diff(rows) != 1) | (np.diff(src) != 1)) + 1
+    begin = np.concatenate(([0], breaks))
+    end = np.concatenate((breaks, [n]))
+    long = (end - begin) >= _MIN_SLICE_RUN
+    if long.sum() > _MAX_SLICE_RUNS:
+        return [], np.arange(n)
+    rest = np.flatnonzero(np.repeat(~long, end - begin))
+    return list(zip(begin[long].tolist(), end[long].tolist())), rest
+
+
+def _take(a: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    """``a[idx]`` for row indices that mostly advance one at a time."""
+    runs, rest = _slice_plan(np.arange(len(idx)), idx)
+    out = np.empty((len(idx),) + a.shape[1:], dtype=a.dtype)
+    for b, e in runs:
+        out[b:e] = a[idx[b] : idx[b] + (e - b)]
+    out[rest] = a[idx[rest]]
+    return out
+
+
+def _range_reduce(levels: list[np.ndarray], starts: np.ndarray, ufunc: np.ufunc) -> np.ndarray:
+    """``out[i] = ufunc.reduce(x[starts[i] : i + 1])`` from sparse-table ``levels``.
+
+    ``levels[j][p] = reduce(x[p : p + 2**j])``; missing levels are appended.
+    """
+    x = levels[0]
+    n = len(x)
+    out = np.empty_like(x)
+    if n == 0:
+        return out
+    rows = np.arange(n, dtype=np.int64)
+    length = rows - starts + 1
+    level = np.frexp(length.astype(np.float64))[1] - 1  # floor(log2(length))
+    top = int(level.max())
+    while len(levels) <= top:
+        half = 1 << (len(levels) - 1)
+        prev = levels[-1]
+        levels.append(ufunc(prev[: len(prev) - half], prev[half:]))
+    for j in range(top + 1):
+        half = 1 << j
+        sel = np.flatnonzero(level == j)
+        if len(sel):
+            # Two overlapping 2**j spans cover [start, i]; min / max are idempotent.
+            table = levels[j]
+            lo, hi = starts[sel], sel - half + 1
+            runs, rest = _slice_plan(sel, lo)
+            for b, e in runs:
+                m = e - b
+                out[sel[b] : sel[b] + m] = ufunc(table[lo[b] : lo[b] + m], table[hi[b] : hi[b] + m])
+            r = sel[rest]
+            out[r] = ufunc(table[lo[rest]], table[hi[rest]])
+    return out
+
+
+def _prefix(x: np.ndarray) -> np.ndarray:
+    zero = np.zeros((1,) + x.shape[1:], dtype=x.dtype)
+    return np.concatenate((zero, np.cumsum(x, axis=0)))
+
+
+class RollingBlock:
+    """An ``(n, k)`` block prepared once for rolling stats over any windows.
+
+    Validity / sum prefixes and min / max sparse-table levels do not depend on
+    the window, so they are built on first use and kept; each further window
+    costs one query pass.
+    """
+
+    def __init__(self, values: np.ndarray | pd.DataFrame | pd.Series, index: pd.Index | None = None) -> None:
+        if isinstance(values, (pd.DataFrame, pd.Series)):
+            index = values.index if index is None else index
+            values = values.to_numpy(dtype=np.float64)
+        x = np.asarray(values, dtype=np.float64)
+        self.squeeze = x.ndim == 1
+        self.x = x[:, None] if self.squeeze else x
+        self.index = index
+        self.valid = ~np.isnan(self.x)
+        self.count_prefix = _prefix(self.valid.astype(np.int64))
+        self._sum_prefix: dict[tuple[int, ...], np.ndarray] = {}
+        self._levels: dict[tuple[str, tuple[int, ...]], list[np.ndarray]] = {}
+        self._starts: dict[Window, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def starts(self, window: Window) -> np.ndarray:
+        """``window_starts`` for this block's index (memoized per window)."""
+        starts = self._starts.get(window)
+        if starts is None:
+            starts = self._starts[window] = window_starts(len(self.x), window, self.index)
+        return starts
+
+    def stats(
+        self,
+        windows: Sequence[Window],
+        *,
+        stats: Iterable[str] | Mapping[str, Sequence[int]] = STATS,
+        min_periods: int | None = None,
+    ) -> dict[Window, dict[str, np.ndarray]]:
+        """Same result as ``rolling_stats`` on this block."""
+        x = self.x
+        all_cols = list(range(x.shape[1]))
+        if isinstance(stats, Mapping):
+            cols_by_stat = {stat: list(cols) for stat, cols in stats.items()}
+        else:
+            cols_by_stat = {stat: all_cols for stat in stats}
+        unknown = set(cols_by_stat) - set(STATS)
+        if unknown:
+            raise ValueError(f"unknown rolling stats: {sorted(unknown)}")
+
+        out: dict[Window, dict[str, np.ndarray]] = {}
+        for window in windows:
+            starts = self.starts(window)
+            count = self.count_prefix[1:] - _take(self.count_prefix, starts)
+            if min_periods is not None:
+                need = int(min_periods)
+            else:
+                need = int(window) if isinstance(window, (int, np.integer)) else 1
+            enough = count >= need
+            res: dict[str, np.ndarray] = {}
+            for stat, cols in cols_by_stat.items():
+                full = cols == all_cols
+                if stat == "count":
+                    part = count.astype(np.float64) if full else count[:, cols].astype(np.float64)
+                elif stat == "sum":
+                    prefix = self._sum(cols)
+                    part = prefix[1:] - _take(prefix, starts)
+                else:
+                    with np.errstate(invalid="ignore"):
+                        part = _range_reduce(self._table(stat, cols), starts, np.fmin if stat == "min" else np.fmax)
+                if stat != "count":
+                    part[~(enough if full else enough[:, cols])] = np.nan
+                if full:
+                    val = part
+                else:
+                    val = np.full(x.shape, np.nan)
+                    val[:, cols] = part
+                res[stat] = val[:, 0] if self.squeeze else val
+            out[window] = res
+        return out
+
+    def _sum(self, cols: list[int]) -> np.ndarray:
+        key = tuple(cols)
+        prefix = self._sum_prefix.get(key)
+        if prefix is None:
+            prefix = self._sum_prefix[key] = _prefix(np.where(self.valid, self.x, 0.0)[:, cols])
+        return prefix
+
+    def _table(self, stat: str, cols: list[int]) -> list[np.ndarray]:
+        key = (stat, tuple(cols))
+        levels = self._levels.get(key)
+        if levels is None:
+            base = self.x if len(cols) == self.x.shape[1] else self.x[:, cols]
+            levels = self._levels[key] = [base]
+        return levels
+
+
+def rolling_stats(
+    values: np.ndarray | pd.DataFrame | pd.Series,
+    windows: Sequence[Window],
+    *,
+    index: pd.Index | None = None,
+    stats: Iterable[str] | Mapping[str, Sequence[int]] = STATS,
+    min_periods: int | None = None,
+) -> dict[Window, dict[str, np.ndarray]]:
+    """``{window: {stat: array}}`` for every column of ``values``.
+
+    Arrays keep the shape of ``values`` (``(n,)`` or ``(n, k)``). ``count`` is the
+    number of non-NaN samples in the window; other stats are NaN where that count
+    is below ``min_periods`` (pandas default: the row count for ``int`` windows,
+    1 for time windows). A ``{stat: column positions}`` mapping restricts a stat to
+    those columns of a 2-D block (the others are left NaN).
+    """
+    return RollingBlock(values, index).stats(windows, stats=stats, min_periods=min_periods)
+
+
+_SHARED_BLOCKS: ContextVar[dict | None] = ContextVar("open_fdd_rolling_blocks", default=None)
+
+
+@contextmanager
+def shared_blocks(memo: dict) -> Iterator[dict]:
+    """Let ``rolling_block`` reuse blocks from ``memo`` (one per equipment run)."""
+    token = _SHARED_BLOCKS.set(memo)
+    try:
+        yield memo
+    finally:
+        _SHARED_BLOCKS.reset(token)
+
+
+def rolling_block(frame: pd.DataFrame) -> RollingBlock:
+    """``RollingBlock`` of ``frame``, shared inside ``shared_blocks`` for the same data.
+
+    The key is the column names, the index object and a digest of the values, so
+    rules that normalized a column differently get their own block.
+    """
+    values = frame.to_numpy(dtype=np.float64)
+    memo = _SHARED_BLOCKS.get()
+    if memo is None:
+        return RollingBlock(values, frame.index)
+    digest = hashlib.blake2b(np.ascontiguousarray(values).view(np.uint8), digest_size=16).digest()
+    key = (tuple(frame.columns), id(frame.index), values.shape, digest)
+    block = memo.get(key)
+    # The block holds its index, so the id() in the key cannot be reused meanwhile.
+    if block is None or block.index is not frame.index:
+        block = memo[key] = RollingBlock(values, frame.index)
+    return block
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 import pandas as pd
 
+from open_fdd.quality import QualityCache
 from open_fdd.rules import cookbook_catalog as cb
 from open_fdd.rules.base import (
+    RuleCarry,
     RuleResult,
     confirm_fault,
     equipment_off,
@@ -19,6 +21,10 @@ from open_fdd.rules.base import (
     skipped,
 )
 from open_fdd.rules.operational_gate import RULE_GATES, resolve_operational_mask, should_skip_equipment_off
+from open_fdd.rules.planner import MISSING_ROLES, NOT_APPLICABLE, RUN, RulePlan, plan_rules
+from open_fdd.rules.prepared import PreparedEquipment
+from open_fdd.rules.rolling import shared_blocks
+from open_fdd.storage import overlay_frame, upcast_float32
 from open_fdd.analytics.site_model import equipment_type_from_id, resolve_equipment_type
 
 
@@ -54,30 +60,37 @@ def merge_weather(df: pd.DataFrame, weather: pd.DataFrame | None) -> pd.DataFram
     """Align/enrich web weather onto an equipment frame, then resolve effective OAT.
 
     Adds ``oa_t_effective`` / ``oa_t_effective_source`` / optional ``bas_oa_t`` before
-    missing-role checks. Never overwrites a real BAS ``oa_t`` column.
+    missing-role checks. Never overwrites a real BAS ``oa_t`` column. float32-stored
+    columns (``open_fdd.storage``) are widened to float64 in the working copy.
     """
     from open_fdd.analytics.weather_psychrometrics import dewpoint_f_from_db_rh, enrich_weather_frame, wetbulb_f_stull
     from open_fdd.analytics.weather_resolver import apply_effective_oat_columns
 
-    out = df.copy()
+    out = upcast_float32(df)
+    added: dict[str, pd.Series] = {}
     if weather is not None and not weather.empty:
         wx = enrich_weather_frame(weather).reindex(out.index)
         for col in wx.columns:
             if col not in out.columns:
-                out[col] = wx[col]
+                added[col] = wx[col]
             elif col.startswith("wx_") and out[col].notna().sum() == 0:
-                out[col] = wx[col]
+                added[col] = wx[col]
+    # Overlay, not copy: the equipment columns are shared with ``df``.
+    out = overlay_frame(out, added)
     # Derive dewpoint / wet-bulb on the equipment frame when RH landed
+    derived: dict[str, pd.Series] = {}
     if ("web-outside-air-dewpoint" not in out.columns or out["web-outside-air-dewpoint"].notna().sum() == 0) and {
         "web-outside-air-temp",
         "web-outside-air-humidity",
     }.issubset(out.columns):
-        out["web-outside-air-dewpoint"] = dewpoint_f_from_db_rh(out["web-outside-air-temp"], out["web-outside-air-humidity"])
+        derived["web-outside-air-dewpoint"] = dewpoint_f_from_db_rh(out["web-outside-air-temp"], out["web-outside-air-humidity"])
     if ("web-outside-air-wetbulb" not in out.columns or out["web-outside-air-wetbulb"].notna().sum() == 0) and {
         "web-outside-air-temp",
         "web-outside-air-humidity",
     }.issubset(out.columns):
-        out["web-outside-air-wetbulb"] = wetbulb_f_stull(out["web-outside-air-temp"], out["web-outside-air-humidity"])
+        derived["web-outside-air-wetbulb"] = wetbulb_f_stull(out["web-outside-air-temp"], out["web-outside-air-humidity"])
+    if derived:
+        out = overlay_frame(out, derived)
     return apply_effective_oat_columns(out)
 
 
@@ -103,29 +116,45 @@ def _confirm_seconds(rule: cb.CookbookRule, params: dict) -> float:
     return rule.confirm_seconds
 
 
-def _missing_roles(rule: cb.CookbookRule, df: pd.DataFrame) -> list[str]:
+def _missing_roles(
+    rule: cb.CookbookRule,
+    df: pd.DataFrame,
+    has: Callable[[str], bool] | None = None,
+) -> list[str]:
+    """Required roles absent or all-null in ``df``.
+
+    ``has(role)`` answers "column present with any non-null sample"; pass
+    ``ColumnPresence.has`` to use precomputed bitsets instead of column scans
+    (weather checks included). Mechanical-proof and control-output checks read
+    values and still scan ``df``.
+    """
     from open_fdd.analytics.weather_resolver import oat_meteo_availability
 
+    if has is None:
+
+        def has(role: str) -> bool:
+            return role in df.columns and bool(df[role].notna().any())
+
     if rule.id == "OAT-METEO":
-        ok, reasons = oat_meteo_availability(df)
+        ok, reasons = oat_meteo_availability(df, has)
         return [] if ok else reasons
     if rule.id == "ECON-3":
         from open_fdd.rules.economizer_weather import web_weather_missing_reasons
 
-        missing_wx = web_weather_missing_reasons(df)
+        missing_wx = web_weather_missing_reasons(df, has)
         base = []
         for role in ("outside-air-damper", "cooling-valve"):
-            if role not in df.columns or df[role].notna().sum() == 0:
+            if not has(role):
                 base.append(role)
         return base + missing_wx
     if rule.id == "ECON-7":
         from open_fdd.rules.economizer_weather import mechanical_proof_mask, web_weather_missing_reasons
 
-        missing_wx = web_weather_missing_reasons(df)
+        missing_wx = web_weather_missing_reasons(df, has)
         base = []
-        if "outside-air-damper" not in df.columns or df["outside-air-damper"].notna().sum() == 0:
+        if not has("outside-air-damper"):
             base.append("outside-air-damper")
-        has_demand = "cooling-valve" in df.columns and df["cooling-valve"].notna().any()
+        has_demand = has("cooling-valve")
         if not has_demand:
             _, kind = mechanical_proof_mask(df)
             has_demand = bool(kind)
@@ -133,10 +162,10 @@ def _missing_roles(rule: cb.CookbookRule, df: pd.DataFrame) -> list[str]:
             base.append("cooling-valve|dx_or_chiller_proof")
         return base + missing_wx
     if rule.id in {"MECH-OAT-1", "ECON-6"}:
-        if "web-outside-air-temp" not in df.columns or not df["web-outside-air-temp"].notna().any():
+        if not has("web-outside-air-temp"):
             return ["web-outside-air-temp"]
         if rule.id == "ECON-6":
-            if "outside-air-damper" not in df.columns or not df["outside-air-damper"].notna().any():
+            if not has("outside-air-damper"):
                 return ["outside-air-damper"]
         return []
     if rule.id == "CHW-NOLOAD-1":
@@ -146,8 +175,8 @@ def _missing_roles(rule: cb.CookbookRule, df: pd.DataFrame) -> list[str]:
         run, kind = mechanical_proof_mask(df, equipment_type="CHILLER")
         if not kind:
             return ["chiller_or_pump_proof"]
-        has_zone = ZONE_SAT_COL in df.columns and df[ZONE_SAT_COL].notna().any()
-        has_ahu = AHU_SAT_COL in df.columns and df[AHU_SAT_COL].notna().any()
+        has_zone = has(ZONE_SAT_COL)
+        has_ahu = has(AHU_SAT_COL)
         if not has_zone and not has_ahu:
             return ["building-zone-load-satisfied|building-ahu-load-satisfied"]
         return []
@@ -167,11 +196,11 @@ def _missing_roles(rule: cb.CookbookRule, df: pd.DataFrame) -> list[str]:
             "duct-static-pressure",
             "chw-diff-pressure",
         )
-        if any(r in df.columns and df[r].notna().any() for r in proofs):
+        if any(has(r) for r in proofs):
             return []
         return ["fan_or_pump_status_or_cmd_or_pressure"]
     if rule.sensor_sweep:
-        present = [r for r in cb.SWEEP_SENSOR_ROLES if r in df.columns and df[r].notna().any()]
+        present = [r for r in cb.SWEEP_SENSOR_ROLES if has(r)]
         return [] if present else ["any sensor role from sweep list"]
     if rule.control_output_sweep:
         from open_fdd.rules.pid_hunting import control_outputs_present
@@ -181,27 +210,18 @@ def _missing_roles(rule: cb.CookbookRule, df: pd.DataFrame) -> list[str]:
     for role in rule.required_roles:
         if role == "outside-air-temp":
             # Physics rules may use oa_t_effective (web primary / BAS fallback)
-            if "outside-air-temp" in df.columns and df["outside-air-temp"].notna().any():
+            if has("outside-air-temp"):
                 continue
-            if "oa_t_effective" in df.columns and df["oa_t_effective"].notna().any():
+            if has("oa_t_effective"):
                 continue
             missing.append(role)
             continue
-        if role == "web-outside-air-temp":
-            if role not in df.columns or df[role].notna().sum() == 0:
-                missing.append(role)
-            continue
-        if role not in df.columns or df[role].notna().sum() == 0:
+        if not has(role):
             missing.append(role)
-    if rule.id in {"CW-OPT-1", "CW-APR-1", "CW-FAN-1"} and (
-        "web-outside-air-wetbulb" not in df.columns or df["web-outside-air-wetbulb"].notna().sum() == 0
-    ):
+    if rule.id in {"CW-OPT-1", "CW-APR-1", "CW-FAN-1"} and not has("web-outside-air-wetbulb"):
         missing.append("web-outside-air-wetbulb")
     if rule.id in {"CW-APR-1", "CW-FAN-1"}:
-        fan_ok = any(
-            r in df.columns and df[r].notna().any()
-            for r in ("tower-fan-cmd", "cw-fan-cmd", "fan-cmd")
-        )
+        fan_ok = any(has(r) for r in ("tower-fan-cmd", "cw-fan-cmd", "fan-cmd"))
         if not fan_ok:
             missing.append("tower_fan_cmd|cw_fan_cmd|fan_cmd")
     return missing
@@ -376,6 +396,46 @@ def _ctx_from_df(df: pd.DataFrame, equipment_id: str, equipment_type: str) -> tu
     return site_id, building_id, eq_type
 
 
+def _skip_result(
+    plan: RulePlan,
+    equipment_id: str,
+    equipment_kind: str,
+    params_by_rule: dict[str, dict],
+    *,
+    site_id: str,
+    building_id: str,
+    equipment_type: str,
+    require_operational_gates: bool,
+) -> RuleResult:
+    """NOT_APPLICABLE / SKIPPED_MISSING_ROLES result for a planned skip (no frame access)."""
+    rule = plan.rule
+    if plan.action == NOT_APPLICABLE:
+        return not_applicable(
+            rule.id,
+            equipment_id,
+            equipment_kind,
+            site_id=site_id,
+            building_id=building_id,
+            equipment_type=equipment_type,
+        )
+    missing = list(plan.missing)
+    notes = ""
+    if rule.id == "OAT-METEO":
+        notes = "SKIPPED — OAT-METEO requires both BAS oa_t and web wx_oa_t: " + "; ".join(missing)
+    # Fingerprint after params resolve; still stamp skips that happen after params exist.
+    pre_params = _params_for_rule(rule, params_by_rule)
+    return skipped(
+        rule.id,
+        equipment_id,
+        missing,
+        notes=notes,
+        site_id=site_id,
+        building_id=building_id,
+        equipment_type=equipment_type,
+        params_fingerprint=params_fingerprint(rule.id, pre_params, gates_on=require_operational_gates),
+    )
+
+
 def run_cookbook_rule(
     rule: cb.CookbookRule,
     df: pd.DataFrame,
@@ -390,7 +450,23 @@ def run_cookbook_rule(
     equipment_type: str = "",
     require_operational_gates: bool = True,
     skip_weather_merge: bool = False,
+    prepared: PreparedEquipment | None = None,
+    compact: bool = False,
+    carry: RuleCarry | None = None,
+    new_from: int = 0,
 ) -> RuleResult:
+    """Evaluate one rule for one equipment frame.
+
+    ``prepared`` (built once per equipment by ``run_all_cookbook_rules``) supplies
+    the already-merged frame plus cached role quality, running masks and sample
+    deltas; ``df`` / ``weather`` are then only used for attrs.
+
+    ``compact=True`` returns ``RuleResult.compact()`` results: fault masks as
+    run-length intervals and plot series as references into the evaluated frame.
+
+    ``carry`` / ``new_from`` are forwarded to ``finalize_result`` for append-only
+    evaluation (``open_fdd.rules.incremental``).
+    """
     params_by_rule = params_by_rule or {}
     eq_type = equipment_type or equipment_type_from_id(equipment_id)
     sid, bid, _ = _ctx_from_df(df, equipment_id, eq_type)
@@ -398,42 +474,39 @@ def run_cookbook_rule(
     bid = building_id or bid
 
     if equipment_kind != "unknown" and equipment_kind not in rule.equipment_kinds:
-        return not_applicable(
-            rule.id,
+        return _skip_result(
+            RulePlan(rule, NOT_APPLICABLE),
             equipment_id,
             equipment_kind,
+            params_by_rule,
             site_id=sid,
             building_id=bid,
             equipment_type=eq_type,
+            require_operational_gates=require_operational_gates,
         )
 
     from open_fdd.analytics.weather_resolver import inject_oa_t_for_physics, weather_source_metrics
 
-    if skip_weather_merge:
-        d = df
+    if prepared is not None:
+        d = prepared.frame
+    elif skip_weather_merge:
+        d = upcast_float32(df)
     else:
         d = merge_weather(df, weather)
         # OAT-METEO needs both real sources — never inject web into oa_t for the compare.
         if rule.id != "OAT-METEO":
             d = inject_oa_t_for_physics(d)
-    # Fingerprint after params resolve; still stamp skips that happen after params exist.
-    missing = _missing_roles(rule, d)
+    missing = prepared.missing_roles(rule) if prepared is not None else _missing_roles(rule, d)
     if missing:
-        notes = ""
-        if rule.id == "OAT-METEO":
-            notes = "SKIPPED — OAT-METEO requires both BAS oa_t and web wx_oa_t: " + "; ".join(missing)
-        pre_params = _params_for_rule(rule, params_by_rule)
-        return skipped(
-            rule.id,
+        return _skip_result(
+            RulePlan(rule, MISSING_ROLES, tuple(missing)),
             equipment_id,
-            missing,
-            notes=notes,
+            equipment_kind,
+            params_by_rule,
             site_id=sid,
             building_id=bid,
             equipment_type=eq_type,
-            params_fingerprint=params_fingerprint(
-                rule.id, pre_params, gates_on=require_operational_gates
-            ),
+            require_operational_gates=require_operational_gates,
         )
 
     params = _params_for_rule(rule, params_by_rule)
@@ -458,7 +531,15 @@ def run_cookbook_rule(
     q_roles.extend(PUMP_CMD_FALLBACK)
     q_roles.extend(COMPRESSOR_ROLES)
     q_roles = list(dict.fromkeys(q_roles))
-    quality = assess_frame(d, [r for r in q_roles if r in d.columns])
+    present_roles = [r for r in q_roles if r in d.columns]
+    if prepared is not None:
+        quality = prepared.assess(present_roles)
+        running_cache = prepared.running_cache(quality)
+        deltas = prepared.sample_deltas
+    else:
+        quality = assess_frame(d, present_roles)
+        running_cache = None
+        deltas = None
     min_cov = float(params.get("min_valid_coverage", 0.5))
     req_cov = [
         quality.roles[r].valid_coverage
@@ -486,6 +567,7 @@ def run_cookbook_rule(
             poll_seconds=poll_seconds,
             params=params,
             gate_enabled=require_operational_gates,
+            running_cache=running_cache,
         )
         if gate_meta.get("missing_proof"):
             return skipped(
@@ -501,7 +583,10 @@ def run_cookbook_rule(
                 equipment_type=eq_type,
                 params_fingerprint=fp,
             )
-        if should_skip_equipment_off(gate_meta, params, spec):
+        # Append-only runs judge coverage over all carried rows, not just this window:
+        # once anything was proven on, keep integrating instead of skipping.
+        carried = carry is not None and (carry.active_samples > 0 or int(gate_meta.get("active_sample_count") or 0) > 0)
+        if not carried and should_skip_equipment_off(gate_meta, params, spec):
             return equipment_off(
                 rule.id,
                 equipment_id,
@@ -516,16 +601,25 @@ def run_cookbook_rule(
                 params_fingerprint=fp,
             )
 
+        compute_params = params
+        if carry is not None and rule.carry_share_param:
+            # Whole-window share: the carry judges the cumulative share, so the
+            # window itself reports every proven sample.
+            carry.share_threshold = float(params[rule.carry_share_param])
+            compute_params = {**params, rule.carry_share_param: 0.0}
         if rule.id == "ECON-3":
             raw = econ3_compute(d, params, poll_seconds, wx_ok)
         elif rule.id == "OAT-METEO":
             # Compare real BAS vs web — restore bas_oa_t into oa_t if needed
             if "bas-outside-air-temp" in d.columns and d["bas-outside-air-temp"].notna().any():
-                d = d.copy()
-                d["outside-air-temp"] = d["bas-outside-air-temp"]
+                d = overlay_frame(d, {"outside-air-temp": d["bas-outside-air-temp"]})
             raw = rule.compute(d, params, poll_seconds)
+        elif prepared is not None:
+            # Rolling blocks (sensor sweeps) are shared by every rule on this equipment.
+            with shared_blocks(prepared.rolling_blocks):
+                raw = rule.compute(d, compute_params, poll_seconds)
         else:
-            raw = rule.compute(d, params, poll_seconds)
+            raw = rule.compute(d, compute_params, poll_seconds)
         raw = raw.reindex(d.index).fillna(False).astype(bool)
         metrics: dict[str, Any] = {**dict(gate_meta), **weather_source_metrics(d)}
         metrics["quality"] = quality.summary()
@@ -565,7 +659,9 @@ def run_cookbook_rule(
                 rr = role_raw.reindex(d.index).fillna(False).astype(bool)
                 if active_for_roles is not None:
                     rr = rr & active_for_roles.reindex(d.index).fillna(False).astype(bool)
-                role_conf = confirm_fault(rr, poll_seconds=poll_seconds, confirm_seconds=confirm_s)
+                role_conf = confirm_fault(
+                    rr, poll_seconds=poll_seconds, confirm_seconds=confirm_s, deltas=deltas
+                )
                 role_confirmed[role] = role_conf
                 n_fault = int(role_conf.sum())
                 first_ts = last_ts = None
@@ -577,7 +673,9 @@ def run_cookbook_rule(
                         "role": role,
                         "sensor_type": cb.sensor_type_for_role(role),
                         "fault_samples": n_fault,
-                        "fault_hours": round(hours_true(role_conf, poll_seconds), 3) if n_fault else 0.0,
+                        "fault_hours": (
+                            round(hours_true(role_conf, poll_seconds, deltas=deltas), 3) if n_fault else 0.0
+                        ),
                         "first_fault_timestamp": first_ts,
                         "last_fault_timestamp": last_ts,
                         "faulted": n_fault > 0,
@@ -599,7 +697,7 @@ def run_cookbook_rule(
         ):
             if d.attrs.get(attr_key):
                 metrics[metric_key] = d.attrs[attr_key]
-        return finalize_result(
+        result = finalize_result(
             rule.id,
             equipment_id,
             raw,
@@ -612,7 +710,11 @@ def run_cookbook_rule(
             plot_series=_plot_series_for_rule(rule, d),
             active_mask=active if use_active else None,
             params_fingerprint=fp,
+            deltas=deltas,
+            carry=carry,
+            new_from=new_from,
         )
+        return result.compact(d) if compact else result
     except Exception as exc:
         return error_result(
             rule.id,
@@ -636,6 +738,10 @@ def run_all_cookbook_rules(
     building_id: str = "",
     equipment_type: str = "",
     require_operational_gates: bool = True,
+    compact: bool = False,
+    carry_by_rule: dict[str, RuleCarry] | None = None,
+    new_from: int = 0,
+    quality_cache: QualityCache | None = None,
 ) -> list[RuleResult]:
     from open_fdd.analytics.weather_resolver import inject_oa_t_for_physics
 
@@ -646,23 +752,98 @@ def run_all_cookbook_rules(
     # Merge weather once per equipment (not once per rule).
     d_merged = merge_weather(df, weather)
     d_physics = inject_oa_t_for_physics(d_merged)
-    return [
-        run_cookbook_rule(
-            rule,
-            d_merged if rule.id == "OAT-METEO" else d_physics,
-            equipment_id=equipment_id,
-            equipment_kind=kind,
-            poll_seconds=poll_seconds,
-            params_by_rule=params_by_rule,
-            weather=None,
-            site_id=site_id,
-            building_id=building_id,
-            equipment_type=eq_type,
-            require_operational_gates=require_operational_gates,
-            skip_weather_merge=True,
+    # Quality, running masks and sample deltas are computed lazily and shared by every rule.
+    # ``quality_cache`` lets back-to-back runs over the same frames reuse role quality.
+    prep_merged = PreparedEquipment(d_merged, poll_seconds, quality_cache=quality_cache)
+    prep_physics = PreparedEquipment(d_physics, poll_seconds, quality_cache=quality_cache)
+
+    def prepared_for(rule: cb.CookbookRule) -> PreparedEquipment:
+        return prep_merged if rule.id == "OAT-METEO" else prep_physics
+
+    # Plan the whole catalog from column bitsets; only RUN rules touch the data.
+    plans = plan_rules(
+        RULES,  # canonical + CUSTOM-* (assigned below via active_rules)
+        equipment_kind=kind,
+        missing_for=lambda rule: prepared_for(rule).missing_roles(rule),
+    )
+    results = []
+    for plan in plans:
+        rule = plan.rule
+        if plan.action != RUN:
+            sid, bid, _ = _ctx_from_df(prepared_for(rule).frame, equipment_id, eq_type)
+            results.append(
+                _skip_result(
+                    plan,
+                    equipment_id,
+                    kind,
+                    params_by_rule or {},
+                    site_id=site_id or sid,
+                    building_id=building_id or bid,
+                    equipment_type=eq_type,
+                    require_operational_gates=require_operational_gates,
+                )
+            )
+            continue
+        results.append(
+            run_cookbook_rule(
+                rule,
+                prepared_for(rule).frame,
+                equipment_id=equipment_id,
+                equipment_kind=kind,
+                poll_seconds=poll_seconds,
+                params_by_rule=params_by_rule,
+                weather=None,
+                site_id=site_id,
+                building_id=building_id,
+                equipment_type=eq_type,
+                require_operational_gates=require_operational_gates,
+                skip_weather_merge=True,
+                prepared=prepared_for(rule),
+                compact=compact,
+                carry=None if carry_by_rule is None else carry_by_rule.setdefault(rule.id, RuleCarry()),
+                new_from=new_from,
+            )
         )
-        for rule in RULES  # canonical + CUSTOM-* (assigned below via active_rules)
-    ]
+    return results
+
+
+def _run_mapped_equipment(
+    eq_id: str,
+    raw_df: pd.DataFrame,
+    params_by_rule: dict[str, dict] | None,
+    weather: pd.DataFrame | None,
+    compact: bool = False,
+    quality_cache: QualityCache | None = None,
+) -> list[RuleResult]:
+    """Role-map one equipment frame and run the full catalog (``run_batch`` worker unit).
+
+    Module-level so ``run_batch(executor="process")`` can pickle it.
+    """
+    from open_fdd.analytics.role_map import apply_role_map
+
+    sid = str(raw_df.attrs.get("site_id", ""))
+    bid = str(raw_df.attrs.get("building_id", ""))
+    role_map = raw_df.attrs.get("_role_map") or {}
+    mapped = apply_role_map(raw_df, eq_id, role_map)
+    mapped.attrs.update(raw_df.attrs)
+    mapped.attrs["equipment_id"] = eq_id
+    # Preserve topology-enriched ahu_sat if apply_role_map dropped it
+    if "ahu-discharge-air-temp" in raw_df.columns and "ahu-discharge-air-temp" not in mapped.columns:
+        mapped["ahu-discharge-air-temp"] = raw_df["ahu-discharge-air-temp"]
+    poll = float(raw_df.attrs.get("poll_seconds") or 300.0)
+    eq_type = resolve_equipment_type(eq_id, df=raw_df, role_map=role_map)
+    return run_all_cookbook_rules(
+        mapped,
+        equipment_id=eq_id,
+        poll_seconds=poll,
+        params_by_rule=params_by_rule,
+        weather=weather,
+        site_id=sid,
+        building_id=bid,
+        equipment_type=eq_type,
+        compact=compact,
+        quality_cache=quality_cache,
+    )
 
 
 def run_batch(
@@ -674,10 +855,30 @@ def run_batch(
     building_filter: str | None = None,
     site_filter: str | None = None,
     vav_to_ahu: dict[str, str] | None = None,
+    workers: int | None = None,
+    executor: str = "process",
+    compact: bool = False,
+    quality_cache: QualityCache | None = None,
 ) -> list[RuleResult]:
-    """Run all cookbook rules for each equipment in scope — no silent omission."""
+    """Run all cookbook rules for each equipment in scope — no silent omission.
+
+    ``workers`` > 1 fans equipment out over a ``concurrent.futures`` pool
+    (``executor="process"`` or ``"thread"``). Topology enrichment and building
+    load satisfaction always run first in the parent, and results keep the
+    serial order (equipment id sorted, then catalog order).
+
+    ``compact=True`` keeps fault masks as run-length intervals and plot series as
+    frame references (see ``RuleResult.compact``) to bound memory on large batches.
+
+    ``quality_cache`` (e.g. ``open_fdd.quality.QUALITY_CACHE``) is shared by the
+    serial and thread paths so later batches over the same frames reuse role
+    quality; process workers cannot share it and run uncached.
+    """
     from open_fdd.analytics.load_satisfaction import aggregate_load_satisfaction
 
+    if executor not in {"process", "thread"}:
+        raise ValueError(f"executor must be process or thread, got {executor!r}")
+
     # Optional topology: copy parent AHU SAT onto VAV frames as ahu_sat
     rm: dict = {}
     for eq_id, raw_df in equipment_frames.items():
@@ -733,7 +934,7 @@ def run_batch(
         sat_band_f=sat_band,
     )
 
-    results: list[RuleResult] = []
+    jobs: list[tuple[str, pd.DataFrame]] = []
     for eq_id, raw_df in sorted(equipment_frames.items()):
         if equipment_filter is not None and eq_id not in equipment_filter:
             continue
@@ -743,29 +944,30 @@ def run_batch(
             continue
         if building_filter and bid and bid != building_filter:
             continue
-        from open_fdd.analytics.role_map import apply_role_map
-
-        role_map = raw_df.attrs.get("_role_map") or {}
-        mapped = apply_role_map(raw_df, eq_id, role_map)
-        mapped.attrs.update(raw_df.attrs)
-        mapped.attrs["equipment_id"] = eq_id
-        # Preserve topology-enriched ahu_sat if apply_role_map dropped it
-        if "ahu-discharge-air-temp" in raw_df.columns and "ahu-discharge-air-temp" not in mapped.columns:
-            mapped["ahu-discharge-air-temp"] = raw_df["ahu-discharge-air-temp"]
-        poll = float(raw_df.attrs.get("poll_seconds") or 300.0)
-        eq_type = resolve_equipment_type(eq_id, df=raw_df, role_map=role_map)
-        results.extend(
-            run_all_cookbook_rules(
-                mapped,
-                equipment_id=eq_id,
-                poll_seconds=poll,
-                params_by_rule=params_by_rule,
-                weather=weather,
-                site_id=sid,
-                building_id=bid,
-                equipment_type=eq_type,
-            )
-        )
+        jobs.append((eq_id, raw_df))
+
+    results: list[RuleResult] = []
+    n_workers = min(int(workers or 1), len(jobs))
+    if n_workers <= 1:
+        for eq_id, raw_df in jobs:
+            results.extend(_run_mapped_equipment(eq_id, raw_df, params_by_rule, weather, compact, quality_cache))
+        return results
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    pool_cls = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    with pool_cls(max_workers=n_workers) as pool:
+        # map() yields in submission order, so output matches the serial path.
+        for batch in pool.map(
+            _run_mapped_equipment,
+            [eq_id for eq_id, _ in jobs],
+            [raw_df for _, raw_df in jobs],
+            [params_by_rule] * len(jobs),
+            [weather] * len(jobs),
+            [compact] * len(jobs),
+            [quality_cache if executor == "thread" else None] * len(jobs),
+        ):
+            results.extend(batch)
     return results
 
 
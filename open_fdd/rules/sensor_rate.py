@@ -30,6 +30,20 @@ OperatingState = Literal[
 
 IntervalClass = Literal["STEADY", "TRANSIENT", "OFF", "UNKNOWN_STATE", "INSUFFICIENT_DATA"]
 
+# Per-sample states are stored as int8 codes into this table (a pandas Categorical
+# with these categories). Alphabetical order keeps the dominant-state tie-break
+# identical to ``Series.mode()`` on the state strings.
+STATE_NAMES: tuple[str, ...] = (
+    "OFF",
+    "RUNNING_STEADY",
+    "SHUTDOWN_TRANSIENT",
+    "STARTUP_TRANSIENT",
+    "UNKNOWN_STATE",
+)
+STATE_CODES: dict[str, int] = {name: code for code, name in enumerate(STATE_NAMES)}
+_OFF, _STEADY, _SHUTDOWN, _STARTUP, _UNKNOWN = (np.int8(STATE_CODES[n]) for n in STATE_NAMES)
+_TRANSIENT_BY_CODE = np.array([name.endswith("_TRANSIENT") for name in STATE_NAMES])
+
 RATEABLE_ROLES: tuple[str, ...] = tuple(ROLE_TO_PROFILE.keys())
 MAX_GAP_HOURS_DEFAULT = 2.0
 # Noise deadband profiles (e.g. CO2 100 ppm) are authored for ~5-minute samples.
@@ -92,7 +106,10 @@ def detect_operating_state(
     *,
     transition_window_minutes: int = 20,
 ) -> tuple[pd.Series, dict[str, Any]]:
-    """Classify each sample. Missing proofs → UNKNOWN_STATE + reduced confidence."""
+    """Classify each sample. Missing proofs → UNKNOWN_STATE + reduced confidence.
+
+    Returns a categorical Series over ``STATE_NAMES`` (int8 codes via ``.cat.codes``).
+    """
     idx = d.index
     meta: dict[str, Any] = {"confidence": "high", "transition_count": 0, "signals_used": []}
     on = pd.Series(False, index=idx)
@@ -129,27 +146,44 @@ def detect_operating_state(
 
     if not used:
         meta["confidence"] = "reduced"
-        return pd.Series("UNKNOWN_STATE", index=idx, dtype=object), meta
+        return _state_series(np.full(len(idx), _UNKNOWN, dtype=np.int8), idx), meta
 
     on_b = on.fillna(False).astype(bool)
     started = on_b & ~on_b.shift(1, fill_value=False)
     stopped = (~on_b) & on_b.shift(1, fill_value=False)
     meta["transition_count"] = int(started.sum() + stopped.sum() + int(cmd_change.sum()))
 
-    state_arr = np.where(on_b.to_numpy(), "RUNNING_STEADY", "OFF").astype(object)
+    codes = np.where(on_b.to_numpy(), _STEADY, _OFF).astype(np.int8)
 
     if isinstance(idx, pd.DatetimeIndex) and len(idx):
         win = pd.Timedelta(minutes=max(1, transition_window_minutes))
         start_win = _mark_forward_windows(idx, started, win)
         stop_win = _mark_forward_windows(idx, stopped, win)
         cmd_win = _mark_forward_windows(idx, cmd_change, win)
-        state_arr = np.where(start_win, "STARTUP_TRANSIENT", state_arr)
-        state_arr = np.where(stop_win, "SHUTDOWN_TRANSIENT", state_arr)
+        codes[start_win] = _STARTUP
+        codes[stop_win] = _SHUTDOWN
         # Valve/damper moves only elevate RUNNING_STEADY → transient
-        steady = state_arr == "RUNNING_STEADY"
-        state_arr = np.where(cmd_win & steady, "STARTUP_TRANSIENT", state_arr)
+        codes[cmd_win & (codes == _STEADY)] = _STARTUP
 
-    return pd.Series(state_arr, index=idx, dtype=object), meta
+    return _state_series(codes, idx), meta
+
+
+def _state_series(codes: np.ndarray, index: pd.Index) -> pd.Series:
+    return pd.Series(pd.Categorical.from_codes(codes, categories=STATE_NAMES), index=index)
+
+
+def state_codes(state: pd.Series, index: pd.Index | None = None) -> np.ndarray:
+    """int8 ``STATE_NAMES`` codes for ``state`` aligned to ``index``.
+
+    Accepts the categorical Series from ``detect_operating_state`` (codes used
+    directly) or plain state strings; missing / unrecognized → UNKNOWN_STATE.
+    """
+    if index is not None and not state.index.equals(index):
+        state = state.reindex(index)
+    if isinstance(state.dtype, pd.CategoricalDtype) and tuple(state.cat.categories) == STATE_NAMES:
+        codes = state.cat.codes.to_numpy()
+        return np.where(codes < 0, _UNKNOWN, codes).astype(np.int8)
+    return state.astype(object).map(STATE_CODES).fillna(_UNKNOWN).to_numpy(dtype=np.int8)
 
 
 def _interval_class(state: str) -> IntervalClass:
@@ -222,6 +256,13 @@ def _thresholds_for_state(profile: SensorRateProfile, state: str) -> tuple[float
     return profile.steady_warning_per_hour, profile.steady_fault_per_hour, "steady"
 
 
+def _threshold_tables(profile: SensorRateProfile) -> tuple[np.ndarray, np.ndarray]:
+    """(warning, fault) per-hour thresholds indexed by state code."""
+    warn = np.where(_TRANSIENT_BY_CODE, profile.transient_warning_per_hour, profile.steady_warning_per_hour)
+    fault = np.where(_TRANSIENT_BY_CODE, profile.transient_fault_per_hour, profile.steady_fault_per_hour)
+    return warn.astype(float), fault.astype(float)
+
+
 def evaluate_point(
     values: pd.Series,
     state: pd.Series,
@@ -289,13 +330,14 @@ def evaluate_point(
 
     primary = rates["robust_slope_15min"].fillna(rates["rate_15min"]).fillna(rates["instantaneous_rate"])
 
-    st = state.reindex(idx).fillna("UNKNOWN_STATE").astype(str)
-    is_trans = st.isin(["STARTUP_TRANSIENT", "SHUTDOWN_TRANSIENT"])
-    fault_thr = pd.Series(profile.steady_fault_per_hour, index=idx)
-    warn_thr = pd.Series(profile.steady_warning_per_hour, index=idx)
-    fault_thr = fault_thr.where(~is_trans, profile.transient_fault_per_hour)
-    warn_thr = warn_thr.where(~is_trans, profile.transient_warning_per_hour)
-    thr_label = pd.Series("steady", index=idx, dtype=object).where(~is_trans, "transient")
+    codes = state_codes(state, idx)
+    warn_by_code, fault_by_code = _threshold_tables(profile)
+    fault_thr = pd.Series(fault_by_code[codes], index=idx)
+    warn_thr = pd.Series(warn_by_code[codes], index=idx)
+    thr_label = pd.Series(
+        pd.Categorical.from_codes(_TRANSIENT_BY_CODE[codes].astype(np.int8), categories=("steady", "transient")),
+        index=idx,
+    )
 
     warn = primary.notna() & (primary >= warn_thr)
     fault = primary.notna() & (primary >= fault_thr)
@@ -341,7 +383,7 @@ def evaluate_point(
             g_hours = float(dt_h.reindex(g.index).fillna(poll_seconds / 3600.0).sum())
             longest = max(longest, g_hours * 60.0)
 
-    mode_state = str(st.mode().iloc[0]) if len(st) else "UNKNOWN_STATE"
+    mode_state = STATE_NAMES[int(np.bincount(codes, minlength=len(STATE_NAMES)).argmax())] if len(codes) else "UNKNOWN_STATE"
     _, fault_thr_s, thr_s = _thresholds_for_state(profile, mode_state)
     unit = profile.canonical_unit
     msg = (
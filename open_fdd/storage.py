@@ -0,0 +1,96 @@
+"""How loaded telemetry frames are held in memory: float policy and overlays.
+
+Building packages keep every equipment frame in memory, and most of it is
+analog float64 telemetry whose sensors resolve far less than float32's ~7
+significant digits. ``apply_float_storage(df, "float32")`` halves that
+footprint at load time. Rule evaluation does not run on the stored dtype:
+``upcast_float32`` gives the runner a float64 working frame, so thresholds,
+differences and rolling sums see the same arithmetic as a float64 load and
+only the input rounding differs.
+
+Opt-in: the default policy is ``float64`` unless a policy is passed or
+``OPENFDD_FLOAT_STORAGE`` is set.
+
+The runner derives several working frames per equipment (role map, weather
+merge, OAT injection, normalized values). ``overlay_frame`` builds each one
+from the previous frame's column buffers plus the added / replaced columns
+instead of a full ``copy()`` when pandas copy-on-write is active; otherwise it
+falls back to a deep copy.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Mapping
+
+import numpy as np
+import pandas as pd
+
+FLOAT_STORAGE_ENV = "OPENFDD_FLOAT_STORAGE"
+FLOAT_STORAGE_POLICIES: tuple[str, ...] = ("float64", "float32")
+
+# float32 represents every integer up to 2**24 exactly; counters, epoch seconds
+# and other wide-range columns beyond it stay float64.
+FLOAT32_EXACT_LIMIT = float(2**24)
+
+
+def float_storage_policy(policy: str | None = None) -> str:
+    """Explicit ``policy``, else ``$OPENFDD_FLOAT_STORAGE``, else ``"float64"``."""
+    if policy is None:
+        policy = os.environ.get(FLOAT_STORAGE_ENV, "").strip().lower() or "float64"
+    if policy not in FLOAT_STORAGE_POLICIES:
+        raise ValueError(f"float storage must be one of {FLOAT_STORAGE_POLICIES}, got {policy!r}")
+    return policy
+
+
+def _fits_float32(values: np.ndarray) -> bool:
+    finite = values[np.isfinite(values)]
+    return not finite.size or float(np.abs(finite).max()) <= FLOAT32_EXACT_LIMIT
+
+
+def apply_float_storage(df: pd.DataFrame, policy: str | None = None) -> pd.DataFrame:
+    """Store float64 columns as float32 under the ``float32`` policy.
+
+    Columns whose magnitude exceeds ``FLOAT32_EXACT_LIMIT`` keep float64; integer,
+    bool and text columns are untouched. Returns ``df`` itself when nothing changes.
+    """
+    if float_storage_policy(policy) == "float64":
+        return df
+    cast = {
+        col: np.float32
+        for col, dtype in df.dtypes.items()
+        if dtype == np.float64 and _fits_float32(df[col].to_numpy())
+    }
+    if not cast or df.columns.has_duplicates:
+        return df
+    return df.astype(cast)
+
+
+def upcast_float32(df: pd.DataFrame) -> pd.DataFrame:
+    """``df`` with float32 columns widened to float64 for rule math (``df`` itself if none)."""
+    cast = {col: np.float64 for col, dtype in df.dtypes.items() if dtype == np.float32}
+    if not cast or df.columns.has_duplicates:
+        return df
+    return overlay_frame(df, {col: df[col].astype(np.float64) for col in cast})
+
+
+def copy_on_write_active() -> bool:
+    """True when pandas copy-on-write protects shallow copies (pandas 3, or ``mode.copy_on_write``)."""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.get_option("mode.copy_on_write") is True
+
+
+def overlay_frame(df: pd.DataFrame, columns: Mapping[str, Any] | None = None) -> pd.DataFrame:
+    """New frame: ``df`` with ``columns`` added or replaced.
+
+    Same result as ``df.copy()`` followed by column assignment (values align to
+    ``df.index``, scalars broadcast, new columns go last), and ``df`` is never
+    modified, including by later in-place writes (``.loc`` / ``.iloc``) on the
+    result. Under copy-on-write untouched column buffers are shared; without it
+    (pandas 2 defaults) the frame is deep-copied first.
+    """
+    out = df.copy(deep=not copy_on_write_active())
+    for name, values in (columns or {}).items():
+        out[name] = values
+    return out
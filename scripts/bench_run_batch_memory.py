@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Peak memory / allocation benchmark for ``open_fdd.rules.run_batch``.
+
+Builds a synthetic building (AHUs and VAVs on a 5-minute grid plus web
+weather), then runs ``run_batch`` serially in a fresh child process per
+repeat and reports:
+
+* ``peak_rss_mb`` — process high-water mark minus RSS before the run;
+* ``traced_peak_mb`` — ``tracemalloc`` peak (NumPy buffers are traced);
+* ``frame_copies`` — eager ``DataFrame.copy()`` calls (deep copies of a whole
+  frame, the allocations the runner pipeline should avoid);
+* ``minor_faults`` — first-touch page faults, i.e. how much fresh memory the
+  run allocated and wrote. Children pin glibc's mmap / trim thresholds so this
+  does not swing with the allocator's adaptive heuristics;
+* ``seconds`` — wall time of the untraced run.
+
+Compare trees by running the script against each checkout, e.g.
+``PYTHONPATH=/path/to/other/checkout python scripts/bench_run_batch_memory.py``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _rss_bytes() -> int:
+    with open("/proc/self/statm", encoding="ascii") as fh:
+        return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def synthetic_ahu(rows: int, rng, *, start: str = "2026-01-01"):
+    """One AHU on a 5-minute grid: fan on mid-day, noisy sensors, no injected faults."""
+    import numpy as np
+    import pandas as pd
+
+    idx = pd.date_range(start, periods=rows, freq="5min", tz="UTC")
+    day = np.arange(rows) / 288.0
+    fan = (((day % 1) > 0.25) & ((day % 1) < 0.75)).astype(float)
+    df = pd.DataFrame(
+        {
+            "fan-status": fan,
+            "fan-cmd": fan * 80.0,
+            "duct-static-pressure": 1.3 + rng.normal(0, 0.2, rows),
+            "duct-static-pressure-sp": 1.5,
+            "mixed-air-temp": 58.0 + rng.normal(0, 3, rows),
+            "return-air-temp": 72.0 + rng.normal(0, 0.5, rows),
+            "outside-air-temp": 45.0 + 12 * np.sin(day * 2 * np.pi),
+            "discharge-air-temp": 55.3 + rng.normal(0, 1.5, rows),
+            "discharge-air-temp-sp": 55.0,
+            "cooling-valve": np.clip(rng.normal(30, 25, rows), 0, 100),
+            "heating-valve": np.clip(rng.normal(5, 10, rows), 0, 100),
+            "outside-air-damper": np.clip(rng.normal(30, 20, rows), 0, 100),
+        },
+        index=idx,
+    )
+    df.attrs.update(poll_seconds=300.0, equipment_type="AHU")
+    return df
+
+
+def build_building(n_ahu: int, n_vav: int, rows: int, seed: int = 0):
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2026-01-01", periods=rows, freq="5min", tz="UTC")
+    day = np.arange(rows) / 288.0
+    frames: dict[str, pd.DataFrame] = {}
+    for i in range(n_ahu):
+        frames[f"AHU_{i + 1}"] = synthetic_ahu(rows, rng)
+    for i in range(n_vav):
+        df = pd.DataFrame(
+            {
+                "zone-air-temp": 71.0 + rng.normal(0, 1, rows),
+                "zone-air-temp-sp": 72.0,
+                "zone-airflow": 400.0 + rng.normal(0, 40, rows),
+                "zone-airflow-sp": 450.0,
+                "damper": np.clip(rng.normal(45, 20, rows), 0, 100),
+                "reheat-valve": np.clip(rng.normal(10, 15, rows), 0, 100),
+                "vav-discharge-air-temp": 60.0 + rng.normal(0, 3, rows),
+            },
+            index=idx,
+        )
+        df.attrs.update(poll_seconds=300.0, equipment_type="VAV")
+        frames[f"VAV_{i + 1}"] = df
+    weather = pd.DataFrame(
+        {
+            "web-outside-air-temp": 44.0 + 12 * np.sin(day * 2 * np.pi),
+            "web-outside-air-humidity": np.clip(60 + rng.normal(0, 10, rows), 5, 100),
+        },
+        index=idx,
+    )
+    return frames, weather
+
+
+def measure(n_ahu: int, n_vav: int, rows: int, traced: bool) -> dict:
+    import tracemalloc
+
+    import pandas as pd
+
+    from open_fdd.rules import run_batch
+
+    copies = 0
+    frame_copy = pd.DataFrame.copy
+
+    def counting_copy(self, deep=True):
+        nonlocal copies
+        copies += bool(deep)
+        return frame_copy(self, deep=deep)
+
+    pd.DataFrame.copy = counting_copy
+    frames, weather = build_building(n_ahu, n_vav, rows)
+    copies = 0
+    before_rss = _rss_bytes()
+    before = resource.getrusage(resource.RUSAGE_SELF)
+    if traced:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    results = run_batch(frames, weather=weather, workers=1, executor="thread")
+    seconds = time.perf_counter() - t0
+    after = resource.getrusage(resource.RUSAGE_SELF)
+    out = {
+        "results": len(results),
+        "seconds": round(seconds, 3),
+        "peak_rss_mb": round(max(0, after.ru_maxrss * 1024 - before_rss) / 2**20, 1),
+        "frame_copies": copies,
+        "minor_faults": after.ru_minflt - before.ru_minflt,
+    }
+    if traced:
+        out["traced_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 1)
+        tracemalloc.stop()
+    return out
+
+
+def _child(args: argparse.Namespace, traced: bool) -> dict:
+    cmd = [
+        sys.executable,
+        __file__,
+        "--child",
+        "--ahu",
+        str(args.ahu),
+        "--vav",
+        str(args.vav),
+        "--rows",
+        str(args.rows),
+    ]
+    if traced:
+        cmd.append("--traced")
+    env = dict(os.environ)
+    env.setdefault("PYTHONPATH", str(ROOT))
+    env.setdefault("MALLOC_MMAP_THRESHOLD_", str(128 * 1024))
+    env.setdefault("MALLOC_TRIM_THRESHOLD_", str(128 * 1024))
+    proc = subprocess.run(cmd, capture_output=True, text=True, env=env, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--ahu", type=int, default=4)
+    ap.add_argument("--vav", type=int, default=12)
+    ap.add_argument("--rows", type=int, default=8640, help="samples per equipment (default 30 days @ 5 min)")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    ap.add_argument("--traced", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.ahu, args.vav, args.rows, args.traced)))
+        return 0
+
+    runs = [_child(args, traced=False) for _ in range(max(1, args.repeat))]
+    traced = _child(args, traced=True)
+    best = min(runs, key=lambda r: r["peak_rss_mb"])
+    report = {
+        "equipment": args.ahu + args.vav,
+        "rows": args.rows,
+        "results": best["results"],
+        "seconds": min(r["seconds"] for r in runs),
+        "peak_rss_mb": best["peak_rss_mb"],
+        "frame_copies": best["frame_copies"],
+        "minor_faults": min(r["minor_faults"] for r in runs),
+        "traced_peak_mb": traced["traced_peak_mb"],
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
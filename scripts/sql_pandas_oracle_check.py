@@ -6,6 +6,10 @@ Does not import removed Vibe19 modules. Python is never a product runtime depend
 
 DataFusion side remains in ``crates/fdd_rules`` tests; this job fails loudly if
 the oracle package or required seed fixtures are missing.
+
+``--float-storage float32`` stores seed telemetry as float32
+(``open_fdd.storage``) and also requires every seed's fault hours to match a
+float64 run within the seed tolerance.
 """
 
 from __future__ import annotations
@@ -85,9 +89,11 @@ def apply_role_map(df, columns_csv: Path):
     return df.rename(columns=mapping)
 
 
-def run_seeds(run_rule, inventory) -> int:
+def run_seeds(run_rule, inventory, float_storage: str = "float64") -> int:
     import pandas as pd
 
+    from open_fdd.storage import apply_float_storage
+
     n = 0
     for concept in inventory.get("concepts") or []:
         if concept.get("kind") != "diagnostic":
@@ -127,17 +133,28 @@ def run_seeds(run_rule, inventory) -> int:
             df = apply_role_map(df, path / "columns.csv")
             df.attrs["equipment_id"] = meta.get("equipment_id", "AHU_1")
             params = meta.get("params") or {}
-            result = run_rule(
-                rule_id,
-                df,
-                params=params,
-                poll_seconds=float(meta.get("poll_seconds", 300)),
-            )
-            fault_hours = float(getattr(result, "fault_hours", 0.0) or 0.0)
+
+            def fault_hours_for(frame) -> float:
+                result = run_rule(
+                    rule_id,
+                    frame,
+                    params=params,
+                    poll_seconds=float(meta.get("poll_seconds", 300)),
+                )
+                return float(getattr(result, "fault_hours", 0.0) or 0.0)
+
+            fault_hours = fault_hours_for(apply_float_storage(df, float_storage))
             expect_hours = meta.get("fault_hours")
             expect_any = meta.get("any_fault")
+            tol = float(meta.get("fault_hours_tol", 0.05))
+            if float_storage != "float64":
+                wide_hours = fault_hours_for(df)
+                if abs(fault_hours - wide_hours) > tol:
+                    fail(
+                        f"{fx['path']}: {float_storage} storage {rule_id} fault_hours={fault_hours} "
+                        f"vs float64 {wide_hours} ±{tol}"
+                    )
             if expect_hours is not None:
-                tol = float(meta.get("fault_hours_tol", 0.05))
                 if abs(fault_hours - float(expect_hours)) > tol:
                     fail(
                         f"{fx['path']}: pandas {rule_id} fault_hours={fault_hours} "
@@ -149,7 +166,7 @@ def run_seeds(run_rule, inventory) -> int:
                 fail(f"{fx['path']}: expected no fault for {rule_id}, got {fault_hours}")
             print(
                 f"OK seed {rule_id} @ {fx['path']} fault_hours={fault_hours} "
-                f"(df_compare={meta.get('datafusion_compare', 'rust_test')})"
+                f"(df_compare={meta.get('datafusion_compare', 'rust_test')}, storage={float_storage})"
             )
             n += 1
     if n < 3:
@@ -165,13 +182,18 @@ def main() -> int:
         default=True,
         help="fail if open_fdd.rules cannot be imported (default)",
     )
+    ap.add_argument(
+        "--float-storage",
+        choices=("float64", "float32"),
+        default="float64",
+        help="store seed telemetry as float32 and check fault hours against float64",
+    )
     args = ap.parse_args()
-    _ = args
 
     inv = load_inventory()
     _, run_rule = import_oracle()
-    n = run_seeds(run_rule, inv)
-    print(f"OK: sql_pandas_oracle_check ({n} seed fixtures)")
+    n = run_seeds(run_rule, inv, float_storage=args.float_storage)
+    print(f"OK: sql_pandas_oracle_check ({n} seed fixtures, {args.float_storage} storage)")
     return 0
 
 
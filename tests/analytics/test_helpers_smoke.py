@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
+from open_fdd.analytics.charts import downsample_series_for_plot, select_plot_positions
+from open_fdd.analytics.daytypes import DAY_TYPES as DAY_TYPE_NAMES, day_type_codes, day_type_series
+from open_fdd.analytics.occupancy import DAYS, OccupancySchedule, apply_schedule_occ_mode, occupied_mask
 from open_fdd.analytics.poll import infer_poll_seconds
 from open_fdd.analytics.runtime_intervals import hours_under_mask
 from open_fdd.analytics.site_model import equipment_type_from_id
+from open_fdd import storage
 
 
 def test_infer_poll_seconds():
@@ -23,3 +28,70 @@ def test_hours_under_mask():
 
 def test_equipment_type_from_id():
     assert "AHU" in equipment_type_from_id("AHU_1").upper()
+
+
+def test_occupied_mask_matches_weekly_windows():
+    sched = OccupancySchedule.from_dict(
+        {
+            "timezone": "America/Chicago",
+            "days": {"mon": {"occupied": True, "start": "22:00", "end": "06:30"}, "tue": {"start": "7:15", "end": "17"}},
+        }
+    )
+    assert sched.minute_table().shape == (7, 1440) and sched.minute_table() is sched.minute_table()
+    idx = pd.date_range("2026-01-05", periods=3 * 1440, freq="7min", tz="UTC")
+    local = idx.tz_convert("America/Chicago")
+    want = []
+    for ts in local:
+        day = sched.days[DAYS[ts.dayofweek]]
+        sh, sm = (int(x) for x in (day.start.split(":") + ["0"])[:2])
+        eh, em = (int(x) for x in (day.end.split(":") + ["0"])[:2])
+        m, start, end = ts.hour * 60 + ts.minute, sh * 60 + sm, eh * 60 + em
+        want.append(day.occupied and ((m >= start or m < end) if end <= start else start <= m < end))
+    assert occupied_mask(idx, sched).tolist() == want
+    assert not occupied_mask(pd.DatetimeIndex([idx[0], pd.NaT]), sched).iloc[1]
+    occ = apply_schedule_occ_mode(pd.DataFrame({"x": np.zeros(len(idx))}, index=idx), sched)["occupied"]
+    assert (occ == "occupied").tolist() == want
+
+
+def test_schedule_occ_mode_returns_independent_frame(monkeypatch):
+    monkeypatch.setattr(storage, "copy_on_write_active", lambda: False)
+    idx = pd.date_range("2026-01-05", periods=4, freq="6h", tz="UTC")
+    df = pd.DataFrame({"x": np.zeros(4), "occupied": ["occupied"] * 4}, index=idx)
+    sched = OccupancySchedule()
+    for frame in (df, df.reset_index(drop=True)):
+        out = apply_schedule_occ_mode(frame, sched)
+        out.iloc[0, 0] = 5.0
+        out.loc[out.index[1], "occupied"] = "unoccupied"
+        assert (frame["x"] == 0.0).all() and (frame["occupied"] == "occupied").all()
+
+
+def test_day_types_local_dates_holidays_and_cache():
+    # 2026-07-03 is the observed Independence Day (Friday); the 4th is a Saturday.
+    idx = pd.date_range("2026-07-02 22:00", periods=96, freq="1h", tz="UTC").tz_convert("America/Chicago")
+    labels = day_type_series(idx)
+    assert labels.cat.codes.dtype == np.int8 and tuple(labels.cat.categories) == DAY_TYPE_NAMES
+    want = ["holiday" if ts.date().isoformat() == "2026-07-03" else "weekend" if ts.dayofweek >= 5 else "weekday" for ts in idx]
+    assert labels.astype(str).tolist() == want
+    assert day_type_codes(idx) is day_type_codes(idx)
+    assert day_type_series(pd.DatetimeIndex(["2026-12-25", None])).astype(str).tolist() == ["holiday", "weekday"]
+
+
+def test_plot_downsample_keeps_spikes_and_fault_edges():
+    n = 50_000
+    rng = np.random.default_rng(7)
+    s = pd.Series(55 + rng.normal(0, 1, n), index=pd.date_range("2026-01-01", periods=n, freq="1min"))
+    s.iloc[::89] = np.nan
+    s.iloc[1000:3000] = 20.0  # flatline dip
+    spikes = np.arange(4001, n, 1901)  # one per pixel bucket
+    s.iloc[spikes] = 95.0
+    fault = pd.Series((np.arange(n) // 700) % 2 == 1, index=s.index)
+    edges = s.index[np.flatnonzero(np.diff(fault.to_numpy())) + 1]
+    for method in ("m4", "lttb"):
+        out = downsample_series_for_plot(s, max_points=800, fault_mask=fault, method=method)
+        assert len(out) <= 800 and out.index.is_monotonic_increasing
+        assert out.index[0] == s.index[0] and out.index[-1] == s.index[-1]
+        assert edges.isin(out.index).all(), method
+        assert s.index[spikes].isin(out.index).all(), method
+        assert out.min() == 20.0
+    # Without values the fill stays an even grid.
+    assert select_plot_positions(n, 500, method="m4").tolist() == select_plot_positions(n, 500, method="stride").tolist()
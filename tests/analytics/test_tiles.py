@@ -0,0 +1,83 @@
+"""Tile pyramids: exact per-tile aggregates and level choice by window / point budget."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from open_fdd.analytics.charts import equipment_inspection_chart, rule_result_chart
+from open_fdd.analytics.tiles import build_tile_pyramid, build_tile_pyramids
+from open_fdd.rules.base import RuleResult
+from open_fdd.rules.intervals import IntervalMask
+
+
+def _frame(n=60 * 24 * 60):
+    idx = pd.date_range("2026-01-01", periods=n, freq="1min", tz="America/Chicago")
+    rng = np.random.default_rng(11)
+    df = pd.DataFrame(
+        {
+            "zone-air-temp": 71.0 + rng.normal(0, 1, n),
+            "fan-status": (np.arange(n) % 1440) < 600,
+            "mode": "occ",
+        },
+        index=idx,
+    )
+    df.iloc[5000:9000, 0] = np.nan
+    df.iloc[70_000, 0] = 99.0
+    return df
+
+
+def test_levels_aggregate_from_raw():
+    df = _frame()
+    pyr = build_tile_pyramid(df)
+    assert pyr.columns == ["zone-air-temp", "fan-status"]
+    assert [lv.freq for lv in pyr.levels] == ["15min", "1h", "1D"]
+    day = pyr.levels[-1]
+    s = df["zone-air-temp"]
+    pd.testing.assert_series_equal(day.hi["zone-air-temp"], s.resample("1D").max(), check_freq=False)
+    pd.testing.assert_series_equal(day.lo["zone-air-temp"], s.resample("1D").min(), check_freq=False)
+    np.testing.assert_allclose(day.mean["zone-air-temp"], s.resample("1D").mean(), rtol=1e-12)
+    assert day.bounds[-1] == len(df) and (day.count.sum() == df[pyr.columns].count()).all()
+    assert build_tile_pyramids({"VAV_1": df, "bad": pd.DataFrame({"x": [1.0]})}).keys() == {"VAV_1"}
+    with pytest.raises(ValueError, match="coarser"):
+        build_tile_pyramid(df, freqs=("1h", "15min"))
+
+
+def test_window_picks_level_and_keeps_extremes():
+    df = _frame()
+    pyr = build_tile_pyramid(df)
+    # Two months at 1 min: envelope of daily tiles fits 500 points, raw rows do not.
+    full = pyr.window(max_points=500)
+    assert len(full) == 2 * 60 and full["zone-air-temp"].max() == 99.0
+    assert full.index.is_monotonic_increasing and str(full.index.tz) == "America/Chicago"
+    zoom = pyr.window("2026-01-10", "2026-01-10 12:00", max_points=500)
+    assert len(zoom) == 721 and zoom.index[0] == pd.Timestamp("2026-01-10", tz="America/Chicago")
+    mid = pyr.window("2026-01-10", "2026-01-14", max_points=500)
+    assert 2 * 96 < len(mid) <= 500  # hourly tiles
+    # Fault lane: a one-minute fault still marks its tile.
+    mask = IntervalMask.from_bool(np.arange(len(df)) == 70_000, df.index)
+    lane = pyr.window_mask(mask, max_points=500)
+    assert lane.index.equals(full.index) and lane.sum() == 2
+
+
+def test_charts_sample_untiled_series_as_of_envelope():
+    df = _frame()
+    df["zone-air-temp"] = df["zone-air-temp"].fillna(71.0)
+    df["damper-pct"] = 40.0 + (np.arange(len(df)) % 7)
+    pyr = build_tile_pyramid(df, columns=["zone-air-temp"])
+    span = ("2026-01-10", "2026-01-24")
+    # Two weeks of minutes > 4x the point budget: 15 min tiles, whose mid-tile
+    # timestamps miss the 1 min grid.
+    fig = equipment_inspection_chart(df, columns=["zone-air-temp", "damper-pct"], tiles=pyr, time_range=span)
+    damper = next(t for t in fig.data if t.name == "damper-pct")
+    assert len(damper.y) > 0 and not np.isnan(np.asarray(damper.y, dtype=float)).any()
+
+    derived = (df["damper-pct"] * 2).rename("damper-x2")
+    fault = pd.Series(np.arange(len(df)) % 500 < 30, index=df.index)
+    result = RuleResult(
+        "TEST-1", "VAV_1", "FAULT", True, raw_fault=fault, confirmed_fault=fault, plot_series={"damper-x2": derived}
+    )
+    fig = rule_result_chart(df, result, tiles=pyr, time_range=span)
+    trace = next(t for t in fig.data if t.name.startswith("damper-x2"))
+    assert len(trace.y) > 0 and not np.isnan(np.asarray(trace.y, dtype=float)).any()
@@ -44,9 +44,48 @@ def test_run_rules_pandas_engine_no_central_import(agent_api):
     assert run.meta.get("actual_engine") == "pandas"
 
 
+def test_run_rules_reuses_quality_cache_across_runs(agent_api):
+    idx = pd.date_range("2026-01-05", periods=600, freq="5min", tz="UTC")
+    df = pd.DataFrame(
+        {"discharge-air-temp": 55.0 + (idx.minute % 3), "fan-status": 1.0, "heating-valve-cmd": 0.0},
+        index=idx,
+    )
+    ds = agent_api.AgentDataset(building_id="SYNTH", frames={"AHU_1": df}, weather=None)
+    first = agent_api.run_rules(ds, engine="pandas")
+    second = agent_api.run_rules(ds, engine="pandas")
+    before, after = first.meta["quality_cache"], second.meta["quality_cache"]
+    assert before["misses"] >= 1
+    assert after["hits"] > before["hits"] and after["misses"] == before["misses"]
+
+
 def test_datafusion_does_not_silent_fallback(agent_api):
     idx = pd.date_range("2026-01-05", periods=4, freq="5min", tz="UTC")
     df = pd.DataFrame({"sat": 55.0}, index=idx)
     ds = agent_api.AgentDataset(building_id="SYNTH", frames={"AHU_1": df}, weather=None)
     with pytest.raises((RuntimeError, ImportError)):
         agent_api.run_rules(ds, engine="datafusion")
+
+
+def test_diurnal_profiles_match_per_cell_stats(agent_api):
+    from app.wattlab_dump import diurnal_profiles  # type: ignore
+
+    idx = pd.date_range("2026-01-01", periods=2016, freq="5min", tz="America/Chicago")
+    fan = (idx.hour >= 6) & (idx.hour < 18)
+    sat = pd.Series(range(len(idx)), index=idx, dtype=float) % 17 + 50.0
+    sat.iloc[::5] = float("nan")
+    df = pd.DataFrame({"sat": sat, "sat_sp": 55.0, "fan_status": fan.astype(float)}, index=idx)
+    role_map = {"AHU_1": {"discharge-air-temp": "sat", "discharge-air-temp-sp": "sat_sp", "fan-status": "fan_status"}}
+    out = diurnal_profiles({"AHU_1": df}, role_map)
+    assert set(out["day_type"]) == {"weekday", "weekend", "holiday"}  # 2026-01-01 is New Year's Day
+    assert set(out["fan_state"]) == {"all", "on", "off"}
+    row = out[
+        (out["role"] == "discharge-air-temp")
+        & (out["day_type"] == "weekday")
+        & (out["fan_state"] == "on")
+        & (out["hour"] == 9)
+    ].iloc[0]
+    weekday = (idx.dayofweek < 5) & (idx.normalize() != pd.Timestamp("2026-01-01", tz=idx.tz))
+    cell = sat[weekday & fan & (idx.hour == 9)].dropna()
+    assert row["n"] == len(cell)
+    assert row["mean"] == round(cell.mean(), 3) and row["std"] == round(cell.std(ddof=0), 3)
+    assert (row["min"], row["p50"], row["max"]) == (cell.min(), cell.median(), cell.max())
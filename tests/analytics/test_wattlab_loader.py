@@ -0,0 +1,255 @@
+"""WattLab package loading: fast CSV path matches the default loader."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+WATT = Path(__file__).resolve().parents[2] / "tools" / "wattlab_export"
+SLICE = Path(__file__).resolve().parents[1] / "fixtures" / "synthetic_slice" / "OPENFDD_SYNTHETIC_SLICE_V1"
+
+
+@pytest.fixture(scope="module")
+def data_loader():
+    sys.path.insert(0, str(WATT))
+    try:
+        from app import data_loader as mod  # type: ignore
+    except ImportError:
+        pytest.skip("tools/wattlab_export not importable")
+    return mod
+
+
+@pytest.fixture(scope="module")
+def frame_cache(data_loader):
+    from app import frame_cache as mod  # type: ignore
+
+    return mod
+
+
+def _write_equipment(folder: Path, frame: pd.DataFrame) -> tuple[Path, Path]:
+    folder.mkdir(parents=True, exist_ok=True)
+    frame.to_csv(folder / "history_wide.csv", index=False)
+    roles = [c for c in frame.columns if c != "timestamp_utc"]
+    pd.DataFrame({"col": roles, "point_role": roles}).to_csv(folder / "columns.csv", index=False)
+    return folder / "history_wide.csv", folder / "columns.csv"
+
+
+def test_fast_loader_matches_default_on_fixture(data_loader):
+    for eq in data_loader.discover_equipment(SLICE):
+        want = data_loader.load_equipment_csv(eq["history_path"], eq["columns_path"])
+        got = data_loader.load_equipment_csv(eq["history_path"], eq["columns_path"], fast=True)
+        pd.testing.assert_frame_equal(got, want, check_dtype=False)
+        assert (got.dtypes == "float64").all()
+
+
+def test_fast_loader_float32_unsorted_and_text(data_loader, tmp_path):
+    ts = pd.date_range("2026-01-05", periods=6, freq="5min", tz="UTC").strftime("%Y-%m-%dT%H:%M:%S+00:00")
+    frame = pd.DataFrame({"timestamp_utc": ts, "zone-air-temp": np.arange(6.0), "fan-status": [0, 1] * 3})
+    shuffled = frame.iloc[[3, 0, 5, 1, 4, 2]].copy()
+    shuffled.iloc[1, 0] = "not a time"
+    hist, cols = _write_equipment(tmp_path / "AHU_1", shuffled)
+    got = data_loader.load_equipment_csv(hist, cols, fast=True, float_dtype="float32")
+    assert got.index.is_monotonic_increasing and len(got) == 5 and got.index.name == "timestamp"
+    assert (got.dtypes == "float32").all()
+    pd.testing.assert_frame_equal(got, data_loader.load_equipment_csv(hist, cols), check_dtype=False)
+
+    frame["occupied"] = ["occupied", "unoccupied"] * 3
+    hist, cols = _write_equipment(tmp_path / "AHU_2", frame)
+    got = data_loader.load_equipment_csv(hist, cols, fast=True)
+    assert got["occupied"].tolist()[:2] == ["occupied", "unoccupied"]
+    got = data_loader.load_equipment_csv(hist, cols, fast=True, float_dtype="float32")
+    assert (got.drop(columns="occupied").dtypes == "float32").all()
+    assert got["occupied"].tolist()[:2] == ["occupied", "unoccupied"]
+    with pytest.raises(ValueError, match="float_dtype"):
+        data_loader.load_equipment_csv(hist, cols, fast=True, float_dtype="int64")
+
+
+def test_fast_loader_non_iso_timestamps(data_loader, tmp_path):
+    ts = pd.date_range("2026-01-05 12:00", periods=4, freq="5min").strftime("%m/%d/%Y %H:%M")
+    frame = pd.DataFrame({"timestamp_utc": ts, "zone-air-temp": np.arange(4.0)})
+    hist, cols = _write_equipment(tmp_path / "VAV_1", frame)
+    want = data_loader.load_equipment_csv(hist, cols)
+    got = data_loader.load_equipment_csv(hist, cols, fast=True)
+    assert len(want) == 4 and got.index.dtype == want.index.dtype
+    pd.testing.assert_frame_equal(got, want, check_dtype=False)
+
+
+def test_frame_cache_round_trip_and_invalidation(frame_cache, data_loader, tmp_path):
+    ts = pd.date_range("2026-01-05", periods=8, freq="5min", tz="UTC").strftime("%Y-%m-%dT%H:%M:%S+00:00")
+    frame = pd.DataFrame(
+        {
+            "timestamp_utc": ts,
+            "zone-air-temp": np.linspace(70.0, 72.0, 8),
+            "fan-status": [0, 1] * 4,
+            "occupied": ["occupied", None] * 4,
+        }
+    )
+    hist, cols = _write_equipment(tmp_path / "pkg" / "AHU_1", frame)
+    cache = tmp_path / "cache"
+    want = data_loader.load_equipment_csv(hist, cols)
+    first = frame_cache.load_equipment_frame(hist, cols, grid_minutes=5, cache_dir=cache)
+    entries = list((cache / "frames").iterdir())
+    assert len(entries) == 1
+    again = frame_cache.load_equipment_frame(hist, cols, grid_minutes=5, cache_dir=cache)
+    for got in (first, again):
+        pd.testing.assert_frame_equal(got, want)
+    base = again["zone-air-temp"].to_numpy()
+    while not isinstance(base, np.memmap) and base is not None:
+        base = base.base
+    assert isinstance(base, np.memmap)
+    again.iloc[0, 0] = -1.0  # copy-on-write mapping: the cache file is untouched
+    pd.testing.assert_frame_equal(frame_cache.load_equipment_frame(hist, cols, grid_minutes=5, cache_dir=cache), want)
+
+    frame_cache.load_equipment_frame(hist, cols, grid_minutes=1, cache_dir=cache)
+    frame.iloc[0, 1] = 99.0
+    _write_equipment(tmp_path / "pkg" / "AHU_1", frame)
+    changed = frame_cache.load_equipment_frame(hist, cols, grid_minutes=5, cache_dir=cache)
+    assert changed.iloc[0, 0] == 99.0
+    assert len(list((cache / "frames").iterdir())) == 3
+
+    for _ in range(2):  # float32 storage is its own entry (miss, then hit)
+        narrow = frame_cache.load_equipment_frame(hist, cols, grid_minutes=5, cache_dir=cache, float_storage="float32")
+        assert narrow["zone-air-temp"].dtype == np.float32
+        np.testing.assert_allclose(narrow["zone-air-temp"], changed["zone-air-temp"], rtol=1e-6)
+    assert len(list((cache / "frames").iterdir())) == 4
+
+
+@pytest.fixture(scope="module")
+def package_io(data_loader):
+    from app import package_io as mod  # type: ignore
+
+    return mod
+
+
+def test_parallel_package_load_matches_serial_and_errors_are_deterministic(package_io, tmp_path):
+    import shutil
+
+    serial = package_io.load_package_from_dir(SLICE, workers=1)
+    seen = []
+    parallel = package_io.load_package_from_dir(SLICE, workers=4, progress=lambda *a: seen.append(a))
+    assert list(parallel.frames) == list(serial.frames)
+    for eq_id, df in serial.frames.items():
+        pd.testing.assert_frame_equal(parallel.frames[eq_id], df)
+    assert parallel.warnings == serial.warnings
+    assert sorted(eq for _, _, eq in seen) == sorted(serial.frames)
+    assert [done for done, _, _ in seen] == list(range(1, len(seen) + 1))
+
+    pkg = tmp_path / "pkg"
+    shutil.copytree(SLICE, pkg)
+    # A load failure on an earlier folder loses to a validation failure later on.
+    rows = "".join(f"2026-01-05T00:{m:02d}:00+00:00,1\n" for m in range(0, 40, 5))
+    (pkg / "AHU_CASE_FC1" / "history_wide.csv").write_text(f"timestamp_utc,x\n{rows}bad,1,2\n")
+    (pkg / "VAV_CASE_VAV_1" / "history_wide.csv").write_text("time,x\n1,2\n")
+    messages = set()
+    for workers in (1, 3, 6):
+        with pytest.raises(package_io.PackageError) as exc:
+            package_io.load_package_from_dir(pkg, workers=workers)
+        messages.add(str(exc.value))
+    assert messages == {"VAV_CASE_VAV_1: missing required column timestamp_utc"}
+    shutil.copy(SLICE / "VAV_CASE_VAV_1" / "history_wide.csv", pkg / "VAV_CASE_VAV_1" / "history_wide.csv")
+    for workers in (1, 4):
+        with pytest.raises(package_io.PackageError, match="^AHU_CASE_FC1: failed to load history_wide.csv"):
+            package_io.load_package_from_dir(pkg, workers=workers)
+
+
+def test_package_load_checks_every_header_before_parsing(package_io, tmp_path, monkeypatch):
+    import shutil
+
+    pkg = tmp_path / "pkg"
+    shutil.copytree(SLICE, pkg)
+    folders = sorted(p.parent.name for p in pkg.glob("*/history_wide.csv") if p.parent.name != "weather")
+    (pkg / folders[-1] / "history_wide.csv").write_text("time,x\n1,2\n")
+    loads = []
+    real = package_io.load_equipment_frame
+
+    def recording(path, *args, **kwargs):
+        loads.append(path)
+        return real(path, *args, **kwargs)
+
+    monkeypatch.setattr(package_io, "load_equipment_frame", recording)
+    for workers in (1, 4):
+        with pytest.raises(package_io.PackageError, match=f"^{folders[-1]}: missing required column"):
+            package_io.load_package_from_dir(pkg, workers=workers)
+    assert loads == []
+
+    # Serial: a load error stops the remaining folders.
+    shutil.copy(SLICE / folders[-1] / "history_wide.csv", pkg / folders[-1] / "history_wide.csv")
+    rows = "".join(f"2026-01-05T00:{m:02d}:00+00:00,1\n" for m in range(0, 40, 5))
+    (pkg / folders[0] / "history_wide.csv").write_text(f"timestamp_utc,x\n{rows}bad,1,2\n")
+    with pytest.raises(package_io.PackageError, match=f"^{folders[0]}: failed to load"):
+        package_io.load_package_from_dir(pkg, workers=1)
+    assert len(loads) == 1
+
+
+def _zip_slice(weather_nested: bool) -> bytes:
+    import io
+    import zipfile
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for path in sorted(SLICE.rglob("*")):
+            rel = path.relative_to(SLICE.parent)
+            if path.is_dir() or (weather_nested and "weather" in rel.parts):
+                continue
+            zf.write(path, rel.as_posix())
+        if weather_nested:
+            inner = io.BytesIO()
+            with zipfile.ZipFile(inner, "w", zipfile.ZIP_DEFLATED) as wz:
+                for path in sorted((SLICE / "weather").iterdir()):
+                    wz.write(path, path.name)
+            zf.writestr(f"{SLICE.name}/weather.zip", inner.getvalue())
+    return buf.getvalue()
+
+
+def test_streaming_zip_load_matches_extracted(package_io):
+    data = _zip_slice(weather_nested=True)
+    full = package_io.load_package_zip(data)
+    streamed = package_io.load_package_zip(data, stream=True)
+    try:
+        assert streamed.report["streamed_csv_count"] == len(full.frames) + 1
+        assert list(streamed.frames) == list(full.frames)
+        for eq_id, df in full.frames.items():
+            pd.testing.assert_frame_equal(streamed.frames[eq_id], df)
+        pd.testing.assert_frame_equal(streamed.weather, full.weather)
+        assert streamed.warnings == full.warnings
+        assert streamed.report["uncompressed_bytes"] == full.report["uncompressed_bytes"]
+        previews = list(streamed.workdir.rglob("history_wide.csv"))
+        assert previews and all(p.stat().st_size <= package_io.STREAM_PREVIEW_BYTES for p in previews)
+    finally:
+        package_io.wipe_workdir(full.workdir)
+        package_io.wipe_workdir(streamed.workdir)
+
+    import io
+    import zipfile
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("../evil.csv", "x")
+    with pytest.raises(package_io.PackageError, match="traversal"):
+        package_io.load_package_zip(buf.getvalue(), stream=True)
+
+
+def test_chunked_reader_windows_and_margins(data_loader, tmp_path):
+    idx = pd.date_range("2026-01-05", periods=3 * 288 + 7, freq="5min", tz="UTC")
+    frame = pd.DataFrame(
+        {"timestamp_utc": idx.strftime("%Y-%m-%dT%H:%M:%S+00:00"), "zone-air-temp": np.arange(len(idx), dtype=float)}
+    )
+    hist, cols = _write_equipment(tmp_path / "AHU_1", frame)
+    full = data_loader.load_equipment_csv(hist, cols)
+    chunks = list(data_loader.iter_equipment_csv_chunks(hist, window="1D", overlap="2h", read_rows=100))
+    assert len(chunks) == 4
+    owned = pd.concat([c.iloc[c.attrs["margin_rows"] :] for c in chunks])
+    pd.testing.assert_frame_equal(owned, full, check_freq=False)
+    for prev, cur in zip(chunks, chunks[1:]):
+        assert cur.attrs["chunk_start"] == cur.index[cur.attrs["margin_rows"]]
+        assert cur.attrs["margin_rows"] == 24 and cur.index[0] > prev.index[-1] - pd.Timedelta("2h")
+    assert chunks[1].attrs["chunk_start"] == pd.Timestamp("2026-01-06", tz="UTC")
+
+    shuffled = frame.iloc[::-1]
+    hist, _ = _write_equipment(tmp_path / "AHU_2", shuffled)
+    with pytest.raises(ValueError, match="time order"):
+        list(data_loader.iter_equipment_csv_chunks(hist, window="1D", overlap="1h", read_rows=50))
@@ -0,0 +1,25 @@
+"""Shared synthetic equipment for the rules tests."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+
+from bench_run_batch_memory import synthetic_ahu  # noqa: E402
+
+
+@pytest.fixture
+def make_ahu():
+    """Factory for the benchmark's fault-free AHU; tests inject their own faults."""
+
+    def make(n: int = 288, *, seed: int = 0, start: str = "2026-01-01"):
+        df = synthetic_ahu(n, np.random.default_rng(seed), start=start)
+        df.attrs["equipment_id"] = "AHU_1"
+        return df
+
+    return make
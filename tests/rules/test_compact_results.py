@@ -0,0 +1,85 @@
+"""Compact RuleResult payloads materialize to the same Series / evidence as dense ones."""
+
+from __future__ import annotations
+
+import pickle
+
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from open_fdd.analytics.core import sensor_fault_summary
+from open_fdd.rules import run_all_cookbook_rules
+from open_fdd.rules.intervals import IntervalMask
+
+
+@pytest.fixture
+def ahu(make_ahu):
+    df = make_ahu()
+    df.iloc[80:120, df.columns.get_loc("mixed-air-temp")] = 61.0
+    df.iloc[150:170, df.columns.get_loc("discharge-air-temp")] = 75.0
+    return df
+
+
+def _run(df, compact):
+    return run_all_cookbook_rules(
+        df, equipment_id="AHU_1", poll_seconds=300.0, equipment_type="AHU", compact=compact
+    )
+
+
+def test_compact_matches_dense(ahu):
+    dense, compact = _run(ahu, False), _run(ahu, True)
+    assert any(r.status == "FAULT" for r in dense)
+    for a, b in zip(dense, compact):
+        assert b.to_dict() == a.to_dict(), a.rule_id
+        if a.confirmed_fault is None:
+            continue
+        assert b.is_compact
+        pdt.assert_series_equal(b.raw_fault, a.raw_fault)
+        pdt.assert_series_equal(b.confirmed_fault, a.confirmed_fault)
+        assert list(b.plot_series) == list(a.plot_series)
+        for key, series in a.plot_series.items():
+            pdt.assert_series_equal(b.plot_series[key], series)
+    pdt.assert_frame_equal(
+        sensor_fault_summary(ahu, compact, equipment_id="AHU_1"),
+        sensor_fault_summary(ahu, dense, equipment_id="AHU_1"),
+    )
+
+
+def test_compact_pickles_and_round_trips_runs(ahu):
+    result = next(r for r in _run(ahu, True) if r.status == "FAULT")
+    clone = pickle.loads(pickle.dumps(result))
+    pdt.assert_series_equal(clone.confirmed_fault, result.confirmed_fault)
+    assert clone.to_dict() == result.to_dict()
+
+    mask = pd.Series([True, False, True, True, False, True], name="m")
+    runs = IntervalMask.from_series(mask)
+    assert runs.starts.tolist() == [0, 2, 5] and runs.stops.tolist() == [1, 4, 6]
+    pdt.assert_series_equal(runs.materialize(), mask)
+
+
+def test_compact_plot_series_mutations_stick(ahu):
+    result = next(r for r in _run(ahu, True) if r.status == "FAULT" and r.plot_series)
+    plots = result.plot_series
+    assert result.plot_series is plots
+    extra = pd.Series(1.0, index=next(iter(plots.values())).index)
+    result.plot_series["extra"] = extra
+    assert result.plot_series["extra"] is extra and result.is_compact
+
+
+def test_compact_metrics_hold_no_dense_series(ahu):
+    def series_in(value):
+        if isinstance(value, pd.Series):
+            yield value
+        elif isinstance(value, dict):
+            for v in value.values():
+                yield from series_in(v)
+        elif isinstance(value, (list, tuple)):
+            for v in value:
+                yield from series_in(v)
+
+    results = _run(ahu, True)
+    sweeps = [r for r in results if "sv_sweep_confirmed_roles" in r.metrics]
+    assert sweeps and any(r.metrics["sv_sweep_confirmed_roles"] for r in sweeps)
+    for r in results:
+        assert not any(len(s) == len(ahu) for s in series_in(r.metrics)), r.rule_id
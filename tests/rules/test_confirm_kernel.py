@@ -0,0 +1,47 @@
+"""NumPy confirm / hours kernel matches the groupby reference semantics."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from open_fdd.rules.base import confirm_fault, hours_true, run_length_sum, sample_deltas_seconds
+
+
+def _reference_confirm(raw: pd.Series, deltas: pd.Series, confirm_seconds: float) -> pd.Series:
+    groups = (raw != raw.shift()).cumsum()
+    cum = deltas.where(raw, 0.0).groupby(groups).cumsum()
+    return raw & (cum >= confirm_seconds)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_confirm_matches_groupby_on_irregular_index(seed):
+    rng = np.random.default_rng(seed)
+    steps = rng.choice([60, 60, 60, 120, 300, 0], size=400)
+    idx = pd.DatetimeIndex(pd.Timestamp("2026-01-01", tz="UTC") + pd.to_timedelta(np.cumsum(steps), unit="s"))
+    raw = pd.Series(rng.random(400) < 0.7, index=idx)
+    deltas = pd.Series(sample_deltas_seconds(idx, 60.0), index=idx)
+    for confirm_s in (0.0, 120.0, 300.0, 900.0):
+        got = confirm_fault(raw, poll_seconds=60.0, confirm_seconds=confirm_s)
+        want = raw if confirm_s <= 0 else _reference_confirm(raw, deltas, confirm_s)
+        assert got.tolist() == want.tolist()
+    assert hours_true(raw, 60.0) == pytest.approx(float((raw * deltas / 3600.0).sum()))
+
+
+def test_row_count_fallback_without_datetime_index():
+    raw = pd.Series([True, True, False, True, True, True, None])
+    got = confirm_fault(raw, poll_seconds=300.0, confirm_seconds=600.0)
+    assert got.tolist() == [False, True, False, False, True, True, False]
+    assert hours_true(raw, 300.0) == pytest.approx(5 * 300.0 / 3600.0)
+
+
+def test_run_length_sum_resets_each_run():
+    on = np.array([True, True, False, True, False, True, True, True])
+    assert run_length_sum(on, np.full(8, 2.0)).tolist() == [2, 4, 0, 2, 0, 2, 4, 6]
+
+
+def test_last_sample_uses_median_delta():
+    idx = pd.date_range("2026-01-01", periods=4, freq="5min", tz="UTC")
+    assert sample_deltas_seconds(idx, 60.0).tolist() == [300.0, 300.0, 300.0, 300.0]
+    assert sample_deltas_seconds(pd.RangeIndex(3), 60.0) is None
@@ -0,0 +1,87 @@
+"""``open_fdd.storage``: float32 policy (same fault hours) and column overlays."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from open_fdd.rules import run_all_cookbook_rules
+from open_fdd.rules.runner import merge_weather
+from open_fdd.quality import apply_normalized, assess_frame
+from open_fdd import storage
+from open_fdd.storage import (
+    FLOAT32_EXACT_LIMIT,
+    apply_float_storage,
+    copy_on_write_active,
+    float_storage_policy,
+    overlay_frame,
+)
+
+
+def test_policy_resolution(monkeypatch):
+    monkeypatch.delenv("OPENFDD_FLOAT_STORAGE", raising=False)
+    assert float_storage_policy() == "float64"
+    monkeypatch.setenv("OPENFDD_FLOAT_STORAGE", "float32")
+    assert float_storage_policy() == "float32"
+    assert float_storage_policy("float64") == "float64"
+    with pytest.raises(ValueError, match="float storage"):
+        float_storage_policy("float16")
+
+
+def test_float32_storage_keeps_wide_and_non_float_columns(make_ahu):
+    df = make_ahu(10).assign(meter=FLOAT32_EXACT_LIMIT * 4, mode="occ", count=np.arange(10))
+    assert apply_float_storage(df, "float64") is df
+    out = apply_float_storage(df, "float32")
+    assert out["discharge-air-temp"].dtype == np.float32
+    assert out["meter"].dtype == np.float64 and out["count"].dtype == df["count"].dtype
+    assert out["mode"].tolist() == df["mode"].tolist()
+    assert out.attrs["equipment_id"] == "AHU_1"
+    # Rules see float64 values again.
+    assert (merge_weather(out, None).dtypes != np.float32).all()
+
+
+def test_fault_hours_match_float64(make_ahu):
+    df = make_ahu(2016, seed=3)
+    compact = apply_float_storage(df, "float32")
+    assert compact.memory_usage(index=False).sum() < 0.6 * df.memory_usage(index=False).sum()
+    wide = run_all_cookbook_rules(df, equipment_id="AHU_1", poll_seconds=300.0, equipment_type="AHU")
+    narrow = run_all_cookbook_rules(compact, equipment_id="AHU_1", poll_seconds=300.0, equipment_type="AHU")
+    assert [r.rule_id for r in wide] == [r.rule_id for r in narrow]
+    assert any((r.fault_hours or 0.0) > 0 for r in wide)
+    for a, b in zip(wide, narrow):
+        assert a.status == b.status, a.rule_id
+        assert abs((a.fault_hours or 0.0) - (b.fault_hours or 0.0)) <= 0.05, a.rule_id
+
+
+@pytest.mark.skipif(not copy_on_write_active(), reason="buffers are shared only under copy-on-write")
+def test_overlay_frame_shares_untouched_columns(make_ahu):
+    df = make_ahu(50)
+    out = overlay_frame(df, {"mixed-air-temp": 1.0, "new": df["fan-cmd"] / 2})
+    assert list(out.columns) == [*df.columns, "new"] and out.attrs == df.attrs
+    assert np.shares_memory(out["return-air-temp"].to_numpy(), df["return-air-temp"].to_numpy())
+    assert (out["mixed-air-temp"] == 1.0).all() and (df["mixed-air-temp"] != 1.0).all()
+    out.iloc[0, 0] = -1.0
+    assert df.iloc[0, 0] != -1.0
+
+
+def test_overlay_frame_deep_copies_without_copy_on_write(make_ahu, monkeypatch):
+    monkeypatch.setattr(storage, "copy_on_write_active", lambda: False)
+    df = make_ahu(50)
+    out = overlay_frame(df, {"new": 1.0})
+    assert not np.shares_memory(out["return-air-temp"].to_numpy(), df["return-air-temp"].to_numpy())
+    out.loc[out.index[0], "return-air-temp"] = -1.0
+    assert df["return-air-temp"].iloc[0] != -1.0
+
+
+@pytest.mark.skipif(not copy_on_write_active(), reason="buffers are shared only under copy-on-write")
+def test_runner_pipeline_does_not_copy_equipment_columns(make_ahu):
+    df = make_ahu(200)
+    wx = pd.DataFrame({"web-outside-air-temp": 40.0, "web-outside-air-humidity": 55.0}, index=df.index)
+    merged = merge_weather(df, wx)
+    assert {"web-outside-air-dewpoint", "oa_t_effective", "bas-outside-air-temp"} <= set(merged.columns)
+    assert "web-outside-air-dewpoint" not in df.columns
+    roles = ["discharge-air-temp", "fan-status"]
+    gated = apply_normalized(merged, assess_frame(merged, roles), attach_raw_and_flags=False)
+    for col in ("duct-static-pressure", "discharge-air-temp"):
+        assert np.shares_memory(gated[col].to_numpy(), df[col].to_numpy()), col
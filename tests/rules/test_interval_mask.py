@@ -0,0 +1,76 @@
+"""IntervalMask matches dense boolean Series semantics."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from open_fdd.reporting.day_zoom import worst_fault_day
+from open_fdd.rules import IntervalMask
+from open_fdd.rules.base import confirm_fault, finalize_result, hours_true
+from open_fdd.rules.evidence import json_safe, sparse_intervals
+
+
+def _index(n, seed):
+    rng = np.random.default_rng(seed)
+    steps = rng.choice([60, 60, 60, 120, 300], size=n)
+    return pd.DatetimeIndex(pd.Timestamp("2026-03-01", tz="America/Chicago") + pd.to_timedelta(np.cumsum(steps), unit="s"))
+
+
+def _mask(idx, seed, p=0.9):
+    rng = np.random.default_rng(seed)
+    # Sticky random walk so runs are long, like real fault episodes.
+    flips = rng.random(len(idx)) > p
+    return pd.Series(np.cumsum(flips) % 2 == 1, index=idx)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_set_algebra_and_queries(seed):
+    idx = _index(3000, seed)
+    a, b = _mask(idx, seed), _mask(idx, seed + 10)
+    ma, mb = IntervalMask.from_series(a), IntervalMask.from_series(b)
+    assert (ma & mb).to_numpy().tolist() == (a & b).tolist()
+    assert (ma | mb).to_numpy().tolist() == (a | b).tolist()
+    assert (~ma).to_numpy().tolist() == (~a).tolist()
+    assert (ma & b).sum() == int((a & b).sum())
+    assert ma.first() == a[a].index[0] and ma.last() == a[a].index[-1]
+    dense = a.to_numpy()
+    assert ma.transitions().tolist() == (np.flatnonzero(dense[1:] != dense[:-1]) + 1).tolist()
+    pos = np.arange(0, 3000, 7)
+    assert ma.values_at(pos).tolist() == dense[pos].tolist()
+    assert ma.count_before(pos).tolist() == [int(dense[:p].sum()) for p in pos]
+    assert ma.hours(60.0) == pytest.approx(hours_true(a, 60.0))
+    for confirm_s in (0.0, 300.0, 900.0):
+        want = confirm_fault(a, poll_seconds=60.0, confirm_seconds=confirm_s)
+        got = ma.confirm(poll_seconds=60.0, confirm_seconds=confirm_s)
+        assert got.to_numpy().tolist() == want.tolist()
+
+
+def test_sparse_intervals_and_json_safe_accept_masks():
+    idx = _index(500, 4)
+    a = _mask(idx, 4)
+    m = IntervalMask.from_series(a)
+    assert sparse_intervals(m) == sparse_intervals(a)
+    assert json_safe(m, role="fault") == json_safe(a, role="fault")
+    assert [row["count"] for row in sparse_intervals(a)] == m.lengths.tolist()
+
+
+def test_finalize_interval_path_matches_dense():
+    idx = _index(2000, 5)
+    raw, active = _mask(idx, 5), _mask(idx, 6, p=0.98)
+    dense = finalize_result("X", "EQ", raw, 60.0, 600.0, active_mask=active)
+    compact = finalize_result("X", "EQ", IntervalMask.from_series(raw), 60.0, 600.0, active_mask=active)
+    assert compact.is_compact
+    assert compact.to_dict() == dense.to_dict()
+    assert compact.confirmed_fault.tolist() == dense.confirmed_fault.tolist()
+
+
+def test_worst_fault_day_from_intervals():
+    idx = pd.date_range("2026-01-01", periods=4 * 288, freq="5min", tz="UTC")
+    a = pd.Series(False, index=idx)
+    a.iloc[300:420] = True  # day 2
+    a.iloc[600:900] = True  # spans day 3 / day 4
+    m = IntervalMask.from_series(a)
+    assert worst_fault_day(m) == worst_fault_day(a)
+    assert worst_fault_day(IntervalMask.empty(idx)) is None
@@ -0,0 +1,34 @@
+"""Prepared per-equipment context: shared quality/gates must not change results."""
+
+from __future__ import annotations
+
+from open_fdd.quality import assess_frame
+from open_fdd.rules import RULES, run_all_cookbook_rules, run_cookbook_rule
+from open_fdd.rules.prepared import PreparedEquipment
+
+
+def test_prepared_assess_matches_assess_frame(make_ahu):
+    df = make_ahu()
+    df.iloc[10:14, df.columns.get_loc("mixed-air-temp")] = 999.0
+    prep = PreparedEquipment(df, 300.0)
+    roles = ["mixed-air-temp", "fan-status", "not-a-column"]
+    assert prep.assess(roles).summary() == assess_frame(df, roles).summary()
+    first = prep.role_quality("mixed-air-temp")
+    prep.assess(["mixed-air-temp"])
+    assert prep.role_quality("mixed-air-temp") is first
+
+
+def test_all_rules_match_unprepared_path(make_ahu):
+    df = make_ahu()
+    df.iloc[100:104, df.columns.get_loc("mixed-air-temp")] = 999.0
+    shared = run_all_cookbook_rules(df, equipment_id="AHU_1", poll_seconds=300.0, equipment_type="AHU")
+    for rule, got in zip(RULES, shared):
+        solo = run_cookbook_rule(
+            rule,
+            df,
+            equipment_id="AHU_1",
+            equipment_kind="ahu",
+            poll_seconds=300.0,
+            equipment_type="AHU",
+        )
+        assert got.to_dict() == solo.to_dict(), rule.id
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from open_fdd.quality import (
+    REASON_IMPOSSIBLE,
     REASON_NON_NUMERIC,
+    REASON_NULL,
     REASON_OUT_OF_RANGE,
     REASON_SENTINEL,
+    QualityCache,
     apply_normalized,
     assess_frame,
     normalize_role_series,
@@ -111,3 +115,60 @@ def test_occupied_strings_are_valid_status():
     result = run_rule("SCHED-1", df, params={"confirm_min": 0}, poll_seconds=300.0)
     assert result.status in {"FAULT", "PASS"}
     assert result.status != "SKIPPED_MISSING_ROLES"
+
+
+def test_reason_precedence_and_first_seen_order():
+    idx = _idx(8)
+    mixed = pd.Series([72.0, "bad", 999.0, None, -5.0, "on", 71.0, 999.0], index=idx, dtype=object)
+    q = normalize_role_series(mixed, "chw-flow")
+    nn, sent, null, imp = REASON_NON_NUMERIC, REASON_SENTINEL, REASON_NULL, REASON_IMPOSSIBLE
+    assert q.reason_codes.tolist() == ["", nn, sent, null, imp, nn, "", sent]
+    assert list(q.reason_counts) == [nn, sent, null, imp]
+    ints = normalize_role_series(pd.Series(range(8), index=idx, name="x"), "mystery-role")
+    assert ints.normalized.dtype == "int64" and ints.normalized.name == "x"
+
+
+def test_quality_cache_hits_keys_and_eviction():
+    idx = _idx(50)
+    df = pd.DataFrame({"zone-air-temp": 72.0, "chw-flow": 10.0}, index=idx)
+    cache = QualityCache()
+    first = assess_frame(df, cache=cache)
+    second = assess_frame(df, cache=cache)
+    assert second.roles["chw-flow"].summary() == first.roles["chw-flow"].summary()
+    assert (cache.hits, cache.misses) == (2, 2)
+    assess_frame(df, sentinels=(72.0,), cache=cache)  # different sentinels, different key
+    assert cache.misses == 4
+    assert assess_frame(df.copy(), cache=cache).summary() == first.summary()
+    assert cache.misses == 6
+
+    small = QualityCache(max_bytes=100)
+    assess_frame(df, cache=small)
+    assert len(small) == 1 and small.evictions == 1 and small.nbytes <= 100
+    del df, first, second
+    assert len(cache) == 0  # entries go with the frame
+
+
+def test_quality_cache_misses_after_in_place_write():
+    df = pd.DataFrame({"mixed-air-temp": 60.0 + np.arange(100) % 5}, index=_idx(100))
+    cache = QualityCache()
+    assert assess_frame(df, ["mixed-air-temp"], cache=cache).roles["mixed-air-temp"].valid_sample_count == 100
+    df.iloc[0:50, 0] = 999.0
+    rq = assess_frame(df, ["mixed-air-temp"], cache=cache).roles["mixed-air-temp"]
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert rq.valid_sample_count == 50 and rq.reason_counts[REASON_SENTINEL] == 50
+
+
+def test_role_quality_is_compact():
+    idx = _idx(20)
+    df = pd.DataFrame({"zone-air-temp": np.linspace(60.0, 80.0, 20), "chw-flow": 5.0}, index=idx)
+    df.iloc[3, 0] = 999.0
+    q = assess_frame(df)
+    rq = q.roles["zone-air-temp"]
+    assert np.shares_memory(rq.raw.to_numpy(), df["zone-air-temp"].to_numpy())
+    assert rq.reason_code_array.dtype == np.uint8 and rq.valid_bits.nbytes == 3
+    assert rq.valid.tolist() == [i != 3 for i in range(20)]
+    assert rq.reason_codes.iloc[3] == REASON_SENTINEL
+    out = apply_normalized(df, q)
+    assert out["quality:zone-air-temp"].dtype == "int8" and out["quality:zone-air-temp"].sum() == 19
+    assert out["raw:zone-air-temp"].iloc[3] == 999.0 and np.isnan(out["zone-air-temp"].iloc[3])
+    assert df.iloc[3, 0] == 999.0
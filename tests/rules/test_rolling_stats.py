@@ -0,0 +1,109 @@
+"""Block rolling stats match pandas ``rolling`` for row and time windows."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from open_fdd.rules.cookbook_catalog import flatline_mask, flatline_masks
+from open_fdd.rules import RULES_BY_ID
+from open_fdd.rules.prepared import PreparedEquipment
+from open_fdd.rules.rolling import RollingBlock, rolling_stats
+from open_fdd.rules.runner import run_cookbook_rule
+
+
+def _frame(regular: bool, n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    if regular:
+        idx = pd.date_range("2026-01-01", periods=n, freq="1min", tz="UTC")
+    else:
+        steps = rng.choice([60, 60, 120, 600], size=n)
+        idx = pd.DatetimeIndex(pd.Timestamp("2026-01-01", tz="UTC") + pd.to_timedelta(np.cumsum(steps), unit="s"))
+    df = pd.DataFrame(rng.normal(size=(n, 3)), index=idx)
+    return df.mask(df > 1.5)
+
+
+@pytest.mark.parametrize("regular", [True, False])
+@pytest.mark.parametrize("window,min_periods", [(7, None), (60, 3), ("1h", None), ("2h", 5)])
+def test_matches_pandas_rolling(regular, window, min_periods):
+    df = _frame(regular)
+    got = rolling_stats(df, [window], min_periods=min_periods)[window]
+    kw = {} if min_periods is None else {"min_periods": min_periods}
+    for stat in ("min", "max", "sum"):
+        want = getattr(df.rolling(window, **kw), stat)().to_numpy()
+        np.testing.assert_allclose(got[stat], want, rtol=0, atol=1e-9, equal_nan=True)
+    count = df.notna().astype(int).rolling(window, min_periods=0).sum().to_numpy()
+    np.testing.assert_array_equal(got["count"], count)
+
+
+def test_column_subsets_and_multiple_windows():
+    df = _frame(True)
+    out = rolling_stats(df, [5, "30min"], stats={"min": [0], "sum": [1, 2]})
+    assert set(out) == {5, "30min"} and set(out[5]) == {"min", "sum"}
+    assert np.isnan(out[5]["min"][:, 1:]).all() and np.isnan(out[5]["sum"][:, 0]).all()
+    np.testing.assert_allclose(out["30min"]["sum"][:, 2], df[2].rolling("30min").sum(), atol=1e-9)
+    with pytest.raises(ValueError, match="DatetimeIndex"):
+        rolling_stats(df.to_numpy(), ["1h"])
+
+
+def test_rolling_block_reuses_levels_across_windows():
+    df = _frame(False)
+    block = RollingBlock(df)
+    for window in ("15min", "2h", 7, "1h"):
+        got = block.stats([window], stats=("min", "max", "sum"))[window]
+        want = rolling_stats(df, [window], stats=("min", "max", "sum"))[window]
+        for stat in got:
+            np.testing.assert_array_equal(got[stat], want[stat])
+
+
+def test_sweep_rules_share_one_rolling_block():
+    idx = pd.date_range("2026-01-01", periods=600, freq="5min", tz="UTC")
+    df = pd.DataFrame({"zone-air-temp": 71.0, "return-air-temp": 72.0 + (np.arange(600) > 300) * (np.arange(600) % 3)}, index=idx)
+    prepared = PreparedEquipment(df, 300.0)
+    kw = dict(equipment_id="VAV_1", equipment_kind="vav", poll_seconds=300.0)
+    for rule_id in ("SV-FLATLINE", "SV-STALE"):
+        shared = run_cookbook_rule(RULES_BY_ID[rule_id], df, prepared=prepared, **kw)
+        alone = run_cookbook_rule(RULES_BY_ID[rule_id], df, **kw)
+        assert shared.status == alone.status == "FAULT" and shared.fault_sample_count == alone.fault_sample_count
+    assert len(prepared.rolling_blocks) == 1
+
+
+def test_flatline_masks_match_single_column():
+    df = _frame(True).round(0)
+    block = flatline_masks(df, tol=0.5, window=4)
+    for col in df.columns:
+        pd.testing.assert_series_equal(block[col], flatline_mask(df[col], tol=0.5, window=4), check_names=False)
+        roll = df[col].rolling(4, min_periods=4)
+        want = df[col].notna() & ((roll.max() - roll.min()) <= 0.5)
+        assert block[col].tolist() == want.tolist()
+
+
+def test_time_window_flatline_on_gappy_frame():
+    # 5-minute samples with a 40-minute hole; the value is stuck from 01:15 on.
+    full = pd.date_range("2026-01-01", periods=48, freq="5min", tz="UTC")
+    idx = full[(full < full[20]) | (full >= full[28])]
+    s = pd.Series(np.where(idx < full[15], np.arange(len(idx)) * 1.0, 70.0), index=idx, name="t")
+    by_time = flatline_mask(s, tol=0.1, window=pd.Timedelta(hours=1))
+    # First sample once a full hour of flat history exists (the hole ends at 02:20).
+    assert by_time[by_time].index[0] == pd.Timestamp("2026-01-01 02:20", tz="UTC")
+    # A 12-row window needs 12 stuck samples and so stretches over 1 h 35 min here.
+    by_rows = flatline_mask(s, tol=0.1, window=12)
+    assert by_rows[by_rows].index[0] == pd.Timestamp("2026-01-01 02:50", tz="UTC")
+    assert not by_time[: pd.Timestamp("2026-01-01 02:15", tz="UTC")].any()
+
+
+def test_time_window_flatline_on_jittered_and_sparse_timestamps():
+    from open_fdd.rules.cookbook_catalog import _flatline_window
+
+    # Stuck sensor on 5-minute data with +/-30 s jitter: same samples as the row window, one run.
+    rng = np.random.default_rng(0)
+    grid = pd.date_range("2026-01-01", periods=288, freq="5min", tz="UTC")
+    s = pd.Series(70.0, index=grid + pd.to_timedelta(rng.integers(-30, 31, 288), unit="s"), name="t")
+    by_time = flatline_mask(s, tol=0.1, window=_flatline_window(s.to_frame(), 1.0, 300.0))
+    assert by_time.sum() == flatline_mask(s, tol=0.1, window=12).sum() == 277
+    assert by_time[by_time.idxmax() :].all()
+    # 20-minute data read with a 5-minute poll: stuck for 33 h must still be flagged.
+    sparse = pd.Series(70.0, index=pd.date_range("2026-01-01", periods=100, freq="20min", tz="UTC"), name="t")
+    flat = flatline_mask(sparse, tol=0.1, window=_flatline_window(sparse.to_frame(), 1.0, 300.0))
+    assert flat.iloc[3:].all() and not flat.iloc[:3].any()
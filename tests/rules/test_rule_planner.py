@@ -0,0 +1,61 @@
+"""Catalog planning from column bitsets matches per-rule column scans."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from open_fdd.rules import RULES, run_all_cookbook_rules
+from open_fdd.rules.planner import NOT_APPLICABLE, RUN, ColumnPresence, plan_rules
+from open_fdd.rules.prepared import PreparedEquipment
+from open_fdd.rules.runner import _missing_roles
+
+
+def _vav(n=96):
+    idx = pd.date_range("2026-02-01", periods=n, freq="5min", tz="UTC")
+    return pd.DataFrame(
+        {
+            "zone-air-temp": 71.0 + np.sin(np.arange(n) / 10.0),
+            "zone-air-temp-sp": 72.0,
+            "vav-airflow": 400.0,
+            "vav-airflow-sp": 450.0,
+            "damper-position": 40.0,
+            "reheat-valve": np.nan,  # mapped but never reported
+        },
+        index=idx,
+    )
+
+
+def test_column_presence_bitsets():
+    p = ColumnPresence.from_frame(_vav())
+    assert p.has("zone-air-temp") and not p.has("reheat-valve") and not p.has("fan-status")
+    assert p.missing(["reheat-valve", "vav-airflow", "fan-status"]) == ["reheat-valve", "fan-status"]
+
+
+def test_bitset_missing_roles_match_column_scans():
+    vav = _vav()
+    # Weather-gated rules (OAT-METEO, ECON-3/7, MECH-OAT-1) answered from bitsets too.
+    wx = vav.assign(
+        **{"bas-outside-air-temp": 40.0, "web-outside-air-temp": 41.0, "web-outside-air-dewpoint": np.nan}
+    )
+    no_bas = wx.copy()
+    no_bas.attrs["has_bas_oat"] = False
+    for df in (vav, wx, no_bas):
+        prepared = PreparedEquipment(df, 300.0)
+        for rule in RULES:
+            assert prepared.missing_roles(rule) == _missing_roles(rule, df), rule.id
+
+
+def test_planned_skips_match_results():
+    df = _vav()
+    prepared = PreparedEquipment(df, 300.0)
+    plans = plan_rules(RULES, equipment_kind="vav", missing_for=prepared.missing_roles)
+    results = run_all_cookbook_rules(df, equipment_id="VAV_1", poll_seconds=300.0, equipment_type="VAV")
+    assert [p.rule.id for p in plans] == [r.rule_id for r in results]
+    assert sum(p.action == NOT_APPLICABLE for p in plans) > len(plans) // 2
+    for plan, result in zip(plans, results):
+        if plan.action == NOT_APPLICABLE:
+            assert result.status == "NOT_APPLICABLE_EQUIPMENT_TYPE"
+        elif plan.action != RUN:
+            assert result.status == "SKIPPED_MISSING_ROLES"
+            assert result.missing_roles == list(plan.missing)
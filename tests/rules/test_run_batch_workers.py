@@ -0,0 +1,46 @@
+"""run_batch worker pools keep serial ordering and results."""
+
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from open_fdd.rules import run_batch
+
+
+def _frames():
+    idx = pd.date_range("2026-01-01", periods=48, freq="5min", tz="UTC")
+    out = {}
+    for i, kind in enumerate(("AHU", "VAV", "AHU")):
+        eq = f"{kind}_{i}"
+        df = pd.DataFrame(
+            {
+                "zone-air-temp": 70.0 + i,
+                "duct-static-pressure": 1.0,
+                "duct-static-pressure-sp": 1.5,
+                "fan-cmd": 80.0,
+                "fan-status": 1.0,
+            },
+            index=idx,
+        )
+        df.attrs["equipment_id"] = eq
+        df.attrs["equipment_type"] = kind
+        out[eq] = df
+    return out
+
+
+def _key(results):
+    return [(r.equipment_id, r.rule_id, r.status, r.fault_hours) for r in results]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_pool_matches_serial(executor):
+    serial = run_batch(_frames())
+    pooled = run_batch(_frames(), workers=2, executor=executor)
+    assert _key(pooled) == _key(serial)
+    assert [r.equipment_id for r in pooled][0] == "AHU_0"
+
+
+def test_unknown_executor_rejected():
+    with pytest.raises(ValueError):
+        run_batch(_frames(), workers=2, executor="cluster")
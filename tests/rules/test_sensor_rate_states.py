@@ -0,0 +1,49 @@
+"""SV-RATE operating states are int8 codes into ``STATE_NAMES``."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from open_fdd.rules.sensor_rate import (
+    STATE_NAMES,
+    _threshold_tables,
+    _thresholds_for_state,
+    detect_operating_state,
+    state_codes,
+)
+from open_fdd.rules.sensor_rate_profiles import ROLE_TO_PROFILE, resolve_profile
+
+
+def _frame(n=600):
+    idx = pd.date_range("2026-01-01", periods=n, freq="1min", tz="UTC")
+    fan = ((np.arange(n) % 300) > 60).astype(float)
+    valve = np.where(np.arange(n) % 97 == 0, 80.0, 20.0)
+    return pd.DataFrame({"fan-status": fan, "cooling-valve": valve}, index=idx)
+
+
+def test_detect_operating_state_is_int8_categorical():
+    state, meta = detect_operating_state(_frame(), transition_window_minutes=10)
+    assert isinstance(state.dtype, pd.CategoricalDtype)
+    assert tuple(state.cat.categories) == STATE_NAMES
+    assert state.cat.codes.dtype == np.int8
+    assert {"OFF", "RUNNING_STEADY", "STARTUP_TRANSIENT", "SHUTDOWN_TRANSIENT"} <= set(state.astype(str))
+    assert meta["transition_count"] > 0
+    codes = state_codes(state.astype(str))
+    assert codes.tolist() == state.cat.codes.tolist()
+
+
+def test_state_codes_fill_unknown():
+    idx = pd.RangeIndex(4)
+    s = pd.Series(["OFF", None, "bogus", "STARTUP_TRANSIENT"], index=idx)
+    assert [STATE_NAMES[c] for c in state_codes(s)] == ["OFF", "UNKNOWN_STATE", "UNKNOWN_STATE", "STARTUP_TRANSIENT"]
+    assert [STATE_NAMES[c] for c in state_codes(s.iloc[:2], idx)][2:] == ["UNKNOWN_STATE"] * 2
+
+
+def test_threshold_tables_match_scalar_lookup():
+    role = next(iter(ROLE_TO_PROFILE))
+    profile, _ = resolve_profile(role=role, override_id=None, equipment_type="")
+    warn, fault = _threshold_tables(profile)
+    for code, name in enumerate(STATE_NAMES):
+        w, f, _ = _thresholds_for_state(profile, name)
+        assert (warn[code], fault[code]) == (w, f)
@@ -50,6 +50,7 @@ from app.site_model import resolve_equipment_type, stamp_equipment_type
 from app.tuning_report import build_tuning_assistant_report
 from app.weather_psychrometrics import enrich_weather_frame
 from app.weather_resolver import has_web_oat
+from open_fdd.quality import QUALITY_CACHE
 
 
 @dataclass
@@ -404,6 +405,7 @@ def run_rules(
                 params_by_rule=merged_params,
                 weather=dataset.weather,
                 equipment_filter=eq_filter,
+                quality_cache=QUALITY_CACHE,
             )
         else:
             from app.role_map import apply_role_map
@@ -429,6 +431,7 @@ def run_rules(
                             eq_id, df=raw_df, role_map=dataset.role_map
                         ),
                         require_operational_gates=False,
+                        quality_cache=QUALITY_CACHE,
                     )
                 )
         if rule_ids is not None:
@@ -467,6 +470,8 @@ def run_rules(
             "fdd_engine": engine,
             "requested_engine": requested,
             "actual_engine": actual,
+            # Cumulative for the process: later runs over the same frames show hits.
+            "quality_cache": QUALITY_CACHE.stats() if engine == "pandas" else None,
         },
     )
 
@@ -5,8 +5,9 @@ from __future__ import annotations
 import json
 from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
+import numpy as np
 import pandas as pd
 
 TS_CANDIDATES = ("timestamp_utc", "timestamp", "time", "datetime", "date_time")
@@ -72,7 +73,78 @@ def _read_columns_map(columns_path: Path) -> dict[str, str]:
     return out
 
 
-def load_equipment_csv(history_path: Path, columns_path: Path | None = None) -> pd.DataFrame:
+def _csv_engine() -> str:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "c"
+    return "pyarrow"
+
+
+def _index_by_timestamp(raw: pd.DataFrame, ts_col: str) -> pd.DataFrame:
+    """``normalize_timestamp`` for ISO-8601 columns, without copying sorted frames."""
+    text = raw[ts_col]
+    ts = pd.to_datetime(text, utc=True, errors="coerce", format="ISO8601")
+    if (ts.isna() & text.notna()).any():
+        # Not (all) ISO-8601: parse like the default loader so no row is lost.
+        ts = pd.to_datetime(text, utc=True, errors="coerce")
+    if ts.isna().any() or not ts.is_monotonic_increasing:
+        raw = raw.assign(**{ts_col: ts})
+        return normalize_timestamp(raw, ts_col)
+    # Already clean and in order: drop the column and attach the index in place.
+    out = raw.drop(columns=[ts_col])
+    out.index = pd.DatetimeIndex(ts, name="timestamp")
+    return out
+
+
+def load_equipment_csv_fast(
+    history_path: Path,
+    columns_path: Path | None = None,
+    *,
+    float_dtype: str = "float64",
+) -> pd.DataFrame:
+    """Columnar ``load_equipment_csv``.
+
+    Uses the pyarrow CSV engine when installed (else the C engine), declares
+    ``float_dtype`` for every point listed in ``columns.csv`` and parses the
+    timestamp column as ISO-8601 UTC. Files whose declared columns hold text
+    (``occupied`` / ``on`` statuses) fall back to the default loader; the
+    declared numeric columns still come back as ``float_dtype``.
+    """
+    if np.dtype(float_dtype) not in (np.dtype("float32"), np.dtype("float64")):
+        raise ValueError("float_dtype must be float32 or float64")
+    header = pd.read_csv(history_path, nrows=0).columns
+    ts_col = detect_timestamp_column(pd.DataFrame(columns=header))
+    declared = _read_columns_map(columns_path) if columns_path else {}
+    dtype: dict[str, Any] = {c: float_dtype for c in header if c in declared and c != ts_col}
+    if ts_col is not None:
+        dtype[ts_col] = str
+    try:
+        raw = pd.read_csv(history_path, dtype=dtype, engine=_csv_engine())
+    except ValueError:
+        # A declared column holds text: default parse, then honour ``float_dtype``
+        # on the declared columns that did come back numeric.
+        df = load_equipment_csv(history_path, columns_path)
+        cast = {
+            c: float_dtype
+            for c in df.columns
+            if c in dtype and pd.api.types.is_numeric_dtype(df[c]) and not pd.api.types.is_bool_dtype(df[c])
+        }
+        return df.astype(cast) if cast else df
+    if ts_col is None:
+        return raw
+    return _index_by_timestamp(raw, ts_col)
+
+
+def load_equipment_csv(
+    history_path: Path,
+    columns_path: Path | None = None,
+    *,
+    fast: bool = False,
+    float_dtype: str = "float64",
+) -> pd.DataFrame:
+    if fast:
+        return load_equipment_csv_fast(history_path, columns_path, float_dtype=float_dtype)
     raw = pd.read_csv(history_path)
     ts = detect_timestamp_column(raw)
     df = normalize_timestamp(raw, ts)
@@ -81,6 +153,79 @@ def load_equipment_csv(history_path: Path, columns_path: Path | None = None) ->
     return df
 
 
+def _index_piece(piece: pd.DataFrame, ts_col: str) -> pd.DataFrame:
+    ts = pd.to_datetime(piece[ts_col], utc=True, errors="coerce")
+    out = piece.drop(columns=[ts_col])
+    out.index = pd.DatetimeIndex(ts, name="timestamp")
+    out = out[out.index.notna()]
+    return out if out.index.is_monotonic_increasing else out.sort_index(kind="stable")
+
+
+def iter_equipment_csv_chunks(
+    history_path: Path,
+    *,
+    window: str | pd.Timedelta = "7D",
+    overlap: str | pd.Timedelta | None = None,
+    read_rows: int = 250_000,
+) -> Iterator[pd.DataFrame]:
+    """Yield ``history_wide.csv`` in time windows without loading the whole file.
+
+    Each chunk owns the rows in ``[start, start + window)`` and is preceded by an
+    ``overlap`` margin of earlier rows (default: the longest cookbook rule window,
+    ``open_fdd.rules.incremental.default_lookback``). ``attrs["chunk_start"]`` is
+    the first owned timestamp and ``attrs["margin_rows"]`` the margin length.
+    The file is read ``read_rows`` lines at a time and must be in time order.
+    """
+    span = pd.Timedelta(window)
+    if span <= pd.Timedelta(0):
+        raise ValueError("window must be positive")
+    if overlap is None:
+        from open_fdd.rules.incremental import default_lookback
+
+        overlap = default_lookback()
+    overlap = pd.Timedelta(overlap)
+
+    margin: pd.DataFrame | None = None
+    pending: list[pd.DataFrame] = []
+    end: pd.Timestamp | None = None
+    last: pd.Timestamp | None = None
+    n = 0
+
+    def emit(owned: pd.DataFrame) -> pd.DataFrame:
+        nonlocal margin, n
+        frame = owned if margin is None or margin.empty else pd.concat([margin, owned])
+        frame.attrs.update(chunk_index=n, chunk_start=owned.index[0], margin_rows=len(frame) - len(owned))
+        n += 1
+        margin = frame[frame.index > owned.index[-1] - overlap]
+        return frame
+
+    ts_col: str | None = None
+    for piece in pd.read_csv(history_path, chunksize=read_rows):
+        if ts_col is None:
+            ts_col = detect_timestamp_column(piece)
+            if ts_col is None:
+                raise ValueError(f"{history_path}: no timestamp column")
+        piece = _index_piece(piece, ts_col)
+        if piece.empty:
+            continue
+        if last is not None and piece.index[0] < last:
+            raise ValueError(f"{history_path}: rows are not in time order; chunked reads need a sorted file")
+        last = piece.index[-1]
+        if end is None:
+            end = piece.index[0].floor(span) + span
+        pending.append(piece)
+        while last >= end:
+            buf = pending[0] if len(pending) == 1 else pd.concat(pending)
+            cut = int(buf.index.searchsorted(end, side="left"))
+            if cut:
+                yield emit(buf.iloc[:cut])
+            pending = [buf.iloc[cut:]] if cut < len(buf) else []
+            end += span
+    if pending:
+        buf = pending[0] if len(pending) == 1 else pd.concat(pending)
+        yield emit(buf)
+
+
 def discover_equipment(building_root: Path) -> list[dict[str, Any]]:
     """Find equipment folders with history_wide.csv + columns.csv.
 
@@ -130,13 +275,35 @@ def list_building_candidates(path: Path) -> list[Path]:
     return kids
 
 
-def load_building_folder(building_folder: Path) -> dict[str, pd.DataFrame]:
+def load_building_folder(
+    building_folder: Path,
+    *,
+    fast: bool = False,
+    cache_dir: Path | None = None,
+    float_storage: str | None = None,
+) -> dict[str, pd.DataFrame]:
     """Load one building folder (name is the building id — any label, not just BUILDING_100)."""
     building_folder = Path(building_folder)
-    return load_building_tree(building_folder.parent, building_folder.name)
-
+    return load_building_tree(
+        building_folder.parent, building_folder.name, fast=fast, cache_dir=cache_dir, float_storage=float_storage
+    )
+
+
+def load_building_tree(
+    data_root: Path,
+    building_id: str,
+    *,
+    fast: bool = False,
+    cache_dir: Path | None = None,
+    float_storage: str | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Load every equipment frame; ``cache_dir`` / ``OPENFDD_FRAME_CACHE_DIR`` enable ``app.frame_cache``.
+
+    ``float_storage="float32"`` (or ``OPENFDD_FLOAT_STORAGE=float32``) stores analog
+    columns as float32; see ``open_fdd.storage``.
+    """
+    from app.frame_cache import load_equipment_frame
 
-def load_building_tree(data_root: Path, building_id: str) -> dict[str, pd.DataFrame]:
     building_root = data_root / building_id
     manifest_path = building_root / "manifest.json"
     grid_minutes = 5
@@ -145,7 +312,14 @@ def load_building_tree(data_root: Path, building_id: str) -> dict[str, pd.DataFr
         grid_minutes = int(manifest.get("grid_minutes", 5))
     out: dict[str, pd.DataFrame] = {}
     for eq in discover_equipment(building_root):
-        df = load_equipment_csv(eq["history_path"], eq.get("columns_path"))
+        df = load_equipment_frame(
+            eq["history_path"],
+            eq.get("columns_path"),
+            grid_minutes=grid_minutes,
+            cache_dir=cache_dir,
+            fast=fast,
+            float_storage=float_storage,
+        )
         df.attrs["poll_seconds"] = grid_minutes * 60.0
         df.attrs["equipment_id"] = eq["equipment_id"]
         df.attrs["columns_path"] = eq.get("columns_path")
@@ -0,0 +1,230 @@
+"""On-disk cache of loaded equipment frames (skip re-parsing ``history_wide.csv``).
+
+Each entry is a directory of ``.npy`` blocks (one per numeric dtype, memory-mapped
+copy-on-write on load), the UTC index as int64 and a ``meta.json`` describing
+columns; text columns are stored as JSON lists. Nothing is unpickled, so a cache
+directory cannot execute code, and no optional dependency is needed.
+
+Entries are keyed by the content hash and size of ``history_wide.csv`` /
+``columns.csv``, ``grid_minutes``, the loader options and the float storage
+policy (``open_fdd.storage``; float32 entries are half the size on disk too). A path + size + mtime
+memo avoids re-hashing unchanged files; freshly extracted zips (new mtimes) are
+re-hashed but not re-parsed.
+
+Disabled unless a cache directory is passed or ``OPENFDD_FRAME_CACHE_DIR`` is set.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from app.data_loader import load_equipment_csv
+from open_fdd.storage import apply_float_storage, float_storage_policy
+
+CACHE_ENV = "OPENFDD_FRAME_CACHE_DIR"
+FORMAT_VERSION = 1
+_HASH_CHUNK = 8 * 2**20
+
+
+def frame_cache_dir(cache_dir: Path | str | None = None) -> Path | None:
+    """Explicit ``cache_dir``, else ``$OPENFDD_FRAME_CACHE_DIR``, else ``None`` (off)."""
+    if cache_dir is not None:
+        return Path(cache_dir)
+    env = os.environ.get(CACHE_ENV, "").strip()
+    return Path(env).expanduser() if env else None
+
+
+def _content_hash(path: Path, cache_root: Path) -> str:
+    st = path.stat()
+    stat_key = hashlib.blake2b(
+        f"{path.resolve()}|{st.st_size}|{st.st_mtime_ns}".encode(), digest_size=16
+    ).hexdigest()
+    memo = cache_root / "stat" / stat_key
+    if memo.is_file():
+        return memo.read_text(encoding="ascii").strip()
+    h = hashlib.blake2b(digest_size=20)
+    with path.open("rb") as fh:
+        while chunk := fh.read(_HASH_CHUNK):
+            h.update(chunk)
+    digest = f"{st.st_size}-{h.hexdigest()}"
+    memo.parent.mkdir(parents=True, exist_ok=True)
+    memo.write_text(digest, encoding="ascii")
+    return digest
+
+
+def _entry_key(
+    history_path: Path,
+    columns_path: Path | None,
+    cache_root: Path,
+    *,
+    grid_minutes: float,
+    fast: bool,
+    float_dtype: str,
+    float_storage: str,
+) -> str:
+    parts = {
+        "v": FORMAT_VERSION,
+        "history": _content_hash(history_path, cache_root),
+        "columns": _content_hash(columns_path, cache_root) if columns_path else None,
+        "grid_minutes": float(grid_minutes),
+        "fast": bool(fast),
+        "float_dtype": str(float_dtype) if fast else None,
+        "float_storage": float_storage,
+    }
+    return hashlib.blake2b(json.dumps(parts, sort_keys=True).encode(), digest_size=20).hexdigest()
+
+
+def _json_cell(x: Any) -> Any:
+    if x is None or (isinstance(x, float) and math.isnan(x)):
+        return None
+    if isinstance(x, (str, bool, int, float)):
+        return x
+    if isinstance(x, (np.integer, np.floating, np.bool_)):
+        return x.item()
+    raise TypeError(f"cannot cache value of type {type(x).__name__}")
+
+
+def _write_entry(entry: Path, df: pd.DataFrame) -> bool:
+    """Write ``df`` under ``entry`` atomically; ``False`` when the frame is not cacheable."""
+    if not isinstance(df.index, pd.DatetimeIndex) or not all(isinstance(c, str) for c in df.columns):
+        return False
+    if df.columns.has_duplicates:
+        return False
+    blocks: dict[str, list[str]] = {}
+    text: dict[str, list[Any]] = {}
+    dtypes: dict[str, str] = {}
+    for col in df.columns:
+        dtype = df[col].dtype
+        dtypes[col] = str(dtype)
+        if isinstance(dtype, np.dtype) and dtype.kind in "fiub":
+            blocks.setdefault(dtype.str, []).append(col)
+        else:
+            try:
+                text[col] = [_json_cell(x) for x in df[col].tolist()]
+            except TypeError:
+                return False
+    index = df.index
+    tmp = entry.parent / f".tmp-{uuid.uuid4().hex}"
+    tmp.mkdir(parents=True)
+    try:
+        utc = index.tz_convert("UTC").tz_localize(None) if index.tz is not None else index
+        np.save(tmp / "index.npy", utc.asi8)
+        files = []
+        for i, (dtype_str, cols) in enumerate(blocks.items()):
+            name = f"block_{i}.npy"
+            # Fortran order: the (n, k) block loads as pandas' (k, n) layout without a copy.
+            np.save(tmp / name, np.asfortranarray(df[cols].to_numpy(dtype=np.dtype(dtype_str))))
+            files.append({"file": name, "columns": cols})
+        if text:
+            (tmp / "text.json").write_text(json.dumps(text), encoding="utf-8")
+        meta = {
+            "format_version": FORMAT_VERSION,
+            "columns": list(df.columns),
+            "dtypes": dtypes,
+            "blocks": files,
+            "index_name": index.name,
+            "index_unit": index.unit,
+            "index_tz": None if index.tz is None else str(index.tz),
+        }
+        (tmp / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+        try:
+            os.replace(tmp, entry)
+        except OSError:
+            if not (entry / "meta.json").is_file():
+                raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return True
+
+
+def _read_entry(entry: Path) -> pd.DataFrame:
+    meta = json.loads((entry / "meta.json").read_text(encoding="utf-8"))
+    if meta.get("format_version") != FORMAT_VERSION:
+        raise ValueError("frame cache format changed")
+    ticks = np.load(entry / "index.npy")
+    index = pd.DatetimeIndex(ticks.view(f"datetime64[{meta['index_unit']}]"), name=meta["index_name"])
+    if meta["index_tz"] is not None:
+        index = index.tz_localize("UTC").tz_convert(meta["index_tz"])
+    parts = []
+    for block in meta["blocks"]:
+        # ``mmap_mode="c"``: pages are read lazily and writes stay private to the process.
+        values = np.load(entry / block["file"], mmap_mode="c")
+        parts.append(pd.DataFrame(values, columns=block["columns"], index=index, copy=False))
+    text_path = entry / "text.json"
+    if text_path.is_file():
+        text = json.loads(text_path.read_text(encoding="utf-8"))
+        parts.append(
+            pd.DataFrame(
+                {c: pd.Series(v, index=index, dtype=meta["dtypes"][c]) for c, v in text.items()},
+                index=index,
+            )
+        )
+    if not parts:
+        return pd.DataFrame(index=index)
+    df = parts[0] if len(parts) == 1 else pd.concat(parts, axis=1)
+    if list(df.columns) != meta["columns"]:
+        df = df[meta["columns"]]
+    return df
+
+
+def load_equipment_frame(
+    history_path: Path,
+    columns_path: Path | None = None,
+    *,
+    grid_minutes: float = 5,
+    cache_dir: Path | str | None = None,
+    fast: bool = False,
+    float_dtype: str = "float64",
+    float_storage: str | None = None,
+) -> pd.DataFrame:
+    """``load_equipment_csv`` through the on-disk frame cache (when enabled).
+
+    ``float_storage`` (default ``OPENFDD_FLOAT_STORAGE`` or ``float64``) is applied
+    with ``open_fdd.storage.apply_float_storage`` before caching. Cache problems (unwritable directory, corrupt entry, uncacheable column)
+    never fail the load; the CSV is parsed as usual.
+    """
+    root = frame_cache_dir(cache_dir)
+    storage = float_storage_policy(float_storage)
+    history_path = Path(history_path)
+    columns_path = Path(columns_path) if columns_path else None
+
+    def parse() -> pd.DataFrame:
+        df = load_equipment_csv(history_path, columns_path, fast=fast, float_dtype=float_dtype)
+        return apply_float_storage(df, storage)
+
+    if root is None:
+        return parse()
+    try:
+        key = _entry_key(
+            history_path,
+            columns_path,
+            root,
+            grid_minutes=grid_minutes,
+            fast=fast,
+            float_dtype=float_dtype,
+            float_storage=storage,
+        )
+    except OSError:
+        return parse()
+    entry = root / "frames" / key
+    if (entry / "meta.json").is_file():
+        try:
+            return _read_entry(entry)
+        except (OSError, ValueError, KeyError):
+            shutil.rmtree(entry, ignore_errors=True)
+    df = parse()
+    try:
+        _write_entry(entry, df)
+    except OSError:
+        pass
+    return df
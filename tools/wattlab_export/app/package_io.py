@@ -5,20 +5,25 @@ See docs/PACKAGE_SPEC.md (openfdd_package_v1).
 
 from __future__ import annotations
 
+import io
 import json
 import os
 import shutil
 import tempfile
+import threading
 import time
 import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Callable, Mapping
 
 import pandas as pd
 from pydantic import BaseModel, Field, field_validator
 
 from app.data_loader import discover_equipment, load_equipment_csv, validate_dataframe
+from app.frame_cache import load_equipment_frame
+from open_fdd.storage import apply_float_storage, float_storage_policy
 
 SCHEMA_VERSION = "openfdd_package_v1"
 SESSION_SCHEMA = "openfdd_session_v1"
@@ -424,10 +429,156 @@ def expand_nested_zips(
     return notes
 
 
+# Streaming mode writes only this much of each history_wide.csv (header + first
+# rows for discovery / validation); the full member is parsed from the zip.
+STREAM_PREVIEW_BYTES = 64 * 1024
+HISTORY_CSV = "history_wide.csv"
+
+
+class _ByteBudget:
+    """Shared cap on bytes actually decompressed while streaming CSV members."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = int(limit)
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def charge(self, n: int) -> None:
+        with self._lock:
+            self.used += n
+            if self.used > self.limit:
+                raise PackageError(
+                    f"Uncompressed size limit exceeded while reading "
+                    f"({self.limit // (1024 * 1024)} MB)"
+                )
+
+
+class _CappedReader(io.RawIOBase):
+    def __init__(self, raw: BinaryIO, budget: _ByteBudget, owner: zipfile.ZipFile) -> None:
+        self._raw = raw
+        self._budget = budget
+        self._owner = owner
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        n = self._raw.readinto(b)
+        self._budget.charge(n)
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._raw.close()
+            self._owner.close()
+        super().close()
+
+
+@dataclass(frozen=True)
+class ZipCsvSource:
+    """A ``history_wide.csv`` member read straight from the (possibly nested) zip bytes."""
+
+    archive: bytes
+    member: str
+    file_size: int
+
+    def open(self, budget: _ByteBudget) -> BinaryIO:
+        zf = zipfile.ZipFile(io.BytesIO(self.archive), "r")
+        try:
+            raw = zf.open(self.member, "r")
+        except Exception:
+            zf.close()
+            raise
+        return io.BufferedReader(_CappedReader(raw, budget, zf), 1024 * 1024)
+
+
+def _write_csv_preview(zf: zipfile.ZipFile, info: zipfile.ZipInfo, target: Path) -> None:
+    with zf.open(info, "r") as src:
+        head = src.read(STREAM_PREVIEW_BYTES)
+    if len(head) == STREAM_PREVIEW_BYTES and b"\n" in head:
+        head = head[: head.rindex(b"\n") + 1]
+    target.write_bytes(head)
+
+
+def _extract_streaming(
+    archive: bytes,
+    dest: Path,
+    workdir: Path,
+    caps: PackageCaps,
+    sources: dict[Path, ZipCsvSource],
+    *,
+    depth: int = 0,
+    max_depth: int = 4,
+) -> None:
+    """Extract everything except CSV bodies; nested zips are expanded from memory.
+
+    Same caps as ``extract_package_zip`` + ``expand_nested_zips``: every archive
+    goes through ``_inspect_zip`` and member paths through ``_safe_member_path``.
+    """
+    with zipfile.ZipFile(io.BytesIO(archive), "r") as zf:
+        _inspect_zip(zf, caps)
+        written = 0
+        nested: list[tuple[zipfile.ZipInfo, Path]] = []
+        for info in zf.infolist():
+            if _is_zip_dir(info):
+                continue
+            rel = _safe_member_path(info.filename)
+            if not rel.parts:
+                continue
+            target = dest / rel
+            _ensure_parent_dir(target, info.filename)
+            if rel.name == HISTORY_CSV:
+                _write_csv_preview(zf, info, target)
+                sources[target.resolve()] = ZipCsvSource(archive, info.filename, int(info.file_size))
+                continue
+            if rel.suffix.lower() == ".zip":
+                nested.append((info, target))
+                continue
+            with zf.open(info, "r") as src, target.open("wb") as out:
+                while True:
+                    chunk = src.read(1024 * 256)
+                    if not chunk:
+                        break
+                    written += len(chunk)
+                    if written > caps.max_uncompressed_bytes:
+                        raise PackageError(
+                            f"Uncompressed size limit exceeded during extract "
+                            f"({caps.max_uncompressed_mb} MB)"
+                        )
+                    out.write(chunk)
+        for info, target in sorted(nested, key=lambda x: str(x[1])):
+            try:
+                rel_name = target.relative_to(workdir).as_posix()
+            except ValueError:
+                rel_name = target.as_posix()
+            if depth >= max_depth:
+                raise PackageError(f"Nested zip depth exceeded ({max_depth}); `{rel_name}` remains unexpanded")
+            if info.file_size > caps.max_zip_bytes:
+                raise PackageError(f"Nested zip `{rel_name}` exceeds {caps.max_zip_mb} MB limit")
+            inner = zf.read(info)
+            sub = target.parent / target.stem
+            sub.mkdir(parents=True, exist_ok=True)
+            try:
+                _extract_streaming(inner, sub, workdir, caps, sources, depth=depth + 1, max_depth=max_depth)
+            except PackageError:
+                raise
+            except Exception as exc:
+                raise PackageError(f"Failed to expand nested zip `{rel_name}`: {exc}") from exc
+
+
 def extract_package_zip(
-    data: bytes, *, dest: Path | None = None, caps: PackageCaps | None = None
+    data: bytes,
+    *,
+    dest: Path | None = None,
+    caps: PackageCaps | None = None,
+    csv_sources: dict[Path, ZipCsvSource] | None = None,
 ) -> Path:
-    """Extract zip bytes into a fresh temp dir. Returns workdir root."""
+    """Extract zip bytes into a fresh temp dir. Returns workdir root.
+
+    With ``csv_sources`` (streaming mode) each ``history_wide.csv`` is written as
+    a short preview and recorded in ``csv_sources``; pass the mapping to
+    ``load_package_from_dir`` to parse the members directly from ``data``.
+    """
     caps = caps or effective_package_caps()
     if len(data) > caps.max_zip_bytes:
         raise PackageError(f"Zip exceeds {caps.max_zip_mb} MB compressed limit")
@@ -436,6 +587,9 @@ def extract_package_zip(
     try:
         from io import BytesIO
 
+        if csv_sources is not None:
+            _extract_streaming(data, workdir, workdir, caps, csv_sources)
+            return workdir
         with zipfile.ZipFile(BytesIO(data), "r") as zf:
             _inspect_zip(zf, caps)
             written = 0
@@ -486,9 +640,33 @@ def extract_package_zip(
 
 
 def load_package_from_dir(
-    building_root: Path, *, workdir: Path | None = None, caps: PackageCaps | None = None
+    building_root: Path,
+    *,
+    workdir: Path | None = None,
+    caps: PackageCaps | None = None,
+    cache_dir: Path | None = None,
+    workers: int | None = None,
+    progress: Callable[[int, int, str], None] | None = None,
+    csv_sources: Mapping[Path, ZipCsvSource] | None = None,
+    float_storage: str | None = None,
 ) -> PackageLoadResult:
-    """Load a validated package directory (already extracted). Uncached."""
+    """Load a validated package directory (already extracted).
+
+    Equipment frames go through ``app.frame_cache`` when ``cache_dir`` (or
+    ``OPENFDD_FRAME_CACHE_DIR``) is set; otherwise every CSV is parsed.
+
+    Equipment is validated and loaded on a thread pool of ``workers``
+    (default ``OPENFDD_LOAD_WORKERS`` or ``min(8, cpu count)``). Errors match a
+    serial load: the first validation failure in equipment-id order wins, then
+    the first load failure. ``progress(done, total, equipment_id)`` is called
+    from the calling thread as each equipment finishes.
+
+    ``csv_sources`` (from a streaming ``extract_package_zip``) maps preview CSV
+    paths to zip members; those are parsed from the zip, bypassing the frame cache.
+
+    ``float_storage="float32"`` (default ``OPENFDD_FLOAT_STORAGE``) keeps analog
+    columns as float32 (``open_fdd.storage``); rule runs widen them again.
+    """
     manifest = load_manifest(building_root)
     session_cfg = load_session_config(building_root)
     warnings: list[str] = []
@@ -508,30 +686,20 @@ def load_package_from_dir(
     if len(ids) != len(set(ids)):
         raise PackageError("Duplicate equipment folder names are not allowed")
 
-    for eq in equipment:
-        issues = _validate_equipment_csv(Path(eq["history_path"]))
-        if issues:
-            raise PackageError("; ".join(issues))
-
+    budget = _ByteBudget(caps.max_uncompressed_bytes)
+    streamed = _StreamedCsvs(csv_sources or {}, budget)
+    storage = float_storage_policy(float_storage)
     frames: dict[str, pd.DataFrame] = {}
-    for eq in equipment:
-        try:
-            df = load_equipment_csv(eq["history_path"], eq.get("columns_path"))
-        except Exception as exc:
-            raise PackageError(
-                f"{eq['equipment_id']}: failed to load history_wide.csv ({exc})"
-            ) from exc
-        df.attrs["poll_seconds"] = float(manifest.grid_minutes) * 60.0
-        df.attrs["equipment_id"] = eq["equipment_id"]
-        df.attrs["building_id"] = manifest.building_id
-        df.attrs["columns_path"] = str(eq["columns_path"]) if eq.get("columns_path") else None
-        for issue in validate_dataframe(df):
-            warnings.append(f"{eq['equipment_id']}: {issue}")
-        if df.empty or not isinstance(df.index, pd.DatetimeIndex):
-            raise PackageError(
-                f"{eq['equipment_id']}: no usable UTC datetime index after load "
-                "(need parseable timestamp_utc rows)"
-            )
+    for eq, df, load_warnings in _load_equipment_frames(
+        equipment,
+        manifest,
+        cache_dir=cache_dir,
+        workers=workers,
+        progress=progress,
+        streamed=streamed,
+        float_storage=storage,
+    ):
+        warnings.extend(load_warnings)
         frames[eq["equipment_id"]] = df
 
     from app.data_contract import audit_package_dir
@@ -539,7 +707,7 @@ def load_package_from_dir(
     contract_warnings, package_health = audit_package_dir(building_root, frames, equipment)
     warnings.extend(contract_warnings)
 
-    weather = _load_weather(building_root)
+    weather = _load_weather(building_root, streamed)
     column_map = None
     column_map_issues: list[str] = []
     root_map = None
@@ -568,7 +736,7 @@ def load_package_from_dir(
         if column_map_issues:
             warnings.extend(column_map_issues[:20])
 
-    unc_bytes = directory_size_bytes(building_root)
+    unc_bytes = directory_size_bytes(building_root) + streamed.unextracted_bytes(building_root)
     report = {
         "building_id": manifest.building_id,
         "schema_version": manifest.schema_version,
@@ -590,6 +758,7 @@ def load_package_from_dir(
         "package_health_grade": package_health.grade,
         "package_health_summary": list(package_health.summary_lines),
         "row_counts": {k: int(len(v)) for k, v in frames.items()},
+        "float_storage": storage,
         "uncompressed_bytes": unc_bytes,
         "uncompressed_mb": bytes_as_mb(unc_bytes),
         "max_zip_mb": caps.max_zip_mb,
@@ -619,6 +788,141 @@ def load_package_from_dir(
     )
 
 
+class _StreamedCsvs:
+    """History CSVs that live in the uploaded zip rather than on disk."""
+
+    def __init__(self, sources: Mapping[Path, ZipCsvSource], budget: _ByteBudget) -> None:
+        self.sources = dict(sources)
+        self.budget = budget
+
+    def get(self, path: Path) -> ZipCsvSource | None:
+        if not self.sources:
+            return None
+        return self.sources.get(Path(path).resolve())
+
+    def load(self, source: ZipCsvSource, columns_path: Path | None) -> pd.DataFrame:
+        with source.open(self.budget) as fh:
+            return load_equipment_csv(fh, columns_path)
+
+    def unextracted_bytes(self, root: Path) -> int:
+        root = root.resolve()
+        total = 0
+        for path, src in self.sources.items():
+            if root == path or root in path.parents:
+                total += src.file_size - (path.stat().st_size if path.is_file() else 0)
+        return total
+
+
+def _load_one_equipment(
+    eq: dict[str, Any],
+    manifest: PackageManifest,
+    cache_dir: Path | None,
+    streamed: _StreamedCsvs,
+    float_storage: str,
+) -> tuple[pd.DataFrame | None, list[str], PackageError | None]:
+    """``(frame, warnings, load error)`` for one already-validated equipment folder."""
+    try:
+        source = streamed.get(eq["history_path"])
+        if source is not None:
+            df = apply_float_storage(streamed.load(source, eq.get("columns_path")), float_storage)
+        else:
+            df = load_equipment_frame(
+                eq["history_path"],
+                eq.get("columns_path"),
+                grid_minutes=manifest.grid_minutes,
+                cache_dir=cache_dir,
+                float_storage=float_storage,
+            )
+    except PackageError as exc:
+        return None, [], exc
+    except Exception as exc:
+        err = PackageError(f"{eq['equipment_id']}: failed to load history_wide.csv ({exc})")
+        err.__cause__ = exc
+        return None, [], err
+    df.attrs["poll_seconds"] = float(manifest.grid_minutes) * 60.0
+    df.attrs["equipment_id"] = eq["equipment_id"]
+    df.attrs["building_id"] = manifest.building_id
+    df.attrs["columns_path"] = str(eq["columns_path"]) if eq.get("columns_path") else None
+    warnings = [f"{eq['equipment_id']}: {issue}" for issue in validate_dataframe(df)]
+    if df.empty or not isinstance(df.index, pd.DatetimeIndex):
+        err = PackageError(
+            f"{eq['equipment_id']}: no usable UTC datetime index after load "
+            "(need parseable timestamp_utc rows)"
+        )
+        return None, [], err
+    return df, warnings, None
+
+
+def _load_workers(workers: int | None, n_jobs: int) -> int:
+    if workers is None:
+        workers = _env_positive_int("OPENFDD_LOAD_WORKERS", min(8, os.cpu_count() or 1))
+    return max(1, min(int(workers), n_jobs))
+
+
+def _load_equipment_frames(
+    equipment: list[dict[str, Any]],
+    manifest: PackageManifest,
+    *,
+    cache_dir: Path | None,
+    workers: int | None,
+    progress: Callable[[int, int, str], None] | None,
+    streamed: _StreamedCsvs,
+    float_storage: str,
+) -> list[tuple[dict[str, Any], pd.DataFrame, list[str]]]:
+    """Validate every equipment folder, then load them, in ``equipment`` order.
+
+    Same errors as a serial load: the first folder (in order) whose header check
+    fails wins before any history is parsed, then the first load error in order;
+    loads not yet started when it is known are cancelled.
+    """
+    total = len(equipment)
+    n_workers = _load_workers(workers, total)
+    paths = [Path(eq["history_path"]) for eq in equipment]
+    if n_workers == 1:
+        for path in paths:
+            issues = _validate_equipment_csv(path)
+            if issues:
+                raise PackageError("; ".join(issues))
+        loaded = []
+        for i, eq in enumerate(equipment):
+            df, warns, err = _load_one_equipment(eq, manifest, cache_dir, streamed, float_storage)
+            if err is not None:
+                raise err
+            loaded.append((eq, df, warns))
+            if progress is not None:
+                progress(i + 1, total, eq["equipment_id"])
+        return loaded
+
+    pool = ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="openfdd-load")
+    try:
+        # Header checks are cheap reads; map() yields them in folder order.
+        for issues in pool.map(_validate_equipment_csv, paths):
+            if issues:
+                raise PackageError("; ".join(issues))
+        futures = [
+            pool.submit(_load_one_equipment, eq, manifest, cache_dir, streamed, float_storage) for eq in equipment
+        ]
+        owner = {f: eq["equipment_id"] for f, eq in zip(futures, equipment)}
+        pending = set(futures)
+        done_count = 0
+        loaded = []
+        for eq, fut in zip(equipment, futures):
+            # Report completions as they happen; consume results in id order.
+            while fut in pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for f in finished:
+                    done_count += 1
+                    if progress is not None:
+                        progress(done_count, total, owner[f])
+            df, warns, err = fut.result()
+            if err is not None:
+                raise err
+            loaded.append((eq, df, warns))
+        return loaded
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
 def _read_manifest_dict(path: Path) -> dict[str, Any] | None:
     if not path.is_file():
         return None
@@ -826,13 +1130,17 @@ def load_package_column_map(building_root: Path) -> dict[str, Any] | None:
         raise PackageError(f"column_map.json invalid: {exc}") from exc
 
 
-def _load_weather(building_root: Path) -> pd.DataFrame | None:
+def _load_weather(building_root: Path, streamed: _StreamedCsvs | None = None) -> pd.DataFrame | None:
     hist = building_root / "weather" / "history_wide.csv"
     if not hist.is_file():
         return None
     cols = building_root / "weather" / "columns.csv"
     try:
-        df = load_equipment_csv(hist, cols if cols.is_file() else None)
+        source = streamed.get(hist) if streamed is not None else None
+        if source is not None:
+            df = streamed.load(source, cols if cols.is_file() else None)
+        else:
+            df = load_equipment_csv(hist, cols if cols.is_file() else None)
         from app.weather_psychrometrics import enrich_weather_frame
 
         return enrich_weather_frame(df)
@@ -866,21 +1174,28 @@ def _validate_equipment_csv(path: Path) -> list[str]:
 
 
 
-def load_package_zip(data: bytes, *, caps: PackageCaps | None = None) -> PackageLoadResult:
+def load_package_zip(
+    data: bytes, *, caps: PackageCaps | None = None, stream: bool = False
+) -> PackageLoadResult:
     """Extract + validate + load. Caller owns wipe via result.workdir.
 
     Pass ``caps=effective_package_caps(for_browser_upload=True)`` for React SPA
     uploader bytes (500 MB). Agent/CLI/path use default 2048 MB caps.
+
+    ``stream=True`` parses each ``history_wide.csv`` directly from ``data``; only
+    metadata files and short CSV previews are written to the workdir.
     """
     sweep_old_temp_dirs()
     caps = caps or effective_package_caps()
-    workdir = extract_package_zip(data, caps=caps)
+    csv_sources: dict[Path, ZipCsvSource] | None = {} if stream else None
+    workdir = extract_package_zip(data, caps=caps, csv_sources=csv_sources)
     try:
         building_root = resolve_building_root(workdir)
-        result = load_package_from_dir(building_root, workdir=workdir, caps=caps)
+        result = load_package_from_dir(building_root, workdir=workdir, caps=caps, csv_sources=csv_sources)
         result.report["source"] = "zip"
         result.report["zip_bytes"] = len(data)
         result.report["zip_mb"] = bytes_as_mb(len(data))
+        result.report["streamed_csv_count"] = len(csv_sources or {})
         return result
     except Exception:
         wipe_workdir(workdir)
@@ -5,10 +5,12 @@ Canonical implementations: PyPI ``open_fdd.rules``. This package is a thin
 """
 
 from open_fdd.rules.base import RuleResult
+from open_fdd.rules.intervals import IntervalMask
 from open_fdd.rules.cookbook_catalog import RULES as CANONICAL_RULES
 from open_fdd.rules.cookbook_catalog import RULES_BY_ID as CANONICAL_RULES_BY_ID
 from open_fdd.rules.cookbook_catalog import catalog
 from open_fdd.rules.runner import infer_equipment_kind, run_all_cookbook_rules, run_batch, run_cookbook_rule
+from open_fdd.rules.incremental import ChunkedRun, IncrementalState, run_chunked, run_incremental
 
 from app.rules.custom_registry import active_rules, active_rules_by_id, custom_rules
 
@@ -67,6 +69,7 @@ __all__ = [
     "CANONICAL_RULES_BY_ID",
     "CANONICAL_RULE_COUNT",
     "RuleResult",
+    "IntervalMask",
     "catalog",
     "custom_rules",
     "active_rules",
@@ -76,4 +79,8 @@ __all__ = [
     "run_all_cookbook_rules",
     "run_batch",
     "run_cookbook_rule",
+    "ChunkedRun",
+    "IncrementalState",
+    "run_chunked",
+    "run_incremental",
 ]
@@ -0,0 +1,4 @@
+"""Shim: rebind to open_fdd.rules.incremental (PyPI open-fdd)."""
+import open_fdd.rules.incremental as _impl
+import sys as _sys
+_sys.modules[__name__] = _impl
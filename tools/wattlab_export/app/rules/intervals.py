@@ -0,0 +1,4 @@
+"""Shim: rebind to open_fdd.rules.intervals (PyPI open-fdd)."""
+import open_fdd.rules.intervals as _impl
+import sys as _sys
+_sys.modules[__name__] = _impl
@@ -17,19 +17,21 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal, Mapping
 
+import numpy as np
 import pandas as pd
 
 from app.column_map_json import POINT_DISPLAY, canonicalize_point
 from app.data_loader import infer_poll_seconds
-from app.daytypes import DAY_TYPES, day_type_series
+from app.daytypes import DAY_TYPES, day_type_codes
 from app.occupancy import OccupancySchedule, occupied_mask
 from app.rcx_plots import hydronic_operating_mask, operating_mask
-from app.reports import debug_frame
 from app.role_map import apply_role_map
 from app.rules.base import RuleResult
+from app.rules.intervals import IntervalMask
 from app.runtime_intervals import interval_durations
 from app.site_model import resolve_equipment_type
 from app.units import resolve_role_unit
+from open_fdd.storage import overlay_frame
 
 # role_map meta keys that are not timeseries roles
 _META_KEYS = {"chw_pump_equipment", "notes", "equipment_type", "plant_group", "cooling_technology"}
@@ -402,35 +404,60 @@ def critical_sensor_roles(role_map: dict, frames: dict[str, pd.DataFrame] | None
     return present
 
 
-def _diurnal_stat_row(
-    *,
-    eq_id: str,
-    et: str,
-    role: str,
-    source: str,
-    day_type: str,
-    fan_state: str,
-    hour: int,
-    values: pd.Series,
-) -> dict[str, Any] | None:
-    num = pd.to_numeric(values, errors="coerce").dropna()
-    if num.empty:
-        return None
-    return {
-        "equipment_id": eq_id,
-        "equipment_type": et,
-        "role": role,
-        "source": source,
-        "day_type": day_type,
-        "fan_state": fan_state,
-        "hour": int(hour),
-        "n": int(len(num)),
-        "mean": round(float(num.mean()), 3),
-        "std": round(float(num.std(ddof=0)), 3) if len(num) > 1 else 0.0,
-        "min": round(float(num.min()), 3),
-        "p50": round(float(num.quantile(0.5)), 3),
-        "max": round(float(num.max()), 3),
-    }
+DIURNAL_FAN_STATES = ("all", "on", "off")
+_DIURNAL_COLUMNS = [
+    "equipment_id",
+    "equipment_type",
+    "role",
+    "source",
+    "day_type",
+    "fan_state",
+    "hour",
+    "n",
+    "mean",
+    "std",
+    "min",
+    "p50",
+    "max",
+]
+
+
+def _diurnal_stats(
+    values: list[np.ndarray],
+    day_codes: np.ndarray,
+    hours: np.ndarray,
+    fan_codes: np.ndarray | None,
+) -> pd.DataFrame:
+    """One groupby over every (role, day_type, fan_state, hour) cell of one equipment.
+
+    ``values`` holds one float array per role, aligned to ``day_codes`` / ``hours``.
+    Each sample lands in its ``all`` cell and, with ``fan_codes``, in its ``on`` or
+    ``off`` cell. Cells are int keys ``((role * 3 + day) * 3 + fan) * 24 + hour``;
+    the result is indexed by key and only has non-empty cells.
+    """
+    base = day_codes.astype(np.int64) * 3 * 24 + hours
+    keys: list[np.ndarray] = []
+    vals: list[np.ndarray] = []
+    for r, arr in enumerate(values):
+        ok = ~np.isnan(arr)
+        role_base = base[ok] + r * 9 * 24
+        keys.append(role_base)
+        vals.append(arr[ok])
+        if fan_codes is not None:
+            keys.append(role_base + fan_codes[ok] * 24)
+            vals.append(arr[ok])
+    stacked = pd.Series(np.concatenate(vals), index=np.concatenate(keys))
+    cells = stacked.groupby(level=0)
+    return pd.DataFrame(
+        {
+            "n": cells.count(),
+            "mean": cells.mean(),
+            "std": cells.std(ddof=0),
+            "min": cells.min(),
+            "p50": cells.median(),
+            "max": cells.max(),
+        }
+    )
 
 
 def diurnal_profiles(
@@ -453,67 +480,52 @@ def diurnal_profiles(
         if not isinstance(mapped.index, pd.DatetimeIndex) or mapped.empty:
             continue
         role_series = _role_series_for_frame(mapped, _mapped_roles(role_map, eq_id))
-        crit_roles = {r: role_series[r] for r in role_series if r in critical}
+        crit_roles = [(r, *role_series[r]) for r in role_series if r in critical]
         if not crit_roles:
             continue
-        aug = mapped.copy()
-        for role, (s, _src) in role_series.items():
-            if role not in aug.columns:
-                aug[role] = s
+        aug = overlay_frame(
+            mapped, {role: s for role, (s, _src) in role_series.items() if role not in mapped.columns}
+        )
         mask, _proof = operating_mask(aug)
         if mask is None:
             mask, _proof = hydronic_operating_mask(aug)
-        day_labels = day_type_series(mapped.index)
-        hours = pd.Series(mapped.index.hour, index=mapped.index)
-        for role, (series, source) in crit_roles.items():
-            num = pd.to_numeric(series, errors="coerce")
-            for day_type in DAY_TYPES:
-                day_mask = day_labels.eq(day_type)
-                if not bool(day_mask.any()):
-                    continue
-                # fan_state slices
-                slices: list[tuple[str, pd.Series]] = [("all", day_mask)]
-                if mask is not None:
-                    on = mask.reindex(mapped.index).fillna(False).astype(bool)
-                    slices.append(("on", day_mask & on))
-                    slices.append(("off", day_mask & ~on))
-                for fan_state, slice_mask in slices:
-                    if not bool(slice_mask.any()):
-                        continue
-                    sub = num.where(slice_mask)
-                    for hour in range(24):
-                        hour_vals = sub.where(hours.eq(hour))
-                        row = _diurnal_stat_row(
-                            eq_id=eq_id,
-                            et=et,
-                            role=role,
-                            source=source,
-                            day_type=day_type,
-                            fan_state=fan_state,
-                            hour=hour,
-                            values=hour_vals,
-                        )
-                        if row is not None:
-                            rows.append(row)
-    cols = [
-        "equipment_id",
-        "equipment_type",
-        "role",
-        "source",
-        "day_type",
-        "fan_state",
-        "hour",
-        "n",
-        "mean",
-        "std",
-        "min",
-        "p50",
-        "max",
-    ]
+        fan_codes = None
+        if mask is not None:
+            on = mask.reindex(mapped.index).fillna(False).astype(bool).to_numpy()
+            fan_codes = np.where(on, 1, 2)
+        valid = ~mapped.index.isna()
+        hours = np.asarray(mapped.index.hour.fillna(0), dtype=np.int64)
+        values = []
+        for _role, series, _source in crit_roles:
+            arr = pd.to_numeric(series, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+            values.append(np.where(valid, arr, np.nan))
+        stats = _diurnal_stats(values, day_type_codes(mapped.index), hours, fan_codes)
+        for key, n, mean, std, lo, p50, hi in stats.itertuples():
+            cell, hour = divmod(int(key), 24)
+            cell, fan = divmod(cell, 3)
+            r, day = divmod(cell, 3)
+            role, _series, source = crit_roles[r]
+            rows.append(
+                {
+                    "equipment_id": eq_id,
+                    "equipment_type": et,
+                    "role": role,
+                    "source": source,
+                    "day_type": DAY_TYPES[day],
+                    "fan_state": DIURNAL_FAN_STATES[fan],
+                    "hour": hour,
+                    "n": int(n),
+                    "mean": round(float(mean), 3),
+                    "std": round(float(std), 3) if n > 1 else 0.0,
+                    "min": round(float(lo), 3),
+                    "p50": round(float(p50), 3),
+                    "max": round(float(hi), 3),
+                }
+            )
     if not rows:
-        return pd.DataFrame(columns=cols)
+        return pd.DataFrame(columns=_DIURNAL_COLUMNS)
     return (
-        pd.DataFrame(rows, columns=cols)
+        pd.DataFrame(rows, columns=_DIURNAL_COLUMNS)
         .sort_values(["equipment_id", "role", "day_type", "fan_state", "hour"])
         .reset_index(drop=True)
     )
@@ -592,6 +604,17 @@ def _should_write_evidence(
     return False
 
 
+def _mask_column(mask: pd.Series | IntervalMask | None, index: pd.Index) -> pd.Series:
+    """0/1-valued evidence column aligned to ``index``."""
+    if mask is None:
+        return pd.Series(0, index=index)
+    if isinstance(mask, IntervalMask):
+        if mask.index is index or mask.index.equals(index):
+            return pd.Series(mask.to_numpy(), index=index)
+        mask = mask.to_series()
+    return mask.reindex(index).fillna(0)
+
+
 def _compact_evidence_frame(
     result: RuleResult,
     *,
@@ -599,10 +622,15 @@ def _compact_evidence_frame(
     role_map: dict | None = None,
 ) -> pd.DataFrame | None:
     """Build compact per-rule evidence (fault masks + telemetry reference)."""
-    dbg = debug_frame(result)
+    dbg = result.debug
     index: pd.Index | None = None
-    raw = result.raw_fault
-    confirmed = result.confirmed_fault
+    # Compact results hand over interval masks; never densify them twice.
+    if result.is_compact:
+        raw = result.fault_mask("raw_fault")
+        confirmed = result.fault_mask("confirmed_fault")
+    else:
+        raw = result.raw_fault
+        confirmed = result.confirmed_fault
     if dbg is not None and not dbg.empty:
         index = dbg.index
         if raw is None and "raw_fault" in dbg.columns:
@@ -622,14 +650,8 @@ def _compact_evidence_frame(
     if index is None:
         return None
 
-    if raw is None:
-        raw = pd.Series(0, index=index)
-    else:
-        raw = raw.reindex(index).fillna(0)
-    if confirmed is None:
-        confirmed = pd.Series(0, index=index)
-    else:
-        confirmed = confirmed.reindex(index).fillna(0)
+    raw = _mask_column(raw, index)
+    confirmed = _mask_column(confirmed, index)
 
     evidence_cols: list[str] = []
     if result.plot_series: